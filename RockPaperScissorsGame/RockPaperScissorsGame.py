@@ -3,18 +3,32 @@ from tkinter import messagebox
 import random
 from PIL import Image, ImageTk
 import os
+import sys
+import math
+import colorsys
+from rules import load_variant
+from opponent import make_opponent
+from game_config import GameConfig
 
 class RockPaperScissorsGame:
-    def __init__(self, root):
+    def __init__(self, root, variant=None):
         self.root = root
-        self.root.title("Rock Paper Scissors Game")
-        self.root.geometry("800x800")
+        self.rules = load_variant(variant or GameConfig.VARIANT)
+        if len(self.rules) > GameConfig.MAX_GUI_MOVES:
+            raise ValueError(f"{self.rules.title} has {len(self.rules)} moves, the window "
+                             f"fits at most {GameConfig.MAX_GUI_MOVES}")
+        self.root.title(f"{self.rules.title} Game")
+        # At least 800x800; Tk grows the window to fit a taller move grid
+        self.root.minsize(800, 800)
         self.root.configure(bg="#f0f0f0")
         
         # Game variables
         self.player_score = 0
         self.computer_score = 0
-        self.choices = ["rock", "paper", "scissors"]
+        self.choices = list(self.rules.moves)
+        self.opponent = make_opponent(GameConfig.OPPONENT, self.rules,
+                                      order=GameConfig.OPPONENT_ORDER,
+                                      epsilon=GameConfig.OPPONENT_EPSILON)
         self.game_in_progress = False
         self.countdown_timer = None
         self.animation_timer = None
@@ -28,15 +42,28 @@ class RockPaperScissorsGame:
         # Setup GUI
         self.setup_gui()
         
+    def grid_columns(self):
+        """Buttons per row of the move grid"""
+        count = len(self.choices)
+        if count <= GameConfig.MAX_ROW_BUTTONS:
+            return count
+        return math.ceil(math.sqrt(count))
+    
+    def image_size(self):
+        """Side of the move images, shrinking as the grid gets wider"""
+        size = GameConfig.GRID_WIDTH // self.grid_columns() - 20
+        return max(GameConfig.MIN_IMAGE_SIZE, min(GameConfig.IMAGE_SIZE, size))
+    
     def create_images(self):
-        """Create or load images for rock, paper, scissors"""
+        """Create or load images for the moves of the active variant"""
+        size = self.image_size()
         try:
             # Try to load actual images if they exist
             for choice in self.choices:
-                img_path = f"images/{choice}.png"
+                img_path = os.path.join(GameConfig.IMAGE_DIR, f"{choice}.png")
                 if os.path.exists(img_path):
                     img = Image.open(img_path)
-                    img = img.resize((100, 100), Image.Resampling.LANCZOS)
+                    img = img.resize((size, size), Image.Resampling.LANCZOS)
                     self.images[choice] = ImageTk.PhotoImage(img)
                 else:
                     # Create placeholder images
@@ -48,8 +75,14 @@ class RockPaperScissorsGame:
     
     def create_placeholder_image(self, choice):
         """Create placeholder images if actual images don't exist"""
-        colors = {'rock': '#8B4513', 'paper': '#FFFFFF', 'scissors': '#C0C0C0'}
-        img = Image.new('RGB', (100, 100), color=colors.get(choice, 'lightgray'))
+        color = GameConfig.PLACEHOLDER_COLORS.get(choice)
+        if color is None:
+            # Spread the other moves around the color wheel
+            hue = self.choices.index(choice) / len(self.choices)
+            red, green, blue = colorsys.hsv_to_rgb(hue, 0.45, 0.95)
+            color = (int(red * 255), int(green * 255), int(blue * 255))
+        size = self.image_size()
+        img = Image.new('RGB', (size, size), color=color)
         return ImageTk.PhotoImage(img)
     
     def setup_gui(self):
@@ -57,7 +90,7 @@ class RockPaperScissorsGame:
         # Title
         title_label = tk.Label(
             self.root,
-            text="🎮 Rock Paper Scissors Game 🎮",
+            text=f"🎮 {self.rules.title} Game 🎮",
             font=("Arial", 20, "bold"),
             bg="#f0f0f0",
             fg="#333"
@@ -93,6 +126,7 @@ class RockPaperScissorsGame:
         button_frame.pack(pady=10)
         
         self.choice_buttons = {}
+        columns = self.grid_columns()
         for i, choice in enumerate(self.choices):
             btn = tk.Button(
                 button_frame,
@@ -107,7 +141,7 @@ class RockPaperScissorsGame:
                 padx=10,
                 pady=5
             )
-            btn.grid(row=0, column=i, padx=10)
+            btn.grid(row=i // columns, column=i % columns, padx=10)
             self.choice_buttons[choice] = btn
         
         # Countdown display
@@ -144,7 +178,7 @@ class RockPaperScissorsGame:
         
         self.player_choice_label = tk.Label(
             player_choice_frame,
-            image=self.images["rock"],  # Default image
+            image=self.images[self.choices[0]],  # Default image
             bg="#f0f0f0"
         )
         self.player_choice_label.pack(pady=5)
@@ -179,7 +213,7 @@ class RockPaperScissorsGame:
         
         self.computer_choice_label = tk.Label(
             computer_choice_frame,
-            image=self.images["rock"],  # Default image
+            image=self.images[self.choices[0]],  # Default image
             bg="#f0f0f0"
         )
         self.computer_choice_label.pack(pady=5)
@@ -251,8 +285,9 @@ class RockPaperScissorsGame:
         # Store player choice for later use
         self.current_player_choice = choice
         
-        # Determine the final computer choice now (but don't show it yet)
-        self.final_computer_choice = random.choice(self.choices)
+        # Determine the final computer choice now (but don't show it yet);
+        # the opponent only knows the earlier rounds, never this choice
+        self.final_computer_choice = self.rules.name(self.opponent.choose())
         
         # Show player's choice immediately
         self.player_choice_label.config(image=self.images[choice])
@@ -309,14 +344,18 @@ class RockPaperScissorsGame:
         
         # Determine winner
         result = self.determine_winner(self.current_player_choice, self.final_computer_choice)
+        player_move = self.rules.code(self.current_player_choice)
+        computer_move = self.rules.code(self.final_computer_choice)
+        explanation = self.rules.explain(player_move, computer_move)
+        self.opponent.observe(player_move, computer_move)
         
         # Update score and show result
         if result == "player":
             self.player_score += 1
-            self.result_label.config(text="🎉 You Win! 🎉", fg="green")
+            self.result_label.config(text=f"🎉 You Win! 🎉\n{explanation}", fg="green")
         elif result == "computer":
             self.computer_score += 1
-            self.result_label.config(text="😔 Computer Wins! 😔", fg="red")
+            self.result_label.config(text=f"😔 Computer Wins! 😔\n{explanation}", fg="red")
         else:
             self.result_label.config(text="🤝 It's a Tie! 🤝", fg="orange")
         
@@ -330,10 +369,10 @@ class RockPaperScissorsGame:
         self.game_in_progress = False
         
         # Check for game end (optional - first to 5 wins)
-        if self.player_score >= 5:
+        if self.player_score >= GameConfig.WINNING_SCORE:
             messagebox.showinfo("Game Over", "🏆 Congratulations! You won the game! 🏆")
             self.reset_game()
-        elif self.computer_score >= 5:
+        elif self.computer_score >= GameConfig.WINNING_SCORE:
             messagebox.showinfo("Game Over", "🤖 Computer won the game! Better luck next time! 🤖")
             self.reset_game()
     
@@ -345,17 +384,8 @@ class RockPaperScissorsGame:
         self.root.after(200, lambda: self.computer_choice_label.config(bg=original_bg))
     
     def determine_winner(self, player_choice, computer_choice):
-        """Determine the winner of the round"""
-        if player_choice == computer_choice:
-            return "tie"
-        elif (
-            (player_choice == "rock" and computer_choice == "scissors") or
-            (player_choice == "paper" and computer_choice == "rock") or
-            (player_choice == "scissors" and computer_choice == "paper")
-        ):
-            return "player"
-        else:
-            return "computer"
+        """Determine the winner of the round ("tie", "player" or "computer")"""
+        return self.rules.winner(player_choice, computer_choice)
     
     def reset_game(self):
         """Reset the game to initial state"""
@@ -383,10 +413,10 @@ class RockPaperScissorsGame:
             text=f"Player: {self.player_score}  |  Computer: {self.computer_score}"
         )
         
-        self.player_choice_label.config(image=self.images["rock"])
+        self.player_choice_label.config(image=self.images[self.choices[0]])
         self.player_choice_text.config(text="")
         
-        self.computer_choice_label.config(image=self.images["rock"])
+        self.computer_choice_label.config(image=self.images[self.choices[0]])
         self.computer_choice_text.config(text="")
         
         self.result_label.config(
@@ -395,9 +425,13 @@ class RockPaperScissorsGame:
         )
 
 def main():
-    """Main function to run the game"""
+    """Main function to run the game; an optional argument picks the variant"""
     root = tk.Tk()
-    game = RockPaperScissorsGame(root)
+    try:
+        game = RockPaperScissorsGame(root, sys.argv[1] if len(sys.argv) > 1 else None)
+    except ValueError as e:
+        root.destroy()
+        sys.exit(f"Error: {e}")
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""
+Game configuration for the Rock Paper Scissors game
+"""
+
+import os
+
+class GameConfig:
+    """Configuration constants for the game"""
+
+    # Game Settings
+    VARIANT = "classic"  # A file in variants/ (classic, rpsls, rps7, rps101) or a .json path
+    MAX_GUI_MOVES = 12   # Larger variants (rps101) are for tournament.py: no screen fits their grid
+    WINNING_SCORE = 5    # First to this many wins takes the game
+
+    # Computer Opponent
+    OPPONENT = "adaptive"   # "random" or "adaptive" (learns the player's patterns)
+    OPPONENT_ORDER = 2      # Past player moves the adaptive opponent looks at
+    OPPONENT_EPSILON = 0.1  # Share of purely random adaptive moves
+
+    # Images
+    IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+    IMAGE_SIZE = 100      # Largest move image, used while the grid fits one row
+    MIN_IMAGE_SIZE = 32
+    GRID_WIDTH = 600      # Pixels the move button grid may take up
+    MAX_ROW_BUTTONS = 7   # Longer move lists wrap into a square-ish grid
+    PLACEHOLDER_COLORS = {'rock': '#8B4513', 'paper': '#FFFFFF', 'scissors': '#C0C0C0'}
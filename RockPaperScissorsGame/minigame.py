@@ -10,23 +10,20 @@ Minigame:
 
 import random
 
+from rules import CLASSIC
 
-choices = ["rock", "paper", "scissors"]
-choices_dict = {
-    "rock": "scissors",
-    "paper": "rock",
-    "scissors": "paper"
-}
+
+choices = list(CLASSIC.moves)
 
 player_choice = input("Enter your choice (rock, paper, scissors): ").lower()
 print("Player's choice:", player_choice)
 random_choice = random.choice(choices)
 print("Computer's choice:", random_choice)
 
-if player_choice == random_choice:
+result = CLASSIC.winner(player_choice, random_choice)
+if result == "tie":
     print("It's a tie!")
-elif choices_dict[player_choice] == random_choice:
+elif result == "player":
     print("Player wins!")
 else:
     print("Computer wins!")
-
@@ -0,0 +1,254 @@
+"""Computer opponents for Rock Paper Scissors
+
+An opponent picks its move before seeing the player's and learns from each
+finished round:
+
+    opponent = make_opponent("adaptive", rules)
+    computer = opponent.choose()
+    ...
+    opponent.observe(player, computer)
+
+Moves are the int codes of rules.Rules. AdaptiveOpponent predicts the
+player's next move from n-gram counts of the player's recent moves (order-k
+Markov statistics, backing off to shorter contexts while a context is still
+unseen). The counts live in fixed-size arrays, so observe() touches k + 1
+counters and choose() reads at most k + 1 rows of N counts; both take a few
+microseconds and never hold up the Tk animation loop. MetaOpponent runs
+several such predictors at once and follows whichever has been doing best.
+"""
+
+import random
+from array import array
+
+from rules import PLAYER_WINS
+
+class RandomOpponent:
+    """Plays uniformly random moves (the original computer)"""
+
+    name = "random"
+
+    def __init__(self, rules, rng=None):
+        """
+        Args:
+            rules (Rules): Rules of the variant being played
+            rng (random.Random): Source of randomness (default: a fresh Random)
+        """
+        self.rules = rules
+        self.rng = rng or random.Random()
+
+    def choose(self):
+        """Move code to play next"""
+        return self.rng.randrange(len(self.rules))
+
+    def observe(self, player_move, own_move):
+        """Learn from a finished round (nothing to learn here)"""
+
+    def reset(self):
+        """Forget the match history"""
+
+class AdaptiveOpponent(RandomOpponent):
+    """Counters the player's most likely next move"""
+
+    name = "adaptive"
+
+    # A count that reaches this halves its whole row, so old habits fade
+    COUNT_LIMIT = 1 << 12
+
+    # Largest counts table (4 MB); longer contexts are dropped for big variants
+    MAX_TABLE_CELLS = 1 << 20
+
+    def __init__(self, rules, order=2, epsilon=0.1, rng=None):
+        """
+        Args:
+            rules (Rules): Rules of the variant being played
+            order (int): Longest context (number of past player moves) used,
+                lowered until len(rules) ** (order + 1) fits MAX_TABLE_CELLS
+            epsilon (float): Share of random moves, so the AI can't be farmed
+            rng (random.Random): Source of randomness (default: a fresh Random)
+        """
+        super().__init__(rules, rng)
+        if order < 0:
+            raise ValueError("order must be >= 0")
+        size = len(rules)
+        while order and size ** (order + 1) > self.MAX_TABLE_CELLS:
+            order -= 1
+        self.order = order
+        self.epsilon = epsilon
+
+        # Moves that beat each move, for answering a prediction in O(1)
+        self.counters = tuple(
+            tuple(move for move in range(size) if rules.outcome(move, beaten) == PLAYER_WINS)
+            for beaten in range(size))
+        # counts[k] is a flat [context * size + next move] table for contexts
+        # of the last k player moves, encoded in base `size`
+        self.counts = [array('I', [0]) * size ** (k + 1) for k in range(order + 1)]
+        self.reset()
+
+    def reset(self):
+        """Forget the match history"""
+        for table in self.counts:
+            table[:] = array('I', [0]) * len(table)
+        self.context = 0  # Last `order` player moves, most recent last
+        self.seen = 0     # Rounds observed, capped at `order`
+
+    def predict(self, order=None):
+        """
+        Most likely next player move
+
+        Args:
+            order (int): Use only contexts of this length instead of backing
+                off from the longest one
+
+        Returns:
+            int: Move code, or None while the contexts are still unseen
+        """
+        size = len(self.rules)
+        context = self.context
+        longest = min(self.seen, self.order)
+        if order is None:
+            orders = range(longest, -1, -1)
+        else:
+            orders = (order,) if order <= longest else ()
+        for k in orders:
+            start = (context % size ** k) * size
+            row = self.counts[k][start:start + size]
+            best = max(row)
+            if best:
+                return row.index(best)
+        return None
+
+    def choose(self):
+        """Move code to play next"""
+        if self.rng.random() < self.epsilon:
+            return super().choose()
+        predicted = self.predict()
+        if predicted is None:
+            return super().choose()
+        return self.rng.choice(self.counters[predicted])
+
+    def observe(self, player_move, own_move):
+        """Count the player's move under each of its current contexts"""
+        size = len(self.rules)
+        context = self.context
+        for k in range(min(self.seen, self.order) + 1):
+            table = self.counts[k]
+            start = (context % size ** k) * size
+            table[start + player_move] += 1
+            if table[start + player_move] >= self.COUNT_LIMIT:
+                for cell in range(start, start + size):
+                    table[cell] >>= 1
+        if self.order:
+            self.context = (context * size + player_move) % size ** self.order
+            self.seen = min(self.seen + 1, self.order)
+
+class MetaOpponent(RandomOpponent):
+    """
+    Iocaine Powder style meta-strategy
+
+    Several predictors guess the player's next move: the player's n-gram
+    counts at each order, and the same counts of our own moves (a player
+    who models us will play what beats our likely move). Each guess is
+    answered at three levels of second-guessing: beat it, beat the move
+    that beats our answer, and so on. Every (predictor, level) candidate
+    keeps a decaying score of how it would have done, and the best one
+    picks the move.
+    """
+
+    name = "meta"
+
+    LEVELS = 3
+
+    def __init__(self, rules, order=2, decay=0.95, rng=None):
+        """
+        Args:
+            rules (Rules): Rules of the variant being played
+            order (int): Longest context of the n-gram predictors (capped
+                like AdaptiveOpponent's)
+            decay (float): Weight kept by the candidates' past scores each round
+            rng (random.Random): Source of randomness (default: a fresh Random)
+        """
+        super().__init__(rules, rng)
+        self.decay = decay
+        self.theirs = AdaptiveOpponent(rules, order, epsilon=0)
+        self.mine = AdaptiveOpponent(rules, order, epsilon=0)
+        self.order = order = self.theirs.order
+        # One fixed answer to each move keeps the levels deterministic
+        self.beat = tuple(counters[0] for counters in self.theirs.counters)
+        self.scores = [0.0] * (2 * (order + 1) * self.LEVELS)
+        self.candidates = [None] * len(self.scores)
+
+    def reset(self):
+        """Forget the match history"""
+        self.theirs.reset()
+        self.mine.reset()
+        self.scores = [0.0] * len(self.scores)
+        self.candidates = [None] * len(self.scores)
+
+    def choose(self):
+        """Move code to play next"""
+        beat = self.beat
+        candidates = self.candidates
+        slot = 0
+        for model in (self.theirs, self.mine):
+            for k in range(self.order + 1):
+                predicted = model.predict(k)
+                if predicted is not None and model is self.mine:
+                    predicted = beat[predicted]
+                for _ in range(self.LEVELS):
+                    if predicted is not None:
+                        predicted = beat[predicted]
+                    candidates[slot] = predicted
+                    slot += 1
+
+        best, best_score = None, 0.0
+        for move, score in zip(candidates, self.scores):
+            if move is not None and score > best_score:
+                best, best_score = move, score
+        return super().choose() if best is None else best
+
+    def observe(self, player_move, own_move):
+        """Score every candidate against the player's move, then update the models"""
+        outcome = self.rules.outcome
+        decay = self.decay
+        scores = self.scores
+        for slot, move in enumerate(self.candidates):
+            score = scores[slot] * decay
+            if move is not None:
+                result = outcome(move, player_move)
+                if result == PLAYER_WINS:
+                    score += 1.0
+                elif result:
+                    score -= 1.0
+            scores[slot] = score
+        self.theirs.observe(player_move, own_move)
+        self.mine.observe(own_move, player_move)
+
+OPPONENTS = {
+    RandomOpponent.name: RandomOpponent,
+    AdaptiveOpponent.name: AdaptiveOpponent,
+    MetaOpponent.name: MetaOpponent,
+}
+
+def make_opponent(kind, rules, **options):
+    """
+    Create an opponent by name
+
+    Args:
+        kind (str): "random", "adaptive" or "meta"
+        rules (Rules): Rules of the variant being played
+        **options: Extra arguments for the opponent (order, epsilon, rng);
+            ones the opponent does not take are ignored
+
+    Returns:
+        RandomOpponent: The opponent
+    """
+    try:
+        opponent_class = OPPONENTS[kind]
+    except KeyError:
+        raise ValueError(f"unknown opponent {kind!r}, expected one of "
+                         f"{', '.join(OPPONENTS)}") from None
+    if opponent_class is RandomOpponent:
+        options.pop("order", None)
+    if opponent_class is not AdaptiveOpponent:
+        options.pop("epsilon", None)
+    return opponent_class(rules, **options)
@@ -0,0 +1,246 @@
+"""Headless Rock Paper Scissors rules
+
+Moves are small ints (their position in Rules.moves) and the outcome of
+every pair of moves is precomputed in a payoff table, so deciding a round
+is one table lookup. resolve() decides whole NumPy arrays of rounds at
+once (tens of millions per second):
+
+    outcome = CLASSIC.outcome(ROCK, SCISSORS)        # PLAYER_WINS
+    outcomes = CLASSIC.resolve(player_moves, computer_moves)
+    ties, player_wins, computer_wins = CLASSIC.score(outcomes)
+
+Variants with more moves (Rock Paper Scissors Lizard Spock, RPS-7, ...) are
+JSON definitions in variants/, loaded with load_variant(); their dominance
+and explanation tables are built once, so lookups stay O(1) for any N.
+
+Both the Tk game and minigame.py decide their rounds here.
+"""
+
+import os
+import random
+
+# Outcome codes (index into RESULTS)
+TIE = 0
+PLAYER_WINS = 1
+COMPUTER_WINS = 2
+RESULTS = ("tie", "player", "computer")
+
+class Rules:
+    """A set of moves and which move beats which"""
+
+    def __init__(self, moves, beats, title="Rock Paper Scissors"):
+        """
+        Args:
+            moves (sequence): Move names; a move's int code is its position
+            beats (dict): Move name -> names of the moves it beats, or a dict
+                of beaten move name -> verb ("rock": {"scissors": "crushes"});
+                every pair must be decided and every move beatable
+            title (str): Display name of the variant
+        """
+        self.moves = tuple(moves)
+        self.title = title
+        # code() looks names up case-insensitively, so the keys are folded too
+        self.index = {move.strip().lower(): code for code, move in enumerate(self.moves)}
+        if len(self.index) != len(self.moves):
+            raise ValueError("moves must be unique (ignoring case)")
+        size = len(self.moves)
+
+        table = [[TIE] * size for _ in range(size)]
+        explanations = [[""] * size for _ in range(size)]
+        for move, beaten in beats.items():
+            verbs = beaten if isinstance(beaten, dict) else dict.fromkeys(beaten, "beats")
+            for other, verb in verbs.items():
+                winner, loser = self.code(move), self.code(other)
+                if winner == loser or table[loser][winner] != TIE:
+                    raise ValueError(f"{move} and {other} cannot both win")
+                table[winner][loser] = PLAYER_WINS
+                table[loser][winner] = COMPUTER_WINS
+                text = f"{self.moves[winner].capitalize()} {verb} {self.moves[loser]}"
+                explanations[winner][loser] = explanations[loser][winner] = text
+
+        for player in range(size):
+            for computer in range(player + 1, size):
+                if table[player][computer] == TIE:
+                    raise ValueError(f"nothing decides {self.moves[player]} "
+                                     f"vs {self.moves[computer]}")
+        # Opponents answer a predicted move with one that beats it
+        for move in range(size):
+            if COMPUTER_WINS not in table[move]:
+                raise ValueError(f"nothing beats {self.moves[move]}")
+        # table[player][computer] -> outcome code
+        self.table = tuple(tuple(row) for row in table)
+        # explanations[player][computer] -> "Rock crushes scissors" ("" on a tie)
+        self.explanations = tuple(tuple(row) for row in explanations)
+        self._flat = None
+
+    @classmethod
+    def cyclic(cls, moves, title):
+        """
+        Balanced variant where each move beats the next (N - 1) / 2 moves,
+        wrapping around; N must be odd
+
+        Args:
+            moves (sequence): Move names in cycle order
+            title (str): Display name of the variant
+        """
+        moves = tuple(moves)
+        size = len(moves)
+        if size < 3 or size % 2 == 0:
+            raise ValueError(f"a cyclic variant needs an odd number of moves (got {size})")
+        reach = (size - 1) // 2
+        beats = {move: [moves[(code + step) % size] for step in range(1, reach + 1)]
+                 for code, move in enumerate(moves)}
+        return cls(moves, beats, title)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build rules from a variant definition
+
+        A definition has a "title", its "moves" (a list of names, or a count
+        for generated "move 1".."move N" names) and either a "beats" mapping
+        like the constructor's or "cyclic": true.
+        """
+        try:
+            moves = data["moves"]
+            if isinstance(moves, int):
+                moves = [f"move {number}" for number in range(1, moves + 1)]
+            title = data.get("title", "Rock Paper Scissors")
+            if data.get("cyclic"):
+                return cls.cyclic(moves, title)
+            return cls(moves, data["beats"], title)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"invalid variant definition: {e!r}") from None
+
+    def __len__(self):
+        return len(self.moves)
+
+    def code(self, move):
+        """Int code of a move name (case-insensitive)"""
+        try:
+            return self.index[move.strip().lower()]
+        except KeyError:
+            raise ValueError(f"unknown move {move!r}, expected one of "
+                             f"{', '.join(self.moves)}") from None
+
+    def name(self, code):
+        return self.moves[code]
+
+    def outcome(self, player, computer):
+        """Outcome code of one round of int moves"""
+        return self.table[player][computer]
+
+    def winner(self, player_move, computer_move):
+        """
+        Decide one round given move names
+
+        Returns:
+            str: "tie", "player" or "computer"
+        """
+        return RESULTS[self.table[self.code(player_move)][self.code(computer_move)]]
+
+    def explain(self, player, computer):
+        """Why one round of int moves went the way it did ("" on a tie)"""
+        return self.explanations[player][computer]
+
+    def random_move(self, rng=random):
+        """Uniformly random move code"""
+        return rng.randrange(len(self.moves))
+
+    # === BATCHES ===
+
+    def _index_dtype(self):
+        import numpy as np
+        size = len(self.moves)
+        if size * size <= 1 << 8:
+            return np.uint8
+        if size * size <= 1 << 16:
+            return np.uint16
+        return np.intp
+
+    def flat_table(self):
+        """Payoff table as a flat uint8 NumPy array: [player * size + computer]"""
+        if self._flat is None:
+            import numpy as np
+            self._flat = np.array(self.table, dtype=np.uint8).ravel()
+        return self._flat
+
+    def resolve(self, player_moves, computer_moves, out=None):
+        """
+        Decide many rounds at once
+
+        Args:
+            player_moves (array-like): Int move codes of the player
+            computer_moves (array-like): Int move codes of the computer
+            out (numpy.ndarray): Optional uint8 array for the result
+
+        Returns:
+            numpy.ndarray: uint8 outcome codes (TIE, PLAYER_WINS, COMPUTER_WINS)
+
+        Raises:
+            ValueError: A move code is not in 0..N-1 (it would wrap around
+                in the small index type and decide the wrong pair)
+        """
+        import numpy as np
+        size = len(self.moves)
+        player_moves = np.asarray(player_moves)
+        computer_moves = np.asarray(computer_moves)
+        for moves in (player_moves, computer_moves):
+            if moves.size and (moves.min() < 0 or moves.max() >= size):
+                raise ValueError(f"move codes must be in 0..{size - 1}")
+        dtype = self._index_dtype()
+        # Small index types keep the arithmetic in cache-friendly bytes
+        index = player_moves.astype(dtype, copy=True)
+        index *= dtype(size)
+        index += computer_moves.astype(dtype, copy=False)
+        return self.flat_table().take(index, out=out)
+
+    @staticmethod
+    def score(outcomes):
+        """
+        Count the outcomes of resolve()
+
+        Returns:
+            tuple: (ties, player wins, computer wins)
+        """
+        import numpy as np
+        counts = np.bincount(np.asarray(outcomes, dtype=np.uint8), minlength=3)
+        return int(counts[TIE]), int(counts[PLAYER_WINS]), int(counts[COMPUTER_WINS])
+
+CLASSIC = Rules(("rock", "paper", "scissors"),
+                {"rock": {"scissors": "crushes"},
+                 "paper": {"rock": "covers"},
+                 "scissors": {"paper": "cuts"}})
+ROCK, PAPER, SCISSORS = range(3)
+
+# === VARIANTS ===
+
+VARIANTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "variants")
+
+def load_variant(name, variants_dir=VARIANTS_DIR):
+    """
+    Load a variant definition and precompute its tables
+
+    Args:
+        name (str): Variant name (a file in variants_dir) or path to a .json file
+        variants_dir (str): Directory of the bundled variants
+
+    Returns:
+        Rules: The variant's rules
+    """
+    import json
+    path = name if name.endswith(".json") else os.path.join(variants_dir, name + ".json")
+    with open(path, encoding="utf-8") as f:
+        return Rules.from_dict(json.load(f))
+
+def variant_names(variants_dir=VARIANTS_DIR):
+    """Names of the bundled variants"""
+    return sorted(entry[:-5] for entry in os.listdir(variants_dir) if entry.endswith(".json"))
+
+def determine_winner(player_move, computer_move, rules=CLASSIC):
+    """"tie", "player" or "computer" for one round of move names"""
+    return rules.winner(player_move, computer_move)
+
+def resolve(player_moves, computer_moves, rules=CLASSIC):
+    """Outcome codes for arrays of int moves, see Rules.resolve"""
+    return rules.resolve(player_moves, computer_moves)
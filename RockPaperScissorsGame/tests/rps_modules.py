@@ -0,0 +1,47 @@
+"""Imports the Rock Paper Scissors modules for the tests
+
+The game's modules use flat imports and share names with the Number
+Guessing Game's (game_config, tournament). Both test suites can run in one
+process, so each test module swaps this game's modules in for its tests
+and restores the others afterwards:
+
+    def setUpModule():
+        global rules
+        rules = rps_modules.install()["rules"]
+
+    def tearDownModule():
+        rps_modules.uninstall()
+"""
+
+import importlib
+import os
+import sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NAMES = ("game_config", "rules", "opponent", "tournament")
+
+_saved = None
+
+def install():
+    """
+    Import the game's modules under their own names
+
+    Returns:
+        dict: Module name -> module
+    """
+    global _saved
+    if _saved is None:
+        _saved = {name: sys.modules.pop(name) for name in NAMES if name in sys.modules}
+    sys.path.insert(0, GAME_DIR)
+    return {name: importlib.import_module(name) for name in NAMES}
+
+def uninstall():
+    """Put back the modules install() replaced"""
+    global _saved
+    if _saved is None:
+        return
+    for name in NAMES:
+        sys.modules.pop(name, None)
+    sys.modules.update(_saved)
+    _saved = None
+    sys.path.remove(GAME_DIR)
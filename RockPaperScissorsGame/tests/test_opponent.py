@@ -0,0 +1,168 @@
+"""Unit tests for the computer opponents"""
+
+import unittest
+import sys
+import os
+import random
+
+# Add the tests directory to path for the module loader
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rps_modules
+
+def setUpModule():
+    global rules, opponent
+    modules = rps_modules.install()
+    rules, opponent = modules["rules"], modules["opponent"]
+
+def tearDownModule():
+    rps_modules.uninstall()
+
+def play(bot, player_moves):
+    """Let bot play against a fixed sequence of player moves"""
+    outcomes = []
+    for move in player_moves:
+        own = bot.choose()
+        outcomes.append(rules.CLASSIC.outcome(own, move))
+        bot.observe(move, own)
+    return outcomes
+
+class TestAdaptiveOpponent(unittest.TestCase):
+    """Test cases for the n-gram predictor"""
+
+    def setUp(self):
+        self.bot = opponent.AdaptiveOpponent(rules.CLASSIC, order=2, epsilon=0.0,
+                                             rng=random.Random(1))
+
+    def test_unseen_history_predicts_nothing(self):
+        """Test that a fresh opponent has no prediction and plays randomly"""
+        self.assertIsNone(self.bot.predict())
+        self.assertIn(self.bot.choose(), range(3))
+
+    def test_constant_player(self):
+        """Test that a player who always plays rock is answered with paper"""
+        for _ in range(5):
+            self.bot.observe(rules.ROCK, rules.ROCK)
+        self.assertEqual(self.bot.predict(), rules.ROCK)
+        self.assertEqual(self.bot.choose(), rules.PAPER)
+        outcomes = play(self.bot, [rules.ROCK] * 20)
+        self.assertEqual(outcomes, [rules.PLAYER_WINS] * 20)
+
+    def test_cyclic_player(self):
+        """Test that the context predicts a rock, paper, scissors cycle"""
+        cycle = [rules.ROCK, rules.PAPER, rules.SCISSORS]
+        for move in cycle * 3:
+            self.bot.observe(move, rules.ROCK)
+        # Overall the moves are equally common; the last moves decide
+        self.assertEqual(self.bot.predict(), rules.ROCK)
+        self.bot.observe(rules.ROCK, rules.ROCK)
+        self.assertEqual(self.bot.predict(), rules.PAPER)
+        self.assertEqual(self.bot.predict(order=1), rules.PAPER)
+
+        outcomes = play(self.bot, cycle * 10)
+        self.assertGreaterEqual(outcomes.count(rules.PLAYER_WINS), 29)
+
+    def test_counts_halve_at_the_limit(self):
+        """Test that a row is halved once one of its counts hits COUNT_LIMIT"""
+        limit = opponent.AdaptiveOpponent.COUNT_LIMIT
+        bot = opponent.AdaptiveOpponent(rules.CLASSIC, order=0, epsilon=0.0)
+        for _ in range(10):
+            bot.observe(rules.PAPER, rules.ROCK)
+        for _ in range(limit - 1):
+            bot.observe(rules.ROCK, rules.ROCK)
+        self.assertEqual(list(bot.counts[0]), [limit - 1, 10, 0])
+
+        bot.observe(rules.ROCK, rules.ROCK)
+        self.assertEqual(list(bot.counts[0]), [limit // 2, 5, 0])
+        self.assertEqual(bot.predict(), rules.ROCK)
+
+    def test_reset(self):
+        """Test that reset() forgets counts and context"""
+        for move in (rules.ROCK, rules.PAPER, rules.PAPER):
+            self.bot.observe(move, rules.ROCK)
+        self.bot.reset()
+        self.assertIsNone(self.bot.predict())
+        self.assertEqual((self.bot.context, self.bot.seen), (0, 0))
+        self.assertTrue(all(not any(table) for table in self.bot.counts))
+
+    def test_negative_order(self):
+        """Test that a negative context length is rejected"""
+        with self.assertRaises(ValueError):
+            opponent.AdaptiveOpponent(rules.CLASSIC, order=-1)
+
+    def test_order_is_capped_for_large_variants(self):
+        """Test that big variants keep only the contexts whose tables fit"""
+        limit = opponent.AdaptiveOpponent.MAX_TABLE_CELLS
+        rps101 = rules.load_variant("rps101")
+        bot = opponent.AdaptiveOpponent(rps101, order=3)
+        self.assertEqual(bot.order, 2)
+        self.assertLessEqual(max(len(table) for table in bot.counts), limit)
+        self.assertEqual(len(bot.counts), 3)
+
+        meta = opponent.MetaOpponent(rps101, order=5)
+        self.assertEqual((meta.order, meta.mine.order), (2, 2))
+        self.assertEqual(len(meta.scores), 2 * 3 * meta.LEVELS)
+        for move in [1, 2, 3] * 5:
+            meta.observe(move, meta.choose())
+
+        self.assertEqual(opponent.AdaptiveOpponent(rules.CLASSIC, order=5).order, 5)
+
+class TestMetaOpponent(unittest.TestCase):
+    """Test cases for the meta-strategy"""
+
+    def test_beats_simple_players(self):
+        """Test that the meta opponent learns constant and cyclic players"""
+        for moves in ([rules.SCISSORS] * 60,
+                      [rules.ROCK, rules.PAPER, rules.SCISSORS] * 20):
+            bot = opponent.MetaOpponent(rules.CLASSIC, rng=random.Random(2))
+            outcomes = play(bot, moves)
+            self.assertGreaterEqual(outcomes[20:].count(rules.PLAYER_WINS), 35)
+
+    def test_reset(self):
+        """Test that reset() clears the models and scores"""
+        bot = opponent.MetaOpponent(rules.CLASSIC, rng=random.Random(3))
+        play(bot, [rules.ROCK] * 10)
+        bot.reset()
+        self.assertEqual(bot.scores, [0.0] * len(bot.scores))
+        self.assertIsNone(bot.theirs.predict())
+        self.assertIsNone(bot.mine.predict())
+
+class TestMakeOpponent(unittest.TestCase):
+    """Test cases for creating opponents by name"""
+
+    def test_options_are_filtered(self):
+        """Test that each opponent only gets the options it takes"""
+        rng = random.Random(4)
+        options = dict(order=1, epsilon=0.25, rng=rng)
+
+        random_bot = opponent.make_opponent("random", rules.CLASSIC, **options)
+        self.assertIs(type(random_bot), opponent.RandomOpponent)
+        self.assertIs(random_bot.rng, rng)
+
+        adaptive = opponent.make_opponent("adaptive", rules.CLASSIC, **options)
+        self.assertEqual((adaptive.order, adaptive.epsilon), (1, 0.25))
+
+        meta = opponent.make_opponent("meta", rules.CLASSIC, **options)
+        self.assertIsInstance(meta, opponent.MetaOpponent)
+        self.assertEqual(meta.order, 1)
+
+        self.assertEqual(options, dict(order=1, epsilon=0.25, rng=rng))
+
+    def test_unknown_opponent(self):
+        """Test that an unknown name lists the known ones"""
+        with self.assertRaisesRegex(ValueError, "random, adaptive, meta"):
+            opponent.make_opponent("psychic", rules.CLASSIC)
+
+    def test_every_move_has_an_answer(self):
+        """Test that variants with an unbeatable move never reach the opponents"""
+        with self.assertRaisesRegex(ValueError, "nothing beats a"):
+            rules.Rules.from_dict({"moves": ["a", "b", "c"], "beats": {"a": ["b", "c"],
+                                                                        "b": ["c"]}})
+        for variant in rules.variant_names():
+            variant_rules = rules.load_variant(variant)
+            bot = opponent.AdaptiveOpponent(variant_rules, epsilon=0.0)
+            self.assertTrue(all(bot.counters))
+            opponent.MetaOpponent(variant_rules)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,196 @@
+"""Unit tests for the Rock Paper Scissors rules tables"""
+
+import unittest
+import sys
+import os
+import io
+import runpy
+from unittest import mock
+
+# Add the tests directory to path for the module loader
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rps_modules
+
+def setUpModule():
+    global rules
+    rules = rps_modules.install()["rules"]
+
+def tearDownModule():
+    rps_modules.uninstall()
+
+def every_pair(size):
+    """Player and computer move codes of all size * size rounds"""
+    import numpy as np
+    player, computer = np.divmod(np.arange(size * size, dtype=np.int64), size)
+    return player, computer
+
+class TestResolve(unittest.TestCase):
+    """Test cases for deciding rounds one at a time and in batches"""
+
+    def test_classic_rounds(self):
+        """Test winner() on the three classic rules"""
+        winner = rules.CLASSIC.winner
+        self.assertEqual(winner("rock", "scissors"), "player")
+        self.assertEqual(winner("scissors", "paper"), "player")
+        self.assertEqual(winner("paper", "rock"), "player")
+        self.assertEqual(winner("rock", "paper"), "computer")
+        self.assertEqual(winner(" Paper ", "paper"), "tie")
+        with self.assertRaises(ValueError):
+            winner("rock", "well")
+
+    def test_winner_agrees_with_outcome(self):
+        """Test that names and int codes decide every pair the same way"""
+        for variant in rules.variant_names():
+            variant_rules = rules.load_variant(variant)
+            for player, player_name in enumerate(variant_rules.moves):
+                for computer, computer_name in enumerate(variant_rules.moves):
+                    self.assertEqual(variant_rules.winner(player_name, computer_name),
+                                     rules.RESULTS[variant_rules.outcome(player, computer)])
+
+    def test_resolve_agrees_with_outcome(self):
+        """Test resolve() on every pair for each index type"""
+        import numpy as np
+
+        moves = [f"move {number}" for number in range(17 * 17)]
+        cases = [(rules.CLASSIC, np.uint8),
+                 (rules.load_variant("rps101"), np.uint16),
+                 (rules.Rules.cyclic(moves, "Huge"), np.intp)]
+        for variant_rules, dtype in cases:
+            with self.subTest(title=variant_rules.title):
+                self.assertEqual(variant_rules._index_dtype(), dtype)
+                size = len(variant_rules)
+                player, computer = every_pair(size)
+                outcomes = variant_rules.resolve(player, computer)
+                self.assertEqual(outcomes.dtype, np.uint8)
+                expected = [variant_rules.outcome(p, c)
+                            for p, c in zip(player.tolist(), computer.tolist())]
+                self.assertEqual(outcomes.tolist(), expected)
+                # Narrow inputs and an output buffer give the same answer
+                out = np.empty(size * size, dtype=np.uint8)
+                variant_rules.resolve(player.astype(np.uint16), computer.astype(np.uint16),
+                                      out=out)
+                self.assertEqual(out.tolist(), expected)
+
+    def test_resolve_rejects_unknown_codes(self):
+        """Test that codes outside the moves raise instead of wrapping"""
+        for player, computer in (([1], [5]), ([-1], [0]), ([0, 3], [1, 1])):
+            with self.subTest(player=player, computer=computer):
+                with self.assertRaises(ValueError):
+                    rules.CLASSIC.resolve(player, computer)
+        self.assertEqual(rules.CLASSIC.resolve([], []).tolist(), [])
+
+    def test_score(self):
+        """Test counting the outcomes of a batch"""
+        player, computer = every_pair(3)
+        outcomes = rules.resolve(player, computer)
+        self.assertEqual(rules.Rules.score(outcomes), (3, 3, 3))
+        self.assertEqual(rules.Rules.score([rules.PLAYER_WINS] * 4 + [rules.TIE]), (1, 4, 0))
+        self.assertEqual(rules.Rules.score([]), (0, 0, 0))
+
+class TestVariants(unittest.TestCase):
+    """Test cases for variant definitions and their tables"""
+
+    def test_bundled_variants(self):
+        """Test that every bundled variant loads into a balanced table"""
+        expected = {"classic": ("Rock Paper Scissors", 3), "rpsls": ("Rock Paper Scissors "
+                    "Lizard Spock", 5), "rps7": ("RPS-7", 7), "rps101": ("RPS-101", 101)}
+        self.assertEqual(rules.variant_names(), sorted(expected))
+        for name, (title, size) in expected.items():
+            with self.subTest(variant=name):
+                variant_rules = rules.load_variant(name)
+                self.assertEqual((variant_rules.title, len(variant_rules)), (title, size))
+                # Every move beats exactly half of the others
+                for row in variant_rules.table:
+                    self.assertEqual(row.count(rules.PLAYER_WINS), (size - 1) // 2)
+                    self.assertEqual(row.count(rules.TIE), 1)
+        self.assertEqual(rules.load_variant("classic").table, rules.CLASSIC.table)
+
+    def test_load_variant_from_path(self):
+        """Test loading a definition by its .json path"""
+        path = os.path.join(rules.VARIANTS_DIR, "rpsls.json")
+        self.assertEqual(rules.load_variant(path).moves[3], "lizard")
+        with self.assertRaises(OSError):
+            rules.load_variant("no-such-variant")
+
+    def test_from_dict(self):
+        """Test generated move names and cyclic definitions"""
+        variant_rules = rules.Rules.from_dict({"title": "Five", "moves": 5, "cyclic": True})
+        self.assertEqual(variant_rules.moves[0], "move 1")
+        self.assertEqual(variant_rules.winner("move 1", "move 3"), "player")
+        self.assertEqual(variant_rules.winner("move 1", "move 4"), "computer")
+        self.assertEqual(variant_rules.explain(0, 1), "Move 1 beats move 2")
+
+    def test_mixed_case_moves(self):
+        """Test that move names keep their spelling and are looked up in any case"""
+        variant_rules = rules.Rules.from_dict({"moves": ["Rock", "Paper", "Spock"],
+                                               "beats": {"Rock": ["Spock"], "Paper": ["Rock"],
+                                                         "Spock": ["Paper"]}})
+        self.assertEqual(variant_rules.moves, ("Rock", "Paper", "Spock"))
+        self.assertEqual(variant_rules.code("Spock"), 2)
+        self.assertEqual(variant_rules.code(" spock "), 2)
+        self.assertEqual(variant_rules.winner("PAPER", "rock"), "player")
+        self.assertEqual(variant_rules.explain(2, 1), "Spock beats Paper")
+        with self.assertRaisesRegex(ValueError, "unique"):
+            rules.Rules.from_dict({"moves": ["rock", "Rock", "paper"], "beats": {}})
+
+    def test_invalid_definitions(self):
+        """Test that incomplete or contradictory definitions are rejected"""
+        invalid = {
+            "undecided pair": {"moves": ["a", "b", "c"], "beats": {"a": ["b"], "b": ["c"]}},
+            "both win": {"moves": ["a", "b", "c"],
+                         "beats": {"a": ["b", "c"], "b": ["a", "c"]}},
+            "beats itself": {"moves": ["a", "b", "c"],
+                             "beats": {"a": ["a"], "b": ["c", "a"], "c": ["a"]}},
+            "unknown move": {"moves": ["a", "b"], "beats": {"a": ["z"]}},
+            "no beats": {"moves": ["a", "b"]},
+            "even cycle": {"moves": 4, "cyclic": True},
+            "duplicate moves": {"moves": ["a", "a", "b"], "beats": {}},
+            "not a mapping": ["a", "b"],
+        }
+        for reason, definition in invalid.items():
+            with self.subTest(reason):
+                with self.assertRaises(ValueError):
+                    rules.Rules.from_dict(definition)
+
+        with self.assertRaisesRegex(ValueError, "nothing decides a vs c"):
+            rules.Rules.from_dict(invalid["undecided pair"])
+        with self.assertRaisesRegex(ValueError, "cannot both win"):
+            rules.Rules.from_dict(invalid["both win"])
+
+    def test_explain(self):
+        """Test the explanation of each kind of round"""
+        rock, paper, scissors = rules.ROCK, rules.PAPER, rules.SCISSORS
+        self.assertEqual(rules.CLASSIC.explain(rock, scissors), "Rock crushes scissors")
+        self.assertEqual(rules.CLASSIC.explain(scissors, rock), "Rock crushes scissors")
+        self.assertEqual(rules.CLASSIC.explain(paper, rock), "Paper covers rock")
+        self.assertEqual(rules.CLASSIC.explain(paper, paper), "")
+
+        rpsls = rules.load_variant("rpsls")
+        spock, lizard = rpsls.code("Spock"), rpsls.code("lizard")
+        self.assertEqual(rpsls.explain(spock, lizard), "Lizard poisons spock")
+        for player in range(len(rpsls)):
+            for computer in range(len(rpsls)):
+                self.assertEqual(rpsls.explain(player, computer) == "", player == computer)
+
+class TestMinigame(unittest.TestCase):
+    """Test cases for the console minigame"""
+
+    def play(self, player, computer):
+        CLASSIC = rules.CLASSIC
+        with mock.patch("builtins.input", return_value=player), \
+                mock.patch("random.choice", return_value=computer), \
+                mock.patch.object(CLASSIC, "winner", wraps=CLASSIC.winner) as winner, \
+                mock.patch("sys.stdout", new_callable=io.StringIO) as output:
+            runpy.run_path(os.path.join(rps_modules.GAME_DIR, "minigame.py"))
+        winner.assert_called_once_with(player.lower(), computer)
+        return output.getvalue().splitlines()[-1]
+
+    def test_minigame_delegates_to_rules(self):
+        """Test that minigame.py decides its round with the shared rules"""
+        self.assertEqual(self.play("Rock", "scissors"), "Player wins!")
+        self.assertEqual(self.play("rock", "paper"), "Computer wins!")
+        self.assertEqual(self.play("paper", "paper"), "It's a tie!")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
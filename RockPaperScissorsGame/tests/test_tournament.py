@@ -0,0 +1,156 @@
+"""Unit tests for the bot tournament"""
+
+import unittest
+import sys
+import os
+import csv
+import json
+import random
+import tempfile
+
+# Add the tests directory to path for the module loader
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rps_modules
+
+def setUpModule():
+    global rules, tournament
+    modules = rps_modules.install()
+    rules, tournament = modules["rules"], modules["tournament"]
+
+def tearDownModule():
+    rps_modules.uninstall()
+
+class TestMatches(unittest.TestCase):
+    """Test cases for single matches"""
+
+    def test_match_counts(self):
+        """Test that a match splits its rounds into wins, losses and ties"""
+        first = tournament.RandomOpponent(rules.CLASSIC, rng=random.Random(1))
+        second = tournament.CycleBot(rules.CLASSIC, rng=random.Random(2))
+        wins_a, wins_b, ties = tournament.play_match(rules.CLASSIC, first, second, 300)
+        self.assertEqual(wins_a + wins_b + ties, 300)
+
+        # Replaying the same moves by hand gives the same split
+        first = tournament.RandomOpponent(rules.CLASSIC, rng=random.Random(1))
+        second = tournament.CycleBot(rules.CLASSIC, rng=random.Random(2))
+        outcomes = [rules.CLASSIC.outcome(first.choose(), second.choose()) for _ in range(300)]
+        self.assertEqual((wins_a, wins_b, ties), (outcomes.count(rules.PLAYER_WINS),
+                                                  outcomes.count(rules.COMPUTER_WINS),
+                                                  outcomes.count(rules.TIE)))
+
+    def test_beat_last_beats_a_constant_bot(self):
+        """Test the second bot's wins are reported as such"""
+        class RockBot(tournament.RandomOpponent):
+            def choose(self):
+                return rules.ROCK
+
+        wins_a, wins_b, ties = tournament.play_match(
+            rules.CLASSIC, RockBot(rules.CLASSIC), tournament.BeatLastBot(rules.CLASSIC), 50)
+        self.assertEqual(wins_b, 49 if wins_a + ties else 50)
+        self.assertLessEqual(wins_a + ties, 1)
+
+class TestElo(unittest.TestCase):
+    """Test cases for the rating updates"""
+
+    def test_expected_scores_are_symmetric(self):
+        """Test that both sides' expected scores add up to one"""
+        elo = tournament.EloRatings(["a", "b"])
+        self.assertEqual(elo.expected("a", "b"), 0.5)
+        elo.ratings["a"] = 1700.0
+        self.assertAlmostEqual(elo.expected("a", "b") + elo.expected("b", "a"), 1.0)
+        self.assertAlmostEqual(elo.expected("a", "b"), 1 / (1 + 10 ** -0.5))
+
+    def test_updates_are_zero_sum_and_symmetric(self):
+        """Test that a result moves both ratings by the same amount"""
+        first = tournament.EloRatings(["a", "b"])
+        second = tournament.EloRatings(["a", "b"])
+        first.update("a", "b", 0.8)
+        second.update("b", "a", 0.2)
+        self.assertEqual(first.ratings, second.ratings)
+        self.assertAlmostEqual(sum(first.ratings.values()), 2 * tournament.INITIAL_RATING)
+        self.assertAlmostEqual(first.ratings["a"] - tournament.INITIAL_RATING,
+                               tournament.ELO_K * 0.3)
+
+        even = tournament.EloRatings(["a", "b"])
+        even.update("a", "b", 0.5)
+        self.assertEqual(even.ratings, {"a": 1500.0, "b": 1500.0})
+
+class TestTournament(unittest.TestCase):
+    """Test cases for whole tournaments"""
+
+    BOTS = ["random", "cycle", "beat-last", "frequency", "meta"]
+
+    def test_results_do_not_depend_on_workers(self):
+        """Test that one process and a pool give the same ratings"""
+        runs = [tournament.run_tournament(self.BOTS, rounds=200, legs=2, seed=7, workers=workers)
+                for workers in (1, 2)]
+        (elo_one, standings_one), (elo_pool, standings_pool) = runs
+        self.assertEqual(elo_one.ratings, elo_pool.ratings)
+        self.assertEqual(standings_one, standings_pool)
+
+        other_seed = tournament.run_tournament(self.BOTS, rounds=200, legs=2, seed=8, workers=1)
+        self.assertNotEqual(other_seed[1], standings_one)
+
+    def test_standings_balance(self):
+        """Test that every win is somebody's loss and every round is counted"""
+        seen = []
+        elo, standings = tournament.run_tournament(self.BOTS, rounds=100, legs=2, seed=1,
+                                                   workers=1, on_match=seen.append)
+        pairs = len(self.BOTS) * (len(self.BOTS) - 1) // 2
+        self.assertEqual([result[0] for result in seen], list(range(2 * pairs)))
+        wins, losses, ties = (sum(column) for column in zip(*standings.values()))
+        self.assertEqual(wins, losses)
+        self.assertEqual(wins + ties // 2, 2 * pairs * 100)
+        self.assertAlmostEqual(sum(elo.ratings.values()),
+                               len(self.BOTS) * tournament.INITIAL_RATING)
+
+    def test_rounds_must_be_positive(self):
+        """Test that an empty match is rejected instead of dividing by zero"""
+        with self.assertRaises(ValueError):
+            tournament.run_tournament(["random", "cycle"], rounds=0, workers=1)
+
+class TestLeaderboard(unittest.TestCase):
+    """Test cases for ranking and writing the results"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = temp_dir.name
+        elo = tournament.EloRatings(["a", "b", "c"])
+        elo.ratings.update(a=1490.0, b=1520.04, c=1490.0)
+        self.rows = tournament.leaderboard(elo, {"a": [1, 2, 3], "b": [4, 5, 6],
+                                                 "c": [7, 8, 9]})
+
+    def test_ranking(self):
+        """Test the order (ties broken by name) and the table text"""
+        self.assertEqual(self.rows, [(1, "b", 1520.0, 4, 5, 6), (2, "a", 1490.0, 1, 2, 3),
+                                     (3, "c", 1490.0, 7, 8, 9)])
+        lines = tournament.format_leaderboard(self.rows).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[2].split(), ["1", "b", "1520.0", "4", "5", "6"])
+
+    def test_write_csv(self):
+        """Test the CSV leaderboard"""
+        path = os.path.join(self.directory, "leaderboard.csv")
+        tournament.write_leaderboard(self.rows, path)
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["rank", "bot", "elo", "wins", "losses", "ties"])
+        self.assertEqual(rows[1], ["1", "b", "1520.0", "4", "5", "6"])
+        self.assertEqual(os.listdir(self.directory), ["leaderboard.csv"])
+
+    def test_write_json(self):
+        """Test the JSON leaderboard, replacing an older file"""
+        path = os.path.join(self.directory, "leaderboard.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("old")
+        tournament.write_leaderboard(self.rows, path)
+        with open(path, encoding="utf-8") as f:
+            rows = json.load(f)
+        self.assertEqual(rows[2], {"rank": 3, "bot": "c", "elo": 1490.0,
+                                   "wins": 7, "losses": 8, "ties": 9})
+        self.assertEqual(os.listdir(self.directory), ["leaderboard.json"])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,259 @@
+"""Multi-process bot-vs-bot Rock Paper Scissors tournament with Elo ratings
+
+Every pair of bots plays `legs` matches of `rounds` rounds each, decided
+with the same rules tables as determine_winner. Matches are played on a
+process pool and streamed back in schedule order, so the Elo updates are
+applied in the same order for any number of workers.
+
+Each match seeds its bots from the tournament seed and the match index,
+so results are identical for any number of workers:
+
+    python tournament.py --rounds 10000 --legs 20 --output leaderboard.csv
+"""
+
+import argparse
+import functools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rules import load_variant, TIE, PLAYER_WINS, COMPUTER_WINS
+from opponent import RandomOpponent, AdaptiveOpponent, MetaOpponent
+from game_config import GameConfig
+
+DEFAULT_ROUNDS = 1000
+DEFAULT_LEGS = 10
+INITIAL_RATING = 1500.0
+ELO_K = 16.0
+
+# === STRATEGIES ===
+
+class CycleBot(RandomOpponent):
+    """Plays the moves in order, starting at a random one"""
+
+    def __init__(self, rules, rng=None):
+        super().__init__(rules, rng)
+        self.next_move = self.rng.randrange(len(rules))
+
+    def choose(self):
+        move = self.next_move
+        self.next_move = (move + 1) % len(self.rules)
+        return move
+
+class BeatLastBot(RandomOpponent):
+    """Plays what would have beaten the opponent's last move"""
+
+    def __init__(self, rules, rng=None):
+        super().__init__(rules, rng)
+        self.answer = None
+
+    def choose(self):
+        return super().choose() if self.answer is None else self.answer
+
+    def observe(self, player_move, own_move):
+        self.answer = next(move for move in range(len(self.rules))
+                           if self.rules.outcome(move, player_move) == PLAYER_WINS)
+
+STRATEGIES = {
+    'random': RandomOpponent,
+    'cycle': CycleBot,
+    'beat-last': BeatLastBot,
+    'frequency': functools.partial(AdaptiveOpponent, order=0, epsilon=0.0),
+    'markov': functools.partial(AdaptiveOpponent, order=2, epsilon=0.0),
+    'adaptive': functools.partial(AdaptiveOpponent, order=GameConfig.OPPONENT_ORDER,
+                                  epsilon=GameConfig.OPPONENT_EPSILON),
+    'meta': MetaOpponent,
+}
+
+# === TOURNAMENT ===
+
+@functools.lru_cache(maxsize=None)
+def _rules(variant):
+    """Rules of a variant, loaded once per worker process"""
+    return load_variant(variant)
+
+def _match_rng(seed, index, side):
+    """Independent, reproducible RNG for one bot in one match"""
+    return random.Random(f"{seed}/{index}/{side}")
+
+def play_match(rules, first, second, rounds):
+    """
+    Play one match between two bots
+
+    Returns:
+        tuple: (first bot wins, second bot wins, ties)
+    """
+    outcome = rules.outcome
+    counts = [0, 0, 0]
+    for _ in range(rounds):
+        move_a = first.choose()
+        move_b = second.choose()
+        counts[outcome(move_a, move_b)] += 1
+        first.observe(move_b, move_a)
+        second.observe(move_a, move_b)
+    return counts[PLAYER_WINS], counts[COMPUTER_WINS], counts[TIE]
+
+def _play_task(task):
+    """Worker entry point: play one scheduled match"""
+    seed, index, variant, name_a, name_b, rounds = task
+    rules = _rules(variant)
+    first = STRATEGIES[name_a](rules, rng=_match_rng(seed, index, "first"))
+    second = STRATEGIES[name_b](rules, rng=_match_rng(seed, index, "second"))
+    return (index, name_a, name_b) + play_match(rules, first, second, rounds)
+
+def make_tasks(bot_names, rounds, legs, seed, variant):
+    """Schedule every pair for `legs` matches, alternating who plays first"""
+    tasks = []
+    for leg in range(legs):
+        for i, name_a in enumerate(bot_names):
+            for name_b in bot_names[i + 1:]:
+                first, second = (name_b, name_a) if leg % 2 else (name_a, name_b)
+                tasks.append((seed, len(tasks), variant, first, second, rounds))
+    return tasks
+
+class EloRatings:
+    """Elo ratings updated once per match from its share of points"""
+
+    def __init__(self, names, k=ELO_K, initial=INITIAL_RATING):
+        self.k = k
+        self.ratings = {name: initial for name in names}
+
+    def expected(self, name_a, name_b):
+        """Expected score of name_a against name_b"""
+        return 1.0 / (1.0 + 10 ** ((self.ratings[name_b] - self.ratings[name_a]) / 400))
+
+    def update(self, name_a, name_b, score_a):
+        """
+        Apply one match result
+
+        Args:
+            score_a (float): Share of points name_a took (ties count half)
+        """
+        change = self.k * (score_a - self.expected(name_a, name_b))
+        self.ratings[name_a] += change
+        self.ratings[name_b] -= change
+
+def run_tournament(bot_names=None, rounds=DEFAULT_ROUNDS, legs=DEFAULT_LEGS, seed=0,
+                   variant=GameConfig.VARIANT, workers=None, on_match=None):
+    """
+    Play a round robin between bots
+
+    Args:
+        bot_names (list): Keys of STRATEGIES, None for all
+        rounds (int): Rounds per match
+        legs (int): Matches per pair of bots
+        seed (int): Tournament seed; same seed gives the same results
+        variant (str): Rules variant, see rules.load_variant
+        workers (int): Worker processes, None for one per core, 1 to stay in-process
+        on_match (callable): Called with each match result as it streams in
+
+    Returns:
+        tuple: (EloRatings, {bot name: [wins, losses, ties]})
+    """
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1")
+    if bot_names is None:
+        bot_names = list(STRATEGIES)
+    tasks = make_tasks(list(bot_names), rounds, legs, seed, variant)
+    elo = EloRatings(bot_names)
+    standings = {name: [0, 0, 0] for name in bot_names}
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def apply(results):
+        # Results arrive in schedule order, so the ratings never depend on timing
+        for result in results:
+            index, name_a, name_b, wins_a, wins_b, ties = result
+            elo.update(name_a, name_b, (wins_a + ties / 2) / rounds)
+            for name, wins, losses in ((name_a, wins_a, wins_b), (name_b, wins_b, wins_a)):
+                standing = standings[name]
+                standing[0] += wins
+                standing[1] += losses
+                standing[2] += ties
+            if on_match:
+                on_match(result)
+
+    if workers == 1:
+        apply(map(_play_task, tasks))
+    else:
+        chunk_size = max(1, len(tasks) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            apply(executor.map(_play_task, tasks, chunksize=chunk_size))
+
+    return elo, standings
+
+def leaderboard(elo, standings):
+    """
+    Bots ordered by rating
+
+    Returns:
+        list: (rank, name, rating, wins, losses, ties) tuples, best first
+    """
+    names = sorted(standings, key=lambda name: (-elo.ratings[name], name))
+    return [(rank, name, round(elo.ratings[name], 1)) + tuple(standings[name])
+            for rank, name in enumerate(names, 1)]
+
+def format_leaderboard(rows):
+    """Format the leaderboard as a table"""
+    header = f"{'#':>2}  {'Bot':<10} {'Elo':>7} {'Wins':>10} {'Losses':>10} {'Ties':>10}"
+    lines = [header, "-" * len(header)]
+    for rank, name, rating, wins, losses, ties in rows:
+        lines.append(f"{rank:>2}  {name:<10} {rating:>7.1f} {wins:>10} {losses:>10} {ties:>10}")
+    return "\n".join(lines)
+
+def write_leaderboard(rows, path):
+    """Write the leaderboard as CSV, or JSON for a .json path (temp file + rename)"""
+    fields = ("rank", "bot", "elo", "wins", "losses", "ties")
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="") as f:
+        if path.endswith(".json"):
+            import json
+            json.dump([dict(zip(fields, row)) for row in rows], f, indent=2)
+        else:
+            import csv
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            writer.writerows(rows)
+    os.replace(temp_path, path)
+
+def _positive_int(text):
+    """argparse type for counts that must be at least 1"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors bot tournament")
+    parser.add_argument("--bots", nargs="+", choices=list(STRATEGIES), default=None)
+    parser.add_argument("--rounds", type=_positive_int, default=DEFAULT_ROUNDS,
+                        help="rounds per match")
+    parser.add_argument("--legs", type=_positive_int, default=DEFAULT_LEGS,
+                        help="matches per pair of bots")
+    parser.add_argument("--variant", default=GameConfig.VARIANT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=_positive_int, default=None)
+    parser.add_argument("--output", default="leaderboard.csv", help=".csv or .json")
+    args = parser.parse_args()
+
+    def progress(result):
+        index, name_a, name_b, wins_a, wins_b, ties = result
+        print(f"match {index + 1}: {name_a} {wins_a} - {wins_b} {name_b} ({ties} ties)")
+
+    start = time.perf_counter()
+    elo, standings = run_tournament(args.bots, args.rounds, args.legs, args.seed,
+                                    args.variant, args.workers, progress)
+    elapsed = time.perf_counter() - start
+
+    rows = leaderboard(elo, standings)
+    write_leaderboard(rows, args.output)
+    total = sum(sum(standing) for standing in standings.values()) // 2
+    print()
+    print(format_leaderboard(rows))
+    print(f"\n{total} rounds in {elapsed:.2f}s ({total / elapsed:,.0f} rounds/s), "
+          f"leaderboard written to {args.output}")
+
+if __name__ == "__main__":
+    main()
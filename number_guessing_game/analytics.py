@@ -0,0 +1,277 @@
+"""Streaming, mergeable statistics over replay logs
+
+GameStats folds a stream of GameRecord objects (see replay_log.py) into
+fixed-size aggregates: counts per attempts, per range, per number of
+hints and per first-guess position. Memory does not grow with the number
+of games, and two GameStats can be merged, so logs can be analyzed by
+parallel workers (one per log file) and the partial results combined or
+saved as JSON and merged later. Large logs are split on record
+boundaries, so a single file is shared by several workers as well.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from replay_log import read_games, split_log
+
+# Bytes of log per parallel task (about 250,000 typical games)
+CHUNK_SIZE = 4 << 20
+
+# Hint counts at or above this are reported together as "HINT_CAP+"
+HINT_CAP = 5
+
+# First guesses are recorded as their position in the range, in percent
+POSITION_BUCKETS = 100
+
+class Histogram:
+    """
+    Counts of small non-negative integers with quantiles
+
+    Values here are attempts or percent buckets, so the table stays small
+    and quantiles are exact for the recorded values.
+    """
+
+    __slots__ = ('counts', 'total')
+
+    def __init__(self, counts=None):
+        self.counts = {}
+        self.total = 0
+        for value, count in (counts or {}).items():
+            self.add(int(value), count)
+
+    def add(self, value, count=1):
+        self.counts[value] = self.counts.get(value, 0) + count
+        self.total += count
+
+    def merge(self, other):
+        for value, count in other.counts.items():
+            self.add(value, count)
+
+    @property
+    def mean(self):
+        if not self.total:
+            return 0.0
+        return sum(value * count for value, count in self.counts.items()) / self.total
+
+    def quantile(self, fraction):
+        """
+        Smallest value with at least fraction of the counts at or below it
+
+        Returns:
+            int: The quantile, or None if the histogram is empty
+        """
+        if not self.total:
+            return None
+        needed = max(1, fraction * self.total)
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen >= needed:
+                return value
+        return max(self.counts)
+
+    def to_dict(self):
+        return {str(value): count for value, count in sorted(self.counts.items())}
+
+class GameStats:
+    """Aggregates over any number of games"""
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.attempts_to_win = Histogram()
+        self.first_guess = Histogram()
+        # (min_number, max_number, max_attempts) -> [games, losses]
+        self.ranges = {}
+        # hints used (capped) -> [games, wins]
+        self.hints = {}
+
+    @property
+    def losses(self):
+        return self.games - self.wins
+
+    @property
+    def loss_rate(self):
+        return self.losses / self.games if self.games else 0.0
+
+    def add(self, game):
+        """
+        Fold one game into the aggregates
+
+        Args:
+            game (GameRecord): A decoded game
+        """
+        won = game.won
+        self.games += 1
+        if won:
+            self.wins += 1
+            self.attempts_to_win.add(len(game.guesses))
+
+        key = (game.min_number, game.max_number, game.max_attempts)
+        per_range = self.ranges.get(key)
+        if per_range is None:
+            per_range = self.ranges[key] = [0, 0]
+        per_range[0] += 1
+        if not won:
+            per_range[1] += 1
+
+        hints = min(game.hints, HINT_CAP)
+        per_hints = self.hints.get(hints)
+        if per_hints is None:
+            per_hints = self.hints[hints] = [0, 0]
+        per_hints[0] += 1
+        if won:
+            per_hints[1] += 1
+
+        if game.guesses:
+            span = game.max_number - game.min_number + 1
+            offset = min(max(game.guesses[0] - game.min_number, 0), span - 1)
+            self.first_guess.add(offset * POSITION_BUCKETS // span)
+
+    def merge(self, other):
+        """Add another GameStats (e.g. from a worker) into this one"""
+        self.games += other.games
+        self.wins += other.wins
+        self.attempts_to_win.merge(other.attempts_to_win)
+        self.first_guess.merge(other.first_guess)
+        for table, other_table in ((self.ranges, other.ranges), (self.hints, other.hints)):
+            for key, (games, count) in other_table.items():
+                entry = table.setdefault(key, [0, 0])
+                entry[0] += games
+                entry[1] += count
+        return self
+
+    # === SERIALIZATION ===
+
+    def to_dict(self):
+        """Plain JSON-compatible form, used to save partial results"""
+        return {
+            'games': self.games,
+            'wins': self.wins,
+            'attempts_to_win': self.attempts_to_win.to_dict(),
+            'first_guess': self.first_guess.to_dict(),
+            'ranges': [[*key, games, losses]
+                       for key, (games, losses) in sorted(self.ranges.items())],
+            'hints': [[hints, games, wins] for hints, (games, wins) in sorted(self.hints.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.games = data['games']
+        stats.wins = data['wins']
+        stats.attempts_to_win = Histogram(data['attempts_to_win'])
+        stats.first_guess = Histogram(data['first_guess'])
+        stats.ranges = {(lo, hi, attempts): [games, losses]
+                        for lo, hi, attempts, games, losses in data['ranges']}
+        stats.hints = {hints: [games, wins] for hints, games, wins in data['hints']}
+        return stats
+
+# === ANALYSIS ===
+
+def analyze(games, stats=None):
+    """
+    Fold a stream of games into statistics
+
+    Args:
+        games (iterable): GameRecord objects, e.g. read_games(path)
+        stats (GameStats): Aggregates to add to, or None for new ones
+
+    Returns:
+        GameStats: The aggregates
+    """
+    if stats is None:
+        stats = GameStats()
+    add = stats.add
+    for game in games:
+        add(game)
+    return stats
+
+def analyze_file(path, start=None, end=None):
+    """Statistics of one log file, or of the records in [start, end) (worker task)"""
+    return analyze(read_games(path, start, end))
+
+def _chunks(paths, chunk_size):
+    """(path, start, end) tasks of about chunk_size bytes each"""
+    for path in paths:
+        parts = -(-os.path.getsize(path) // chunk_size)
+        for start, end in split_log(path, max(parts, 1)):
+            yield path, start, end
+
+def analyze_files(paths, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Analyze log files in parallel and merge the results
+
+    Each file is split into chunks of about chunk_size bytes on record
+    boundaries, so one big log keeps every worker busy.
+
+    Args:
+        paths (list): Replay log paths
+        workers (int): Worker processes, None for one per core, 1 to stay in-process
+        chunk_size (int): Approximate bytes of log per worker task
+
+    Returns:
+        GameStats: The merged aggregates
+    """
+    stats = GameStats()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or not paths:
+        for path in paths:
+            analyze(read_games(path), stats)
+    else:
+        tasks = list(_chunks(paths, chunk_size))
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            for partial in executor.map(analyze_file, *zip(*tasks)):
+                stats.merge(partial)
+    return stats
+
+def save_stats(stats, path):
+    """Write aggregates as JSON so they can be merged later"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stats.to_dict(), f)
+
+def load_stats(path):
+    """Read aggregates saved by save_stats"""
+    with open(path, encoding="utf-8") as f:
+        return GameStats.from_dict(json.load(f))
+
+def format_report(stats):
+    """Format the aggregates as a text report"""
+    lines = [f"Games: {stats.games:,}  |  Wins: {stats.wins:,}  |  Loss rate: {stats.loss_rate:.2%}"]
+
+    histogram = stats.attempts_to_win
+    if histogram.total:
+        lines.append("")
+        lines.append(f"Attempts to win: mean {histogram.mean:.2f}, "
+                     f"p50 {histogram.quantile(0.5)}, p90 {histogram.quantile(0.9)}, "
+                     f"p99 {histogram.quantile(0.99)}")
+        for attempts in sorted(histogram.counts):
+            share = histogram.counts[attempts] / histogram.total
+            lines.append(f"  {attempts:>3}  {share:>7.2%}  {'#' * round(share * 50)}")
+
+    lines.append("")
+    lines.append("Loss rate per range:")
+    for (min_number, max_number, max_attempts), (games, losses) in sorted(stats.ranges.items()):
+        label = f"{min_number}-{max_number}/{max_attempts}"
+        lines.append(f"  {label:>16}  {losses / games:>7.2%}  ({games:,} games)")
+
+    lines.append("")
+    lines.append("Hints vs outcome:")
+    for hints, (games, wins) in sorted(stats.hints.items()):
+        label = f"{hints}+" if hints == HINT_CAP else str(hints)
+        lines.append(f"  {label:>3} hints  win rate {wins / games:>7.2%}  ({games:,} games)")
+
+    first = stats.first_guess
+    if first.total:
+        lines.append("")
+        lines.append(f"First guess position (% of range): p10 {first.quantile(0.1)}, "
+                     f"p50 {first.quantile(0.5)}, p90 {first.quantile(0.9)}")
+        for decile in range(0, POSITION_BUCKETS, 10):
+            count = sum(first.counts.get(bucket, 0) for bucket in range(decile, decile + 10))
+            share = count / first.total
+            lines.append(f"  {decile:>2}-{decile + 9:<2}%  {share:>7.2%}  {'#' * round(share * 50)}")
+
+    return "\n".join(lines)
@@ -0,0 +1,40 @@
+"""Command line analytics over replay logs
+
+Examples:
+    python analyze.py ~/.local/share/number_guessing_game/replays.ngrl
+    python analyze.py logs/*.ngrl --workers 8 --save week.json
+    python analyze.py week1.json week2.json     # merge saved partial results
+"""
+
+import argparse
+import time
+
+from analytics import analyze_files, format_report, load_stats, save_stats
+from game_config import GameConfig
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Aggregate statistics over replay logs")
+    parser.add_argument("inputs", nargs="*", default=[GameConfig.REPLAY_LOG_PATH],
+                        help="replay logs (.ngrl) and/or saved results (.json)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes; logs are split into chunks of about 4 MB")
+    parser.add_argument("--save", metavar="PATH", help="also write the merged results as JSON")
+    args = parser.parse_args()
+
+    logs = [path for path in args.inputs if not path.endswith(".json")]
+    saved = [path for path in args.inputs if path.endswith(".json")]
+
+    start = time.perf_counter()
+    stats = analyze_files(logs, args.workers)
+    for path in saved:
+        stats.merge(load_stats(path))
+    elapsed = time.perf_counter() - start
+
+    print(format_report(stats))
+    print(f"\nAnalyzed {stats.games:,} games in {elapsed:.2f}s")
+    if args.save:
+        save_stats(stats, args.save)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Performance baselines for the game's hot paths
+
+Each benchmark times one small operation (input validation, history
+formatting, the optimal-guess helper, full headless games) and reports
+the best time per call over several repeats. Results can be saved as a
+JSON baseline; later runs are compared against it and any benchmark
+slower than the baseline by more than the threshold is flagged:
+
+    python benchmark.py --save            # record benchmark_baseline.json
+    python benchmark.py                   # compare, exit status 1 on regressions
+    python benchmark.py --filter validate --threshold 0.25
+
+Startup benchmarks run fresh interpreters: import_* parses the
+cumulative import time of a module from "python -X importtime", and
+first_frame is the wall time from spawning "python" until the game window
+has drawn its first frame (skipped without a display).
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+from engine import GameEngine, simulate
+from utils import (validate_number_input, validate_many, validate_array,
+                   format_history_entry, calculate_optimal_guess, RangeTracker)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(PACKAGE_DIR, "benchmark_baseline.json")
+
+# A benchmark is slower than its baseline when it takes more than
+# (1 + threshold) times as long; below ~20% shared machines are too noisy
+DEFAULT_THRESHOLD = 0.20
+
+# === BENCHMARKS ===
+
+def _history(length):
+    """A consistent history of length "Too Low" guesses"""
+    return [(guess, "Too Low") for guess in range(1, length + 1)]
+
+def _optimal_guess(length, with_tracker=False):
+    history = _history(length)
+    if not with_tracker:
+        return lambda: calculate_optimal_guess(history, 1, 10**6)
+    tracker = RangeTracker(1, 10**6)
+    for guess, feedback in history:
+        tracker.update(guess, feedback)
+    return lambda: calculate_optimal_guess(history, 1, 10**6, tracker=tracker)
+
+def _bulk_inputs(count=10_000):
+    """Mixed bot traffic: mostly valid guesses, some junk and out-of-range"""
+    inputs = [str(number % 150) for number in range(count)]
+    inputs[::7] = ["abc"] * len(inputs[::7])
+    return inputs
+
+def _validate_many():
+    inputs = _bulk_inputs()
+    return lambda: sum(1 for _ in validate_many(inputs, 1, 100))
+
+def _validate_array():
+    inputs = _bulk_inputs()
+    return lambda: validate_array(inputs, 1, 100)
+
+def _engine_game():
+    engine = GameEngine(1, 100, 10)
+
+    def play():
+        engine.new_game(target=73)
+        tracker = engine.tracker
+        while engine.game_active:
+            engine.guess(tracker.midpoint())
+    return play
+
+def _headless_window_game():
+    """One auto-played game through the Tk window code on headless_tk"""
+    import atexit
+    import shutil
+    import tempfile
+    import solution
+
+    # The Tk stand-in ships with the tests
+    tests_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests")
+    if tests_dir not in sys.path:
+        sys.path.insert(0, tests_dir)
+    import headless_tk
+
+    data_dir = tempfile.mkdtemp()
+    config_path = os.path.join(data_dir, "config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({"scores_db_path": os.path.join(data_dir, "scores.db"),
+                   "replay_log_path": os.path.join(data_dir, "replays.ngrl"),
+                   "history_spill_dir": data_dir}, f)
+    fake = headless_tk.install()
+    try:
+        root = fake.Tk()
+        game = solution.NumberGuessingGame(root, config_path)
+    finally:
+        headless_tk.uninstall()
+    atexit.register(shutil.rmtree, data_dir, ignore_errors=True)
+    atexit.register(game.close_stores)
+
+    def play():
+        game.new_game()
+        while game.game_active:
+            game.auto_play_step()
+        root.update()
+    play.stats = game.view.stats  # Widget calls requested vs. sent to Tcl
+    return play
+
+def widget_call_stats(games=20):
+    """
+    Widget calls of games auto-played through the window (see view_model)
+
+    Returns:
+        view_model.UpdateStats: Calls requested by the game vs. sent to Tcl
+    """
+    play = _headless_window_game()
+    for _ in range(games):
+        play()
+    return play.stats
+
+# name -> factory returning the zero-argument function to time
+BENCHMARKS = {
+    'validate_valid': lambda: lambda: validate_number_input("57", 1, 100),
+    'validate_out_of_range': lambda: lambda: validate_number_input("1000", 1, 100),
+    'validate_not_a_number': lambda: lambda: validate_number_input("abc", 1, 100),
+    'validate_empty': lambda: lambda: validate_number_input("   ", 1, 100),
+    'validate_huge': lambda: (lambda text=("9" * 4000): validate_number_input(text, 1, 100)),
+    'validate_many_10k': _validate_many,
+    'validate_array_10k': _validate_array,
+    'format_history_entry': lambda: lambda: format_history_entry(3, 45, "Too High"),
+    'optimal_guess_history_0': lambda: _optimal_guess(0),
+    'optimal_guess_history_10': lambda: _optimal_guess(10),
+    'optimal_guess_history_100': lambda: _optimal_guess(100),
+    'optimal_guess_history_1000': lambda: _optimal_guess(1000),
+    'optimal_guess_tracker_1000': lambda: _optimal_guess(1000, with_tracker=True),
+    'engine_full_game': _engine_game,
+    'window_headless_game': _headless_window_game,
+    'simulate_100_games': lambda: lambda: simulate(calculate_optimal_guess, 100, seed=1),
+}
+
+# === STARTUP ===
+
+def parse_importtime(text):
+    """
+    Parse the stderr of "python -X importtime"
+
+    Args:
+        text (str): Output with "import time: self | cumulative | module" lines
+
+    Returns:
+        dict: {module: (self seconds, cumulative seconds)}
+    """
+    times = {}
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        times[fields[2].strip()] = (int(fields[0]) / 1e6, int(fields[1]) / 1e6)
+    return times
+
+def import_time(module, repeat=5):
+    """
+    Best cumulative import time of module in a fresh interpreter
+
+    Returns:
+        float: Seconds
+    """
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                cwd=PACKAGE_DIR, capture_output=True, text=True, check=True)
+        seconds = parse_importtime(result.stderr)[module][1]
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+# Child process for first_frame: builds the window with throwaway data
+# files, draws it once, reports and exits without entering the main loop
+FIRST_FRAME_SCRIPT = """
+import os, shutil, tempfile
+from game_config import GameConfig
+data_dir = tempfile.mkdtemp()
+GameConfig.CONFIG_PATH = os.path.join(data_dir, "config.yaml")
+GameConfig.SCORES_DB_PATH = os.path.join(data_dir, "scores.db")
+GameConfig.REPLAY_LOG_PATH = os.path.join(data_dir, "replays.ngrl")
+GameConfig.HISTORY_SPILL_DIR = data_dir
+import solution
+root, game = solution.create_window()
+root.update()
+print("frame", flush=True)
+game.close_stores()
+root.destroy()
+shutil.rmtree(data_dir, ignore_errors=True)
+"""
+
+def first_frame_time(repeat=5):
+    """
+    Best wall time from interpreter launch to the first drawn game window
+
+    Returns:
+        float: Seconds, None if no window can be opened (e.g. no display)
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        child = subprocess.Popen([sys.executable, "-c", FIRST_FRAME_SCRIPT], cwd=PACKAGE_DIR,
+                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        line = child.stdout.readline()
+        seconds = time.perf_counter() - start
+        child.communicate()
+        if line.strip() != "frame":
+            return None
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+# name -> function(repeat) returning seconds, or None when unavailable
+STARTUP_BENCHMARKS = {
+    'import_utils': lambda repeat: import_time("utils", repeat),
+    'import_engine': lambda repeat: import_time("engine", repeat),
+    'import_config_loader': lambda repeat: import_time("config_loader", repeat),
+    'import_session': lambda repeat: import_time("session", repeat),
+    'import_solution': lambda repeat: import_time("solution", repeat),
+    'import_tui': lambda repeat: import_time("tui", repeat),
+    'first_frame': first_frame_time,
+}
+
+# === RUNNER ===
+
+def time_call(func, repeat=5, min_time=0.2):
+    """
+    Best time per call of func
+
+    Args:
+        func (callable): Function without arguments
+        repeat (int): Timing rounds; the fastest one counts
+        min_time (float): Seconds each round runs at least
+
+    Returns:
+        float: Seconds per call
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / 10 or number >= 10**7:
+            break
+        number *= 10
+    number = max(1, int(number * (min_time / max(elapsed, 1e-9))))
+    return min(timer.repeat(repeat, number)) / number
+
+def run_benchmarks(names=None, repeat=5, min_time=0.2):
+    """
+    Run the selected benchmarks
+
+    Args:
+        names (list): Keys of BENCHMARKS or STARTUP_BENCHMARKS, None for all
+        repeat (int): Timing rounds per benchmark
+        min_time (float): Seconds per round
+
+    Returns:
+        dict: {name: seconds per call}; startup benchmarks that cannot
+            run here are left out
+    """
+    results = {}
+    for name in names or list(BENCHMARKS) + list(STARTUP_BENCHMARKS):
+        if name in STARTUP_BENCHMARKS:
+            seconds = STARTUP_BENCHMARKS[name](repeat)
+            if seconds is not None:
+                results[name] = seconds
+        else:
+            results[name] = time_call(BENCHMARKS[name](), repeat, min_time)
+    return results
+
+# === BASELINES ===
+
+def save_baseline(results, path=DEFAULT_BASELINE):
+    """Write results with the interpreter and machine they came from"""
+    data = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+def load_baseline(path=DEFAULT_BASELINE):
+    """
+    Returns:
+        dict: {name: seconds per call}, empty if there is no baseline
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)['results']
+    except FileNotFoundError:
+        return {}
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare results with a baseline
+
+    Returns:
+        list: (name, baseline or None, current, ratio or None, regressed) tuples
+    """
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        ratio = current / base if base else None
+        rows.append((name, base, current, ratio, ratio is not None and ratio > 1 + threshold))
+    return rows
+
+def _format_time(seconds):
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def format_comparison(rows, threshold=DEFAULT_THRESHOLD):
+    """Format compare() rows as a table"""
+    lines = [f"{'Benchmark':<28} {'Baseline':>10} {'Current':>10} {'Change':>8}",
+             "-" * 60]
+    for name, base, current, ratio, regressed in rows:
+        change = f"{ratio - 1:+.1%}" if ratio is not None else "new"
+        flag = f"  <-- slower than {1 + threshold:.2f}x" if regressed else ""
+        lines.append(f"{name:<28} {_format_time(base):>10} {_format_time(current):>10} "
+                     f"{change:>8}{flag}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (default 0.20)")
+    parser.add_argument("--filter", default="", help="only benchmarks containing this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    names = [name for name in list(BENCHMARKS) + list(STARTUP_BENCHMARKS) if args.filter in name]
+    baseline = load_baseline(args.baseline)
+    results = run_benchmarks(names, args.repeat, args.min_time)
+    rows = compare(results, baseline, args.threshold)
+    print(format_comparison(rows, args.threshold))
+    if 'window_headless_game' in names:
+        print(f"\nWindow widget calls: {widget_call_stats()}")
+
+    if args.save:
+        # Benchmarks left out by --filter keep their old baseline
+        baseline.update(results)
+        save_baseline(baseline, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    return 1 if any(row[4] for row in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
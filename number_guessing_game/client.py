@@ -0,0 +1,194 @@
+"""Line protocol client and load generator for the guessing server
+
+The load generator opens many concurrent connections, plays binary
+search games on each and reports guess latency percentiles and
+throughput. See server.py for the protocol.
+"""
+
+import argparse
+import asyncio
+import time
+
+from server import GuessingServer, DEFAULT_HOST, DEFAULT_PORT
+from utils import RangeTracker
+
+class GuessingClient:
+    """One connection to a GuessingServer"""
+
+    def __init__(self, reader, writer, min_number, max_number, max_attempts, session_id=None):
+        self.reader = reader
+        self.writer = writer
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.session_id = session_id
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Open a connection and read the server's greeting"""
+        reader, writer = await asyncio.open_connection(host, port)
+        greeting = (await reader.readline()).decode().split()
+        if not greeting or greeting[0] != "WELCOME":
+            writer.close()
+            raise ConnectionError(" ".join(greeting) or "connection closed")
+        min_number, max_number, max_attempts = (int(word) for word in greeting[1:4])
+        session_id = int(greeting[4]) if len(greeting) > 4 else None
+        return cls(reader, writer, min_number, max_number, max_attempts, session_id)
+
+    async def request(self, line):
+        """
+        Send one command and wait for its response
+
+        Returns:
+            list: Response split into words, e.g. ["HIGH", "3"]
+        """
+        self.writer.write(line.encode() + b"\n")
+        await self.writer.drain()
+        response = await self.reader.readline()
+        if not response:
+            raise ConnectionError("connection closed")
+        return response.decode().split()
+
+    async def new_game(self):
+        return await self.request("NEW")
+
+    async def guess(self, number):
+        return await self.request(f"GUESS {number}")
+
+    async def hint(self):
+        return await self.request("HINT")
+
+    async def close(self):
+        try:
+            await self.request("QUIT")
+        except ConnectionError:
+            pass
+        self.writer.close()
+        await self.writer.wait_closed()
+
+# === LOAD GENERATOR ===
+
+async def play_games(client, games, latencies):
+    """One simulated player: binary search through several games"""
+    tracker = RangeTracker(client.min_number, client.max_number)
+    clock = time.perf_counter
+
+    for _ in range(games):
+        await client.new_game()
+        tracker.reset()
+        while True:
+            guess = tracker.midpoint()
+            sent = clock()
+            response = await client.guess(guess)
+            latencies.append(clock() - sent)
+
+            kind = response[0]
+            if kind == "HIGH":
+                tracker.update(guess, "Too High")
+            elif kind == "LOW":
+                tracker.update(guess, "Too Low")
+            else:
+                break
+
+    await client.close()
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+def _raise_open_files_limit(needed):
+    """
+    Allow enough sockets for the requested number of players
+
+    Returns:
+        bool: False if the hard limit is below what is needed
+    """
+    try:
+        import resource
+    except ImportError:
+        return True  # Not available on Windows
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+    return wanted >= needed
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, players=10_000, games=5,
+                   connect_batch=500):
+    """
+    Drive many concurrent players against a server
+
+    Args:
+        host (str): Server host
+        port (int): Server port
+        players (int): Concurrent connections
+        games (int): Games played by each player
+        connect_batch (int): Players connecting at once (avoids SYN floods)
+
+    Returns:
+        dict: players, guesses, seconds, guesses_per_second, p50_ms, p99_ms
+    """
+    # Connect everyone first so the measurement covers only guessing
+    clients = []
+    for first in range(0, players, connect_batch):
+        batch = min(connect_batch, players - first)
+        clients += await asyncio.gather(
+            *(GuessingClient.connect(host, port) for _ in range(batch)))
+
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(play_games(client, games, latencies) for client in clients))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'players': players,
+        'guesses': len(latencies),
+        'seconds': elapsed,
+        'guesses_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+async def run_local_load(players, games):
+    """Start an in-process server on a free port and load it"""
+    server = GuessingServer(max_sessions=players + 1)
+    port = await server.start(DEFAULT_HOST, 0)
+    try:
+        return await run_load(DEFAULT_HOST, port, players, games)
+    finally:
+        await server.stop()
+
+def format_load_report(stats):
+    """Format the load generator's statistics"""
+    return (f"{stats['players']} players, {stats['guesses']} guesses in {stats['seconds']:.2f}s\n"
+            f"  Throughput: {stats['guesses_per_second']:,.0f} guesses/s\n"
+            f"  Latency:    p50 {stats['p50_ms']:.2f} ms  |  p99 {stats['p99_ms']:.2f} ms")
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Number Guessing Game load generator")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--games", type=int, default=5, help="games per player")
+    parser.add_argument("--local", action="store_true",
+                        help="start an in-process server instead of connecting to one")
+    args = parser.parse_args()
+
+    # Each player needs a socket, and a second one for the local server side
+    sockets = args.players * (2 if args.local else 1) + 64
+    if not _raise_open_files_limit(sockets):
+        parser.error(f"open file limit too low for {args.players} players "
+                     f"(need {sockets}, raise it with ulimit -n)")
+    if args.local:
+        stats = asyncio.run(run_local_load(args.players, args.games))
+    else:
+        stats = asyncio.run(run_load(args.host, args.port, args.players, args.games))
+    print(format_load_report(stats))
+
+if __name__ == "__main__":
+    main()
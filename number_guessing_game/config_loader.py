@@ -0,0 +1,354 @@
+"""External, hot-reloadable game configuration
+
+GameConfig holds the defaults. A YAML or JSON file can override any of
+them, using the attribute names in lower case; dictionaries (colors,
+fonts, messages, hints) are merged key by key:
+
+    min_number: 1
+    max_number: 1000
+    max_attempts: 12
+    data_dir: /var/games/guessing   # scores, replays and spill files go here
+    colors:
+      error: "#c0392b"
+
+load_config() validates the file and compiles it into a CompiledConfig:
+an immutable, slotted object that also carries everything derived from
+the settings (feedback messages with their colors, the attempt counter
+colors, messages with the range already filled in), so nothing is
+formatted or looked up per guess. ConfigWatcher polls the file's mtime
+and hands out a new CompiledConfig when it changes; the game swaps it in
+between rounds.
+"""
+
+import os
+import time
+from types import MappingProxyType
+
+from game_config import GameConfig
+from engine import CORRECT, TOO_HIGH, TOO_LOW
+from utils import VALID, EMPTY, NOT_A_NUMBER, OUT_OF_RANGE, difficulty_key
+
+# Seconds between two stat() calls of ConfigWatcher.poll()
+DEFAULT_POLL_INTERVAL = 1.0
+
+class ConfigError(ValueError):
+    """The configuration file is unreadable or has invalid settings"""
+
+# === SCHEMA ===
+
+# setting -> kind; dictionary settings list the keys they accept
+SETTINGS = {
+    'min_number': 'int',
+    'max_number': 'int',
+    'max_attempts': 'int',
+    'random_seed': 'seed',
+    'player_name': 'str',
+    'data_dir': 'str',
+    'scores_db_path': 'str',
+    'replay_log_path': 'str',
+    'history_capacity': 'int',
+    'history_spill_dir': 'str',
+    'window_width': 'int',
+    'window_height': 'int',
+    'background_color': 'str',
+    'colors': 'colors',
+    'fonts': 'fonts',
+    'messages': 'messages',
+    'hints': 'hints',
+}
+
+# Template -> example arguments; every template must format with them
+TEMPLATE_ARGS = {
+    'game_over': (42,),
+    'invalid_input': (1, 100),
+    'out_of_range': (1, 100),
+    'range': (1, 100, 100),
+    'single': (42,),
+    'suggestion': (50, 5.8),
+    'odds': (0.5, 3),
+}
+
+# File setting -> name under data_dir, used when only data_dir is given
+# ("" for the directory itself)
+DATA_FILES = {
+    'scores_db_path': "scores.db",
+    'replay_log_path': "replays.ngrl",
+    'history_spill_dir': "",
+}
+
+def _defaults():
+    """GameConfig as a plain dict of lower-case settings"""
+    settings = {}
+    for name in SETTINGS:
+        value = getattr(GameConfig, name.upper())
+        settings[name] = dict(value) if isinstance(value, dict) else value
+    return settings
+
+def _check_value(name, kind, value):
+    """
+    Validate one setting
+
+    Returns:
+        The value in the form the game uses (fonts become tuples)
+    """
+    if kind == 'int':
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ConfigError(f"{name} must be an integer, got {value!r}")
+        return value
+    if kind == 'seed':
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ConfigError(f"{name} must be an integer or null, got {value!r}")
+        return value
+    if kind == 'str':
+        if not isinstance(value, str) or not value:
+            raise ConfigError(f"{name} must be a non-empty string, got {value!r}")
+        return value
+    if not isinstance(value, dict):
+        raise ConfigError(f"{name} must be a mapping, got {value!r}")
+
+    default = getattr(GameConfig, name.upper())
+    checked = {}
+    for key, item in value.items():
+        if key not in default:
+            raise ConfigError(f"unknown key {name}.{key}")
+        if kind == 'fonts':
+            if (not isinstance(item, (list, tuple)) or not 2 <= len(item) <= 3
+                    or not isinstance(item[0], str) or not isinstance(item[1], int)):
+                raise ConfigError(f"{name}.{key} must be [family, size] or "
+                                  f"[family, size, style], got {item!r}")
+            checked[key] = tuple(item)
+        else:
+            checked[key] = _check_value(f"{name}.{key}", 'str', item)
+            if key in TEMPLATE_ARGS:
+                try:
+                    item.format(*TEMPLATE_ARGS[key])
+                except Exception as e:
+                    # Field access can fail in any way, e.g. "{0.real.x}"
+                    raise ConfigError(f"{name}.{key} is not a valid template: {e}") from None
+    return checked
+
+def validate_settings(overrides):
+    """
+    Merge overrides into the defaults and check the result
+
+    Args:
+        overrides (dict): Lower-case settings, e.g. parsed from a file
+
+    Returns:
+        dict: Complete settings
+
+    Raises:
+        ConfigError: Unknown settings, wrong types or inconsistent values
+    """
+    if not isinstance(overrides, dict):
+        raise ConfigError("configuration must be a mapping of settings")
+    settings = _defaults()
+    for name, value in overrides.items():
+        kind = SETTINGS.get(name)
+        if kind is None:
+            raise ConfigError(f"unknown setting {name!r}")
+        value = _check_value(name, kind, value)
+        if isinstance(value, dict):
+            settings[name].update(value)
+        else:
+            settings[name] = value
+
+    # A moved data_dir takes along every file not placed on its own
+    if 'data_dir' in overrides:
+        data_dir = settings['data_dir']
+        for name, file_name in DATA_FILES.items():
+            if name not in overrides:
+                settings[name] = os.path.join(data_dir, file_name) if file_name else data_dir
+
+    if settings['min_number'] >= settings['max_number']:
+        raise ConfigError("min_number must be smaller than max_number")
+    for name in ('max_attempts', 'history_capacity', 'window_width', 'window_height'):
+        if settings[name] < 1:
+            raise ConfigError(f"{name} must be at least 1")
+    return settings
+
+# === COMPILED CONFIG ===
+
+class CompiledConfig:
+    """
+    Immutable settings plus the values derived from them
+
+    Attributes are the lower-case GameConfig names (dictionaries become
+    read-only mappings), and:
+        feedback: {feedback string: (message, color)} for show_feedback
+        invalid_messages: {validation status: message}, range filled in
+        welcome, not_started: (message, color) pairs
+        range_text, geometry, difficulty: Strings for the window
+    """
+
+    __slots__ = tuple(SETTINGS) + ('source', 'feedback', 'invalid_messages', 'welcome',
+                                   'not_started', 'range_text', 'geometry', 'difficulty',
+                                   '_attempt_colors')
+
+    def __init__(self, settings, source=None):
+        """
+        Args:
+            settings (dict): Complete, validated settings (validate_settings)
+            source (str): File the settings came from, None for the defaults
+        """
+        assign = object.__setattr__
+        for name in SETTINGS:
+            value = settings[name]
+            assign(self, name, MappingProxyType(dict(value)) if isinstance(value, dict) else value)
+        assign(self, 'source', source)
+
+        colors, messages = self.colors, self.messages
+        lo, hi = self.min_number, self.max_number
+        assign(self, 'feedback', MappingProxyType({
+            CORRECT: (messages['correct'], colors['success']),
+            TOO_HIGH: (messages['too_high'], colors['error']),
+            TOO_LOW: (messages['too_low'], colors['error']),
+        }))
+        assign(self, 'invalid_messages', MappingProxyType({
+            VALID: "",
+            EMPTY: messages['empty'],
+            NOT_A_NUMBER: messages['not_a_number'],
+            OUT_OF_RANGE: messages['out_of_range'].format(lo, hi),
+        }))
+        assign(self, 'welcome', (messages['welcome'], colors['warning']))
+        assign(self, 'not_started', (messages['not_started'], colors['info']))
+        assign(self, 'range_text', f"🎲 Guess a number between {lo} and {hi}")
+        assign(self, 'geometry', f"{self.window_width}x{self.window_height}")
+        assign(self, 'difficulty', difficulty_key(lo, hi, self.max_attempts))
+        # Counter color by attempts left: red up to 2, orange up to 5
+        assign(self, '_attempt_colors', (colors['error'],) * 3 + (colors['warning'],) * 3)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledConfig is immutable; load a new one instead")
+
+    __delattr__ = __setattr__
+
+    def attempt_color(self, remaining):
+        """Color of the attempt counter with remaining attempts left"""
+        if remaining < len(self._attempt_colors):
+            return self._attempt_colors[remaining]
+        return self.colors['success']
+
+    def game_over(self, target):
+        """Game over message revealing target"""
+        return self.messages['game_over'].format(target)
+
+    def same_game(self, other):
+        """True if other plays the same range and number of attempts"""
+        return self.difficulty == other.difficulty
+
+def compile_config(overrides=None, source=None):
+    """
+    Validate and compile settings
+
+    Args:
+        overrides (dict): Settings to change from GameConfig, None for none
+        source (str): Where the overrides came from
+
+    Returns:
+        CompiledConfig: The compiled configuration
+    """
+    return CompiledConfig(validate_settings(overrides or {}), source)
+
+# === FILES ===
+
+def load_config(path):
+    """
+    Load a YAML (.yaml/.yml, needs PyYAML) or JSON configuration file
+
+    Args:
+        path (str): Configuration file
+
+    Returns:
+        CompiledConfig: The compiled configuration
+
+    Raises:
+        ConfigError: The file cannot be read, parsed or validated
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except OSError as e:
+        raise ConfigError(f"cannot read {path}: {e}") from None
+
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ConfigError("PyYAML is required for YAML configuration files") from None
+        try:
+            overrides = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ConfigError(f"{path}: {e}") from None
+    else:
+        import json
+        try:
+            overrides = json.loads(text)
+        except ValueError as e:
+            raise ConfigError(f"{path}: {e}") from None
+
+    try:
+        # An empty file keeps every default
+        return compile_config(overrides or {}, source=path)
+    except ConfigError as e:
+        raise ConfigError(f"{path}: {e}") from None
+
+class ConfigWatcher:
+    """
+    Reloads a configuration file when it changes
+
+    poll() costs one stat() call at most every interval seconds. A file
+    that is missing gives the defaults; a file that fails to load keeps
+    the previous configuration and sets error.
+    """
+
+    def __init__(self, path, interval=DEFAULT_POLL_INTERVAL):
+        """
+        Args:
+            path (str): Configuration file to watch
+            interval (float): Minimum seconds between two checks
+        """
+        self.path = path
+        self.interval = interval
+        self.error = None
+        self._stamp = None
+        self._checked = None
+        self.config = compile_config()
+        self.poll(force=True)
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self, force=False):
+        """
+        Check the file and reload it if it changed
+
+        Args:
+            force (bool): Check even if the interval has not passed
+
+        Returns:
+            CompiledConfig: The new configuration, or None if nothing changed
+        """
+        now = time.monotonic()
+        if not force and self._checked is not None and now - self._checked < self.interval:
+            return None
+        self._checked = now
+
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return None
+        self._stamp = stamp
+
+        try:
+            config = compile_config() if stamp is None else load_config(self.path)
+        except ConfigError as e:
+            self.error = e
+            return None
+        self.error = None
+        # One reference assignment: readers see the old or the new config
+        self.config = config
+        return config
@@ -0,0 +1,299 @@
+"""Headless game engine for the Number Guessing Game
+
+The engine owns all of the game rules (target, attempts, history and
+win/loss state) and never touches tkinter, so the same code path drives
+the Tk window, the tests and bulk simulations.
+"""
+
+import random
+
+from rng import RandomStreams
+from game_config import GameConfig
+from utils import generate_random_number, RangeTracker
+
+# Feedback strings shared by the engine, the GUI and the helpers in utils
+CORRECT = "Correct!"
+TOO_HIGH = "Too High"
+TOO_LOW = "Too Low"
+
+# Compact feedback codes (fit in 2 bits) for sessions and binary logs
+CODE_CORRECT = 0
+CODE_TOO_HIGH = 1
+CODE_TOO_LOW = 2
+FEEDBACK_BY_CODE = (CORRECT, TOO_HIGH, TOO_LOW)
+CODE_BY_FEEDBACK = {CORRECT: CODE_CORRECT, TOO_HIGH: CODE_TOO_HIGH, TOO_LOW: CODE_TOO_LOW}
+
+
+def calculate_feedback(guess, target):
+    """
+    Generate feedback based on guess comparison
+
+    Args:
+        guess (int): Player's guess
+        target (int): Target number
+
+    Returns:
+        str: Feedback message ("Too High", "Too Low", or "Correct!")
+    """
+    if guess == target:
+        return CORRECT
+    elif guess > target:
+        return TOO_HIGH
+    else:
+        return TOO_LOW
+
+
+def adversarial_feedback(guess, lo, hi, rng):
+    """
+    Answer a guess without a fixed target (adversarial "lazy target" mode)
+
+    The target is only known to lie in [lo, hi]. The answer keeps the
+    larger of the two consistent sub-ranges alive, with ties broken by
+    rng, and is "Correct!" only when a single candidate is left. Every
+    answer therefore agrees with calculate_feedback for any target still
+    in the returned range, and no strategy can win in fewer guesses than
+    its worst case.
+
+    Args:
+        guess (int): The number guessed
+        lo (int): Smallest remaining candidate
+        hi (int): Largest remaining candidate
+        rng (random.Random): Tie breaker
+
+    Returns:
+        tuple: (feedback code, new lo, new hi)
+    """
+    if guess < lo:
+        return CODE_TOO_LOW, lo, hi
+    if guess > hi:
+        return CODE_TOO_HIGH, lo, hi
+    below = guess - lo
+    above = hi - guess
+    if below == above == 0:
+        return CODE_CORRECT, guess, guess
+    if below > above or (below == above and rng.random() < 0.5):
+        return CODE_TOO_HIGH, lo, guess - 1
+    return CODE_TOO_LOW, guess + 1, hi
+
+
+def verify_history(guess_history, target):
+    """
+    Check a game's answers against calculate_feedback
+
+    Args:
+        guess_history (list): (guess, feedback) tuples
+        target (int): The target revealed at the end of the game
+
+    Returns:
+        bool: True if every answer is the one a fixed target would give
+    """
+    return all(calculate_feedback(guess, target) == feedback
+               for guess, feedback in guess_history)
+
+
+class GameEngine:
+    """Pure-Python game state machine for one player"""
+
+    def __init__(self, min_number=GameConfig.MIN_NUMBER,
+                 max_number=GameConfig.MAX_NUMBER,
+                 max_attempts=GameConfig.MAX_ATTEMPTS,
+                 adversarial=False, rng=None, history=None):
+        """
+        Initialize the engine with a game configuration
+
+        Args:
+            min_number (int): Smallest possible target (inclusive)
+            max_number (int): Largest possible target (inclusive)
+            max_attempts (int): Guesses allowed per game
+            adversarial (bool): Answer with adversarial_feedback instead of
+                drawing a target; the target is fixed when the game ends
+            rng (random.Random): Source of targets and adversarial tie breaks,
+                e.g. RandomStreams(seed).stream(...) to replay a session
+            history: Container for guess_history with append and clear
+                (e.g. history.GuessHistory), None for a plain list
+        """
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.adversarial = adversarial
+        self.rng = rng if rng is not None else random.Random()
+
+        # Game state variables
+        self.target_number = 0
+        self.attempts = 0
+        self.game_active = False
+        self.won = False
+        self.guess_history = history if history is not None else []
+        self.tracker = RangeTracker(min_number, max_number)
+
+    def configure(self, min_number, max_number, max_attempts):
+        """
+        Change the range and attempts (between rounds; the current round stops)
+
+        Args:
+            min_number (int): Smallest possible target (inclusive)
+            max_number (int): Largest possible target (inclusive)
+            max_attempts (int): Guesses allowed per game
+        """
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.tracker = RangeTracker(min_number, max_number)
+        self.stop()
+
+    def new_game(self, target=None):
+        """
+        Start a new round
+
+        Args:
+            target (int): Fixed target number, or None to draw a random one
+                (ignored in adversarial mode, where it stays None until the end)
+        """
+        if self.adversarial:
+            target = None
+        elif target is None:
+            target = generate_random_number(self.min_number, self.max_number, self.rng)
+        self.target_number = target
+        self.attempts = 0
+        self.won = False
+        self.guess_history.clear()
+        self.tracker.reset()
+        self.game_active = True
+
+    def guess(self, number):
+        """
+        Play one validated guess
+
+        Args:
+            number (int): The number guessed
+
+        Returns:
+            str: Feedback for the guess, or None if no game is active
+        """
+        if not self.game_active:
+            return None
+
+        self.attempts += 1
+        tracker = self.tracker
+        if self.adversarial:
+            # The tracker's interval is the whole adversary state
+            code, _, _ = adversarial_feedback(number, tracker.lo, tracker.hi, self.rng)
+            feedback = FEEDBACK_BY_CODE[code]
+        else:
+            feedback = calculate_feedback(number, self.target_number)
+        self.guess_history.append((number, feedback))
+        tracker.update(number, feedback)
+
+        if feedback == CORRECT:
+            self.won = True
+            self.game_active = False
+        elif self.attempts >= self.max_attempts:
+            self.game_active = False
+
+        if self.adversarial and not self.game_active:
+            # Commit to a target consistent with every answer given
+            self.target_number = number if self.won else self.rng.randint(tracker.lo, tracker.hi)
+
+        return feedback
+
+    @property
+    def lost(self):
+        """True once the attempts ran out without a correct guess"""
+        return not self.game_active and not self.won and self.attempts >= self.max_attempts
+
+    @property
+    def remaining_attempts(self):
+        """Number of guesses left in the current round"""
+        return self.max_attempts - self.attempts
+
+    def stop(self):
+        """End the current round without a result (used by reset)"""
+        self.target_number = 0
+        self.attempts = 0
+        self.won = False
+        self.guess_history.clear()
+        self.tracker.reset()
+        self.game_active = False
+
+
+class SimulationResult:
+    """Aggregated outcome of a batch of simulated games"""
+
+    def __init__(self, max_attempts):
+        self.games = 0
+        self.wins = 0
+        # attempts_histogram[n] = games won on the n-th guess
+        self.attempts_histogram = [0] * (max_attempts + 1)
+
+    @property
+    def losses(self):
+        return self.games - self.wins
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def average_attempts(self):
+        """Mean number of guesses over the games that were won"""
+        if not self.wins:
+            return 0.0
+        total = sum(n * count for n, count in enumerate(self.attempts_histogram))
+        return total / self.wins
+
+    def merge(self, other):
+        """Add the counts of another result into this one"""
+        self.games += other.games
+        self.wins += other.wins
+        for n, count in enumerate(other.attempts_histogram):
+            self.attempts_histogram[n] += count
+        return self
+
+
+def simulate(strategy, n_games, seed=None,
+             min_number=GameConfig.MIN_NUMBER,
+             max_number=GameConfig.MAX_NUMBER,
+             max_attempts=GameConfig.MAX_ATTEMPTS,
+             adversarial=False):
+    """
+    Play many headless games with a guessing strategy
+
+    Every game is played through one GameEngine, so simulations answer
+    guesses with exactly the code the GUI, the TUI and the server use.
+
+    Args:
+        strategy (callable): Called as strategy(guesses_history, min_val, max_val)
+            like utils.calculate_optimal_guess, returns the next guess
+        n_games (int): Number of games to play
+        seed (int): Root seed of the RandomStreams drawing the targets,
+            None for a random seed
+        min_number (int): Smallest possible target (inclusive)
+        max_number (int): Largest possible target (inclusive)
+        max_attempts (int): Guesses allowed per game
+        adversarial (bool): Play against adversarial_feedback instead of
+            random targets (the seed then drives the tie breaks)
+
+    Returns:
+        SimulationResult: Win count and attempts histogram
+    """
+    engine = GameEngine(min_number, max_number, max_attempts,
+                        adversarial=adversarial,
+                        rng=RandomStreams(seed).stream("simulate"))
+    history = engine.guess_history
+    new_game = engine.new_game
+    guess = engine.guess
+    result = SimulationResult(max_attempts)
+    histogram = result.attempts_histogram
+    wins = 0
+
+    for _ in range(n_games):
+        new_game()
+        while engine.game_active:
+            guess(strategy(history, min_number, max_number))
+        if engine.won:
+            histogram[engine.attempts] += 1
+            wins += 1
+
+    result.games = n_games
+    result.wins = wins
+    return result
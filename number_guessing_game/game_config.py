@@ -1,5 +1,7 @@
 """Configuration constants for the Number Guessing Game"""
 
+import os
+
 class GameConfig:
     """Configuration constants for the game"""
     
@@ -7,6 +9,17 @@ class GameConfig:
     MIN_NUMBER = 1
     MAX_NUMBER = 100
     MAX_ATTEMPTS = 10
+    RANDOM_SEED = None  # Set to an int to replay the same target numbers
+    
+    # Player & Persistence
+    PLAYER_NAME = "Player"
+    DATA_DIR = os.path.join(os.path.expanduser("~"), ".local", "share", "number_guessing_game")
+    SCORES_DB_PATH = os.path.join(DATA_DIR, "scores.db")
+    REPLAY_LOG_PATH = os.path.join(DATA_DIR, "replays.ngrl")
+    HISTORY_CAPACITY = 1000  # Guesses kept in memory; older ones spill to disk
+    HISTORY_SPILL_DIR = DATA_DIR  # Each history spills to its own temporary file here
+    CONFIG_PATH = os.path.join(DATA_DIR, "config.yaml")  # Overrides, reloaded between rounds
+    TABLE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "number_guessing_game")
     
     # UI Settings
     WINDOW_WIDTH = 500
@@ -39,7 +52,9 @@ class GameConfig:
         'game_over': '💀 Game Over! The number was {}',
         'invalid_input': '❌ Please enter a valid number between {} and {}!',
         'out_of_range': '❌ Number must be between {} and {}!',
-        'not_a_number': '❌ Please enter a valid number!'
+        'not_a_number': '❌ Please enter a valid number!',
+        'empty': '❌ Please enter a number!',
+        'not_started': '🎮 Click \'New Game\' to start!'
     }
     
     # Hints
@@ -47,5 +62,9 @@ class GameConfig:
         'first_guess': 'Start with 50 - it\'s right in the middle!',
         'strategy': 'Think about the pattern in your guesses',
         'range_tip': 'Try the middle of the remaining range',
-        'encouragement': 'You\'re getting closer! Keep trying!'
+        'encouragement': 'You\'re getting closer! Keep trying!',
+        'range': '🎯 The number is between {} and {} ({:,} candidates left)',
+        'single': '🎯 It can only be {}!',
+        'suggestion': '🎲 Try {} (about {:.1f} more guesses expected)',
+        'odds': '🏆 {:.0%} chance to win with your {} attempts left'
     }
\ No newline at end of file
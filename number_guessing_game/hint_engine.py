@@ -0,0 +1,130 @@
+"""Hints computed from the whole feasible range
+
+Every guess so far narrows the target to one interval, which the engine's
+RangeTracker maintains in O(1) per guess. With a uniform target, the
+best next guess, the expected number of guesses left and the odds of
+winning in time depend only on the interval size and the attempts left.
+Ranges of up to solver.MAX_TABLE_SIZE numbers read the guess and the
+expectation from the solver's precomputed (and disk-cached) tables;
+larger ranges, 10^9 included, use the closed forms below, so a hint is
+always a few integer operations. The GUI and TUI auto-play by submitting
+the hint's suggestion.
+"""
+
+from collections import namedtuple
+
+from game_config import GameConfig
+import solver
+
+class Hint(namedtuple("Hint", "lo hi candidates suggestion expected_attempts "
+                              "win_probability attempts_left")):
+    """Everything known about the current game, for display"""
+
+    __slots__ = ()
+
+# === CLOSED FORMS ===
+
+def total_depth(size):
+    """
+    Sum of guesses needed to find each of size candidates with optimal play
+
+    The optimal search tree is balanced: levels 1..k-1 are full (2^(d-1)
+    candidates found with d guesses) and the rest are found with k
+    guesses, where k = size.bit_length().
+    """
+    if size <= 0:
+        return 0
+    k = size.bit_length()
+    full = (1 << (k - 1)) - 1  # Candidates on the full levels
+    return (k - 2) * (1 << (k - 1)) + 1 + k * (size - full)
+
+def expected_attempts(size):
+    """Expected guesses to find a uniform target among size candidates"""
+    return total_depth(size) / size if size > 0 else 0.0
+
+def win_probability(size, attempts_left):
+    """
+    Chance to find the target within attempts_left guesses
+
+    k guesses can tell apart at most 2^k - 1 candidates, and the balanced
+    guess reaches that bound.
+    """
+    if size <= 0 or attempts_left <= 0:
+        return 0.0
+    return min(size, (1 << attempts_left) - 1) / size
+
+def best_guess(lo, hi):
+    """Balanced split of the interval: minimizes expected and worst-case guesses"""
+    return lo + (hi - lo) // 2
+
+# === HINT ENGINE ===
+
+class HintEngine:
+    """Builds hints for games of one configuration"""
+
+    def __init__(self, min_number=GameConfig.MIN_NUMBER, max_number=GameConfig.MAX_NUMBER,
+                 max_attempts=GameConfig.MAX_ATTEMPTS, cache_dir=GameConfig.TABLE_CACHE_DIR):
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.cache_dir = cache_dir
+        self._table = None
+
+    @property
+    def table(self):
+        """Decision table for the range, loaded on the first hint (None if too large)"""
+        size = self.max_number - self.min_number + 1
+        if self._table is None and 0 < size <= solver.MAX_TABLE_SIZE:
+            self._table = solver.load_decision_table(size, self.cache_dir)
+        return self._table
+
+    def hint(self, lo, hi, attempts_used):
+        """
+        Analyze the feasible interval
+
+        Args:
+            lo (int): Smallest remaining candidate
+            hi (int): Largest remaining candidate
+            attempts_used (int): Guesses played so far
+
+        Returns:
+            Hint: Candidates left, suggested guess and odds
+        """
+        size = max(hi - lo + 1, 0)
+        attempts_left = max(self.max_attempts - attempts_used, 0)
+        table = self.table
+        if table is not None and size <= table.size:
+            suggestion = table.best_guess(lo, hi) if size else None
+            expected = table.expected_attempts(lo, hi)
+        else:
+            suggestion = best_guess(lo, hi) if size else None
+            expected = expected_attempts(size)
+        return Hint(lo, hi, size, suggestion, expected,
+                    win_probability(size, attempts_left), attempts_left)
+
+    def hint_for(self, engine):
+        """Hint for a GameEngine (or CompactSession) in progress"""
+        tracker = getattr(engine, 'tracker', engine)
+        return self.hint(tracker.lo, tracker.hi, engine.attempts)
+
+    @staticmethod
+    def format_hint(hint, messages=None):
+        """
+        Turn a hint into the message shown to the player
+
+        Args:
+            hint (Hint): The hint to show
+            messages (dict): Hint templates, GameConfig.HINTS by default
+
+        Returns:
+            str: Multi-line hint text
+        """
+        if messages is None:
+            messages = GameConfig.HINTS
+        if hint.candidates == 1:
+            text = messages['single'].format(hint.lo)
+        else:
+            text = messages['range'].format(hint.lo, hint.hi, hint.candidates)
+            text += "\n" + messages['suggestion'].format(hint.suggestion, hint.expected_attempts)
+        text += "\n" + messages['odds'].format(hint.win_probability, hint.attempts_left)
+        return text
@@ -0,0 +1,121 @@
+"""Bounded guess history with optional spill to disk
+
+GuessHistory is a drop-in replacement for the engine's guess_history list
+(append, clear, len, indexing and iteration over (guess, feedback)
+tuples). The newest capacity entries live in a fixed ring buffer. Older
+entries are either dropped or, with a spill directory, written as
+fixed-size records to a private temporary file there, so any entry can
+still be read back with one seek. Memory stays bounded however long a
+game runs.
+"""
+
+import os
+import struct
+from collections.abc import Sequence
+
+from engine import CODE_BY_FEEDBACK, FEEDBACK_BY_CODE
+
+# Spill record: guess (signed 64-bit) and feedback code
+SPILL_RECORD = struct.Struct("<qB")
+
+DEFAULT_CAPACITY = 1000
+
+class GuessHistory(Sequence):
+    """
+    Ring buffer of (guess, feedback) entries
+
+    Like any Sequence, it holds len() entries, indexed from 0. Without a
+    spill directory only the last capacity entries are kept; total counts
+    every entry appended since the last clear(), and first_index is the
+    position of entry 0 among them (e.g. for numbering attempts).
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, spill_dir=None):
+        """
+        Args:
+            capacity (int): Entries kept in memory
+            spill_dir (str): Directory for the temporary file holding older
+                entries, None to drop them
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self._ring = [None] * capacity
+        self._count = 0
+        self._spill = None
+
+    @property
+    def total(self):
+        """Entries appended since the last clear(), dropped ones included"""
+        return self._count
+
+    @property
+    def first_index(self):
+        """Number of dropped entries: entry 0 is the first_index-th appended"""
+        if self.spill_dir is not None:
+            return 0
+        return max(0, self._count - self.capacity)
+
+    def __len__(self):
+        return self._count - self.first_index
+
+    def append(self, entry):
+        """
+        Add a (guess, feedback) entry, spilling the one it replaces
+
+        Args:
+            entry (tuple): (guess, feedback string)
+        """
+        slot = self._count % self.capacity
+        if self._count >= self.capacity and self.spill_dir is not None:
+            if self._spill is None:
+                self._open_spill()
+            guess, feedback = self._ring[slot]
+            self._spill.seek(0, os.SEEK_END)
+            self._spill.write(SPILL_RECORD.pack(guess, CODE_BY_FEEDBACK[feedback]))
+        self._ring[slot] = entry
+        self._count += 1
+
+    def _open_spill(self):
+        # Only long games spill, so the tempfile import waits until then
+        import tempfile
+        os.makedirs(self.spill_dir, exist_ok=True)
+        # Unnamed and private to this history: windows never share a file
+        self._spill = tempfile.TemporaryFile(dir=self.spill_dir, prefix="history-",
+                                             suffix=".spill")
+
+    def __getitem__(self, index):
+        size = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("history index out of range")
+
+        index += self.first_index
+        if index >= self._count - self.capacity:
+            return self._ring[index % self.capacity]
+
+        self._spill.seek(index * SPILL_RECORD.size)
+        guess, code = SPILL_RECORD.unpack(self._spill.read(SPILL_RECORD.size))
+        return guess, FEEDBACK_BY_CODE[code]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def clear(self):
+        """Forget every entry (the spill file is truncated)"""
+        self._ring = [None] * self.capacity
+        self._count = 0
+        if self._spill is not None:
+            self._spill.seek(0)
+            self._spill.truncate()
+
+    def close(self):
+        """Close the spill file (the system deletes it)"""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
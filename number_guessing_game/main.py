@@ -1,3 +1,5 @@
+from game_config import GameConfig
+
 class NumberGuessingGame:
     """Main game class implementing the Number Guessing Game"""
     
@@ -225,37 +227,10 @@ class NumberGuessingGame:
         """Handle application shutdown gracefully"""
         pass
 
-# === CONFIGURATION CLASS ===
+# === CONFIGURATION ===
 
-class GameConfig:
-    """Configuration constants for the game"""
-    
-    # Game Settings
-    MIN_NUMBER = 1
-    MAX_NUMBER = 100
-    MAX_ATTEMPTS = 10
-    
-    # UI Settings
-    WINDOW_WIDTH = 500
-    WINDOW_HEIGHT = 600
-    BACKGROUND_COLOR = "#e8f4fd"
-    
-    # Colors
-    COLORS = {
-        'success': '#27ae60',
-        'error': '#e74c3c', 
-        'warning': '#f39c12',
-        'info': '#3498db',
-        'text': '#2c3e50'
-    }
-    
-    # Fonts
-    FONTS = {
-        'title': ('Arial', 24, 'bold'),
-        'heading': ('Arial', 14, 'bold'),
-        'normal': ('Arial', 12),
-        'small': ('Arial', 10)
-    }
+# GameConfig is shared with solution.py (game_config.py); config_loader.py
+# applies overrides from a YAML/JSON file on top of it
 
 # === UTILITY FUNCTIONS ===
 
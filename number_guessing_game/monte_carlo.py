@@ -0,0 +1,167 @@
+"""Vectorized Monte Carlo simulator for guessing strategies
+
+A whole batch of games is held in NumPy arrays (targets, current lo/hi
+bounds) and every game still in play advances one guess per vectorized
+step, so a million games cost MAX_ATTEMPTS array passes instead of a
+million Python loops.
+"""
+
+import time
+
+import numpy as np
+
+from game_config import GameConfig
+from engine import SimulationResult
+from rng import RandomStreams
+
+# Games processed per array pass; bounds peak memory for huge runs
+DEFAULT_BATCH_SIZE = 1 << 20
+
+# === VECTORIZED STRATEGIES ===
+# A strategy maps the (lo, hi) bounds of every active game to its next
+# guess: strategy(lo, hi, rng) -> array of the same shape and dtype, with
+# every guess inside its game's [lo, hi] range.
+
+def midpoint_strategy(lo, hi, rng):
+    """Vectorized utils.calculate_optimal_guess: middle of the remaining range"""
+    return (lo + hi) // 2
+
+def random_strategy(lo, hi, rng):
+    """Uniformly random guess inside the remaining range"""
+    return rng.integers(lo, hi + 1, dtype=lo.dtype)
+
+def lowest_strategy(lo, hi, rng):
+    """Worst sensible player: always guess the smallest candidate"""
+    return lo.copy()
+
+STRATEGIES = {
+    'midpoint': midpoint_strategy,
+    'random': random_strategy,
+    'lowest': lowest_strategy,
+}
+
+# === SIMULATION ===
+
+def _bounds_dtype(min_number, max_number):
+    """
+    Smallest integer dtype for the bounds (int32 halves memory traffic)
+
+    Strategies may add two bounds (midpoint_strategy does), so int32 is
+    only used while twice every bound still fits.
+    """
+    info = np.iinfo(np.int32)
+    if info.min < 2 * (min_number - 1) and 2 * (max_number + 1) < info.max:
+        return np.int32
+    return np.int64
+
+def simulate_targets(strategy, targets, rng, min_number, max_number, max_attempts, result=None):
+    """
+    Play one game per target, all games advanced together
+
+    Args:
+        strategy (callable): Vectorized strategy, see STRATEGIES
+        targets (np.ndarray): Target number of every game
+        rng (np.random.Generator): Random source handed to the strategy
+        min_number (int): Smallest possible target (inclusive)
+        max_number (int): Largest possible target (inclusive)
+        max_attempts (int): Guesses allowed per game
+        result (SimulationResult): Result to add the counts into
+
+    Returns:
+        SimulationResult: Win count and attempts histogram
+    """
+    if result is None:
+        result = SimulationResult(max_attempts)
+
+    dtype = _bounds_dtype(min_number, max_number)
+    target = np.asarray(targets, dtype=dtype)
+    lo = np.full(target.shape, min_number, dtype=dtype)
+    hi = np.full(target.shape, max_number, dtype=dtype)
+    histogram = result.attempts_histogram
+    wins = 0
+
+    for attempt in range(1, max_attempts + 1):
+        if target.size == 0:
+            break
+
+        guess = strategy(lo, hi, rng)
+        too_high = guess > target
+        np.putmask(hi, too_high, guess - 1)
+        np.logical_not(too_high, out=too_high)
+        np.putmask(lo, too_high, guess + 1)
+
+        correct = guess == target
+        won = int(np.count_nonzero(correct))
+        histogram[attempt] += won
+        wins += won
+
+        # Drop finished games so later passes only touch active ones
+        if won:
+            np.logical_not(correct, out=correct)
+            target, lo, hi = target[correct], lo[correct], hi[correct]
+
+    result.games += len(targets)
+    result.wins += wins
+    return result
+
+def run_monte_carlo(strategy=midpoint_strategy, n_games=1_000_000, seed=None,
+                    config=GameConfig, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Simulate n_games random games for a configuration
+
+    Args:
+        strategy (callable): Vectorized strategy, see STRATEGIES
+        n_games (int): Number of games to play
+        seed (int): Seed for targets and strategy randomness
+        config: Object with MIN_NUMBER, MAX_NUMBER and MAX_ATTEMPTS
+        batch_size (int): Games per vectorized batch
+
+    Returns:
+        SimulationResult: Win count and attempts histogram
+    """
+    rng = RandomStreams(seed).numpy("monte_carlo")
+    result = SimulationResult(config.MAX_ATTEMPTS)
+
+    remaining = n_games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        targets = rng.integers(config.MIN_NUMBER, config.MAX_NUMBER + 1, size=size,
+                               dtype=_bounds_dtype(config.MIN_NUMBER, config.MAX_NUMBER))
+        simulate_targets(strategy, targets, rng, config.MIN_NUMBER,
+                         config.MAX_NUMBER, config.MAX_ATTEMPTS, result)
+        remaining -= size
+
+    return result
+
+def format_report(result, title="Monte Carlo"):
+    """
+    Format a simulation result as a text report
+
+    Args:
+        result (SimulationResult): Result to describe
+        title (str): Heading line
+
+    Returns:
+        str: Multi-line report with win rate and attempts histogram
+    """
+    lines = [
+        f"{title}: {result.games} games",
+        f"  Win rate: {result.win_rate:.2%}  |  Average attempts: {result.average_attempts:.3f}",
+    ]
+    for attempt, count in enumerate(result.attempts_histogram):
+        if attempt and count:
+            share = count / result.games
+            lines.append(f"  #{attempt:>3}: {count:>10} {share:7.2%}")
+    lines.append(f"  Lost: {result.losses:>10} {1 - result.win_rate:7.2%}")
+    return "\n".join(lines)
+
+def main():
+    """Simulate every built-in strategy for the default configuration"""
+    for name, strategy in STRATEGIES.items():
+        start = time.perf_counter()
+        result = run_monte_carlo(strategy, 1_000_000, seed=0)
+        elapsed = time.perf_counter() - start
+        print(format_report(result, title=f"{name} ({elapsed:.2f}s)"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+"""Compact binary replay log for game analytics
+
+Every finished game is appended as one length-prefixed record:
+
+    file header   b"NGRL" + version byte
+    record        varint  length of the rest of the record
+                  varint  zigzag(min_number)
+                  varint  max_number - min_number
+                  varint  max_attempts
+                  varint  target - min_number
+                  varint  hints used
+                  varint  number of guesses n
+                  n x varint  guess - min_number
+                  ceil(n / 4) bytes of 2-bit feedback codes (engine.CODE_*)
+
+A typical 1-100 game takes about 15 bytes. The writer encodes and writes
+on a background thread, so logging a guess never blocks the caller; the
+reader is a generator that streams any number of games in constant memory.
+A writer opened on an existing log first cuts off any record a crash left
+half-written (repair_log), so later games stay readable.
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections import namedtuple
+
+from engine import CODE_BY_FEEDBACK, FEEDBACK_BY_CODE, CODE_CORRECT
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"NGRL"
+VERSION = 1
+FILE_HEADER = MAGIC + bytes([VERSION])
+
+READ_CHUNK = 1 << 16
+
+class GameRecord(namedtuple("GameRecord",
+                            "min_number max_number max_attempts target hints guesses codes")):
+    """One decoded game"""
+
+    __slots__ = ()
+
+    @property
+    def won(self):
+        return bool(self.codes) and self.codes[-1] == CODE_CORRECT
+
+    @property
+    def attempts(self):
+        return len(self.guesses)
+
+class ReplayLogError(ValueError):
+    """Raised when a log file is not a replay log or is corrupt"""
+
+# === ENCODING ===
+
+def _put_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _get_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+def _zigzag(value):
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+def encode_game(min_number, max_number, max_attempts, target, guesses, codes, hints=0):
+    """
+    Encode one game as a length-prefixed record
+
+    Args:
+        min_number (int): Smallest possible target
+        max_number (int): Largest possible target
+        max_attempts (int): Guesses allowed per game
+        target (int): The number to find
+        guesses (sequence): Guesses in order
+        codes (sequence): Feedback code of each guess
+        hints (int): Hints used during the game
+
+    Returns:
+        bytes: The encoded record
+    """
+    body = bytearray()
+    _put_varint(body, _zigzag(min_number))
+    _put_varint(body, max_number - min_number)
+    _put_varint(body, max_attempts)
+    _put_varint(body, target - min_number)
+    _put_varint(body, hints)
+    _put_varint(body, len(guesses))
+    for guess in guesses:
+        _put_varint(body, guess - min_number)
+
+    packed = 0
+    for index, code in enumerate(codes):
+        packed |= code << (2 * (index & 3))
+        if index & 3 == 3:
+            body.append(packed)
+            packed = 0
+    if len(codes) & 3:
+        body.append(packed)
+
+    record = bytearray()
+    _put_varint(record, len(body))
+    record += body
+    return bytes(record)
+
+def decode_game(data, pos=0):
+    """
+    Decode the record body starting at pos (after the length prefix)
+
+    Returns:
+        GameRecord: The decoded game
+    """
+    zigzag_min, pos = _get_varint(data, pos)
+    min_number = _unzigzag(zigzag_min)
+    span, pos = _get_varint(data, pos)
+    max_attempts, pos = _get_varint(data, pos)
+    target, pos = _get_varint(data, pos)
+    hints, pos = _get_varint(data, pos)
+    count, pos = _get_varint(data, pos)
+
+    guesses = []
+    for _ in range(count):
+        offset, pos = _get_varint(data, pos)
+        guesses.append(offset + min_number)
+
+    codes = []
+    for index in range(count):
+        codes.append((data[pos + (index >> 2)] >> (2 * (index & 3))) & 3)
+
+    return GameRecord(min_number, min_number + span, max_attempts, target + min_number,
+                      hints, tuple(guesses), tuple(codes))
+
+# === WRITER ===
+
+class ReplayLogWriter:
+    """Append-only log writer with a background I/O thread"""
+
+    def __init__(self, path):
+        """
+        Open (or create) a log file for appending
+
+        Args:
+            path (str): Log file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        # A crash can leave half a record behind; appending after it would
+        # make every later game unreadable
+        if os.path.exists(path):
+            repair_log(path)
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(FILE_HEADER)
+
+        self._current = None
+        self._queue = queue.Queue()
+        self.dropped = 0  # Games lost to encoding or write errors
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_loop, name="replay-writer", daemon=True)
+        self._thread.start()
+
+    # --- per-guess API for an interactive game ---
+
+    def begin_game(self, min_number, max_number, max_attempts, target=None):
+        """
+        Start recording a new game (an unfinished one is dropped)
+
+        The target may be None while it is not fixed yet (adversarial mode);
+        end_game() then has to supply it.
+        """
+        self._current = [min_number, max_number, max_attempts, target, [], [], 0]
+
+    def log_guess(self, guess, feedback):
+        """
+        Record one guess of the current game (memory only, O(1))
+
+        Args:
+            guess (int): The number guessed
+            feedback: Feedback string or code
+        """
+        if self._current is not None:
+            self._current[4].append(guess)
+            self._current[5].append(CODE_BY_FEEDBACK.get(feedback, feedback))
+
+    def log_hint(self):
+        """Count a hint for the current game"""
+        if self._current is not None:
+            self._current[6] += 1
+
+    def end_game(self, target=None):
+        """
+        Queue the current game for writing
+
+        Args:
+            target (int): The target, if it was only fixed when the game ended
+        """
+        if self._current is not None:
+            if target is not None:
+                self._current[3] = target
+            self._put(tuple(self._current))
+            self._current = None
+
+    # --- bulk API ---
+
+    def log_game(self, min_number, max_number, max_attempts, target, guesses, codes, hints=0):
+        """Queue a complete game for writing"""
+        self._put((min_number, max_number, max_attempts, target,
+                   list(guesses), list(codes), hints))
+
+    def _put(self, game):
+        """Hand a game to the writer thread, which is gone once the log is closed"""
+        if self._closed:
+            raise ValueError(f"cannot log a game to closed replay log {self.path}")
+        self._queue.put(game)
+
+    def _write_game(self, game):
+        """Encode and append one game; a failure is logged and the game dropped"""
+        try:
+            self._file.write(encode_game(*game))
+            if self._queue.empty():
+                self._file.flush()
+        except Exception:
+            self.dropped += 1
+            logger.exception("Dropped a game that could not be written to %s", self.path)
+
+    def _write_loop(self):
+        """Background thread: encode queued games and append them"""
+        while True:
+            game = self._queue.get()
+            try:
+                if game is None:
+                    self._file.flush()
+                    break
+                self._write_game(game)
+            except OSError:
+                logger.exception("Cannot flush %s", self.path)
+                break
+            finally:
+                # flush() waits on this, so it runs even if the write failed
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued game is on disk"""
+        self._queue.join()
+
+    def close(self):
+        """Write pending games and close the file"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+# === RECOVERY ===
+
+def repair_log(path):
+    """
+    Cut a log back to its last complete record
+
+    Only the length prefixes are read, so repairing a large log is a
+    seek per record. A file holding just the start of the header (a
+    crash right after creating it) is emptied.
+
+    Args:
+        path (str): Log file path
+
+    Returns:
+        int: Number of bytes removed from the end of the file
+
+    Raises:
+        ReplayLogError: If a non-empty file is not a replay log
+    """
+    with open(path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        header = f.read(len(FILE_HEADER))
+        if header == FILE_HEADER:
+            pos = len(FILE_HEADER)
+        elif FILE_HEADER.startswith(header) and size < len(FILE_HEADER):
+            pos = 0
+        else:
+            raise ReplayLogError(f"{path} is not a replay log")
+
+        while pos < size:
+            f.seek(pos)
+            try:
+                length, start = _get_varint(f.read(10), 0)
+            except IndexError:
+                break
+            if pos + start + length > size:
+                break
+            pos += start + length
+
+        if pos < size:
+            f.truncate(pos)
+        return size - pos
+
+# === READER ===
+
+def read_games(path, start=None, end=None):
+    """
+    Stream the games of a log file
+
+    Only one read chunk and one record are held in memory at a time.
+
+    Args:
+        path (str): Log file path
+        start (int): Byte offset of the first record to read (a record
+            boundary, e.g. from split_log), None for the first record
+        end (int): Stop before the record starting at this offset,
+            None to read to the end of the file
+
+    Yields:
+        GameRecord: Each game, in the order it was written
+    """
+    with open(path, "rb") as f:
+        if f.read(len(FILE_HEADER)) != FILE_HEADER:
+            raise ReplayLogError(f"{path} is not a replay log")
+        if start is not None:
+            f.seek(start)
+
+        buffer = b""
+        base = f.tell()  # File offset of buffer[0]
+        pos = 0
+        eof = False
+        while True:
+            if end is not None and base + pos >= end:
+                return
+            # Keep at least a full length prefix (at most 10 bytes) buffered
+            if len(buffer) - pos < 10 and not eof:
+                chunk = f.read(READ_CHUNK)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                base += pos
+                pos = 0
+            if pos >= len(buffer):
+                return
+
+            try:
+                length, start = _get_varint(buffer, pos)
+            except IndexError:
+                raise ReplayLogError(f"{path} ends in the middle of a record") from None
+
+            end_of_record = start + length
+            while end_of_record > len(buffer) and not eof:
+                chunk = f.read(max(READ_CHUNK, end_of_record - len(buffer)))
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                base += pos
+                start -= pos
+                end_of_record -= pos
+                pos = 0
+            if end_of_record > len(buffer):
+                raise ReplayLogError(f"{path} ends in the middle of a record")
+
+            yield decode_game(buffer, start)
+            pos = end_of_record
+
+def split_log(path, parts):
+    """
+    Split a log into byte ranges of about equal size on record boundaries
+
+    Only the length prefixes are walked, so splitting costs a fraction of
+    reading the games. Each range can be read with read_games(path, start, end).
+
+    Args:
+        path (str): Log file path
+        parts (int): Number of ranges wanted
+
+    Returns:
+        list: (start, end) byte offsets, at most parts of them, covering
+              every record in order
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        if f.read(len(FILE_HEADER)) != FILE_HEADER:
+            raise ReplayLogError(f"{path} is not a replay log")
+
+        first = len(FILE_HEADER)
+        targets = [first + (size - first) * part // parts for part in range(1, parts)]
+        boundaries = [first]
+        buffer = b""
+        base = pos = first
+        while targets and pos < size:
+            if len(buffer) - (pos - base) < 10:
+                f.seek(pos)
+                buffer = f.read(READ_CHUNK)
+                base = pos
+            try:
+                length, start = _get_varint(buffer, pos - base)
+            except IndexError:
+                break  # Truncated tail; read_games reports it
+            pos = base + start + length
+            if pos >= targets[0] and pos < size:
+                boundaries.append(pos)
+                while targets and targets[0] <= pos:
+                    targets.pop(0)
+
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+# === CONVERTERS ===
+
+FEEDBACK_LETTERS = "CHL"  # indexed by feedback code
+
+def to_csv(path, output):
+    """
+    Convert a log to CSV, one row per game
+
+    Returns:
+        int: Number of games written
+    """
+    import csv
+
+    count = 0
+    with open(output, "w", newline="", encoding="utf-8") as out:
+        writer = csv.writer(out)
+        writer.writerow(["game", "min_number", "max_number", "max_attempts", "target",
+                         "hints", "attempts", "won", "guesses", "feedback"])
+        for count, game in enumerate(read_games(path), 1):
+            writer.writerow([count, game.min_number, game.max_number, game.max_attempts,
+                             game.target, game.hints, game.attempts, int(game.won),
+                             " ".join(map(str, game.guesses)),
+                             "".join(FEEDBACK_LETTERS[code] for code in game.codes)])
+    return count
+
+def to_jsonl(path, output):
+    """
+    Convert a log to JSON Lines, one object per game
+
+    Returns:
+        int: Number of games written
+    """
+    import json
+
+    count = 0
+    with open(output, "w", encoding="utf-8") as out:
+        for count, game in enumerate(read_games(path), 1):
+            out.write(json.dumps({
+                "min_number": game.min_number,
+                "max_number": game.max_number,
+                "max_attempts": game.max_attempts,
+                "target": game.target,
+                "hints": game.hints,
+                "won": game.won,
+                "guesses": list(game.guesses),
+                "feedback": [FEEDBACK_BY_CODE[code] for code in game.codes],
+            }, ensure_ascii=False))
+            out.write("\n")
+    return count
+
+def main():
+    """Command line entry point: convert a log to CSV or JSONL"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert a replay log to CSV or JSONL")
+    parser.add_argument("log")
+    parser.add_argument("output")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None,
+                        help="defaults to the output file extension")
+    args = parser.parse_args()
+
+    fmt = args.format or ("jsonl" if args.output.endswith((".jsonl", ".json")) else "csv")
+    converter = to_jsonl if fmt == "jsonl" else to_csv
+    count = converter(args.log, args.output)
+    print(f"Wrote {count} games to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Seeded, splittable random streams
+
+Every consumer (a window, a server's session table, a tournament chunk,
+a simulation worker) gets its own generator derived from one root seed
+and a key, instead of sharing the hidden state of the random module:
+
+    streams = RandomStreams(seed)
+    engine_rng = streams.stream("session", 42)   # random.Random
+    worker = streams.spawn("worker", 3)           # child RandomStreams
+    generator = streams.numpy("monte_carlo")      # numpy PCG64 Generator
+
+Keys are hashed together with the seed, so streams are independent of
+each other and of the order they are created in, and the same seed
+replays every stream exactly. TargetBuffer draws target numbers in bulk
+from a stream.
+"""
+
+import hashlib
+import random
+
+DEFAULT_BUFFER_SIZE = 1024
+
+def derive_seed(seed, *key):
+    """
+    64-bit seed for the stream named key under a root seed
+
+    Args:
+        seed (int): Root seed
+        *key: Stream name parts (str, int or tuples of them)
+
+    Returns:
+        int: Derived seed
+    """
+    digest = hashlib.blake2b(repr((seed,) + key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+class RandomStreams:
+    """Independent, reproducible generators derived from one root seed"""
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed (int): Root seed, None for a fresh one (kept in self.seed
+                so the run can be replayed)
+        """
+        self.seed = random.SystemRandom().getrandbits(64) if seed is None else seed
+
+    def stream(self, *key):
+        """random.Random generator for key"""
+        return random.Random(derive_seed(self.seed, *key))
+
+    def spawn(self, *key):
+        """Child RandomStreams for key, e.g. one per worker process"""
+        return RandomStreams(derive_seed(self.seed, "spawn", *key))
+
+    def numpy(self, *key):
+        """numpy Generator (PCG64) for key; needs numpy"""
+        import numpy as np
+        return np.random.Generator(np.random.PCG64(derive_seed(self.seed, *key)))
+
+    def targets(self, min_number, max_number, *key, size=DEFAULT_BUFFER_SIZE):
+        """TargetBuffer drawing from the stream for ("targets", *key)"""
+        return TargetBuffer(self.stream("targets", *key), min_number, max_number, size)
+
+class TargetBuffer:
+    """
+    Target numbers pre-generated in bulk from one generator
+
+    The sequence only depends on the generator's seed, not on the buffer
+    size, so a replay yields the same targets in the same order.
+    """
+
+    __slots__ = ('rng', 'min_number', 'max_number', 'size', '_buffer')
+
+    def __init__(self, rng, min_number, max_number, size=DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            rng (random.Random): Source generator
+            min_number (int): Smallest target (inclusive)
+            max_number (int): Largest target (inclusive)
+            size (int): Targets generated per refill
+        """
+        self.rng = rng
+        self.min_number = min_number
+        self.max_number = max_number
+        self.size = size
+        self._buffer = []
+
+    def fill(self):
+        """Generate the next size targets (kept in reverse for O(1) pops)"""
+        randrange = self.rng.randrange
+        stop = self.max_number + 1
+        low = self.min_number
+        batch = [randrange(low, stop) for _ in range(self.size)]
+        batch.reverse()
+        self._buffer = batch + self._buffer
+
+    def next(self):
+        """
+        Returns:
+            int: The next target number
+        """
+        if not self._buffer:
+            self.fill()
+        return self._buffer.pop()
+
+    def take(self, count):
+        """List of the next count targets"""
+        return [self.next() for _ in range(count)]
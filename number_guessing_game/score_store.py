@@ -0,0 +1,256 @@
+"""Persistent best-score and leaderboard store for the Number Guessing Game
+
+Scores live in a local SQLite database in WAL mode. Writes are queued
+and committed in batches by a background thread, while the best scores
+the UI shows come from an in-memory view that is updated immediately,
+so the Tk thread never waits on disk.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from utils import difficulty_key  # Labels the difficulty column
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_leaderboard
+    ON scores (difficulty, won, attempts, played_at);
+CREATE INDEX IF NOT EXISTS idx_scores_player
+    ON scores (player, difficulty, won, attempts);
+"""
+
+INSERT_SQL = ("INSERT INTO scores (player, difficulty, attempts, won, played_at) "
+              "VALUES (?, ?, ?, ?, ?)")
+
+# Rows committed per transaction and the longest a row waits in the queue
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.5
+
+def _connect(path):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+class ScoreStore:
+    """SQLite score store with batched background writes and a cached view"""
+
+    def __init__(self, path, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        """
+        Open (or create) the database and load the cached best scores
+
+        Args:
+            path (str): SQLite database file
+            batch_size (int): Rows committed per transaction
+            flush_interval (float): Seconds a queued row may wait for a batch
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._reader = _connect(path)
+        self._reader.executescript(SCHEMA)
+        self._read_lock = threading.Lock()
+
+        # Cached view: {(player, difficulty): best attempts}
+        self._best = {}
+        rows = self._reader.execute(
+            "SELECT player, difficulty, MIN(attempts) FROM scores "
+            "WHERE won = 1 GROUP BY player, difficulty"
+        )
+        for player, difficulty, attempts in rows:
+            self._best[(player, difficulty)] = attempts
+
+        self._queue = queue.Queue()
+        self.dropped = 0  # Rows lost to write errors (locked, read-only or full disk)
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="score-writer", daemon=True)
+        self._writer.start()
+
+    # === WRITES ===
+
+    def record(self, player, difficulty, attempts, won):
+        """
+        Record a finished game without touching the disk on this thread
+
+        Args:
+            player (str): Player name
+            difficulty (str): Difficulty label, see difficulty_key
+            attempts (int): Guesses used in the game
+            won (bool): Whether the target was found
+
+        Returns:
+            bool: True if the game set a new best score for the player
+
+        Raises:
+            ValueError: If the store was closed (nothing would write the row)
+        """
+        if self._closed:
+            raise ValueError("record() on a closed ScoreStore")
+        new_best = False
+        if won:
+            key = (player, difficulty)
+            best = self._best.get(key)
+            if best is None or attempts < best:
+                self._best[key] = attempts
+                new_best = True
+
+        self._queue.put((player, difficulty, attempts, int(bool(won)), time.time()))
+        return new_best
+
+    def _next_batch(self):
+        """
+        Wait for queued rows and gather up to batch_size of them
+
+        Returns:
+            tuple: (rows, stop) where stop is True once close() was called
+        """
+        row = self._queue.get()
+        if row is None:
+            return [], True
+
+        batch = [row]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                row = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if row is None:
+                return batch, True
+            batch.append(row)
+        return batch, False
+
+    def _write_batch(self, connection, batch):
+        """Commit one batch; a failed batch is logged and dropped, never fatal"""
+        try:
+            if connection is None:
+                raise sqlite3.OperationalError("the database could not be opened")
+            with connection:
+                connection.executemany(INSERT_SQL, batch)
+        except Exception:
+            self.dropped += len(batch)
+            logger.exception("Dropped %d score rows that could not be written to %s",
+                           len(batch), self.path)
+
+    def _write_loop(self):
+        """Background thread: commit queued rows in batches"""
+        try:
+            connection = _connect(self.path)
+        except sqlite3.Error:
+            logger.exception("Cannot open %s for writing scores", self.path)
+            connection = None
+
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                try:
+                    if batch:
+                        self._write_batch(connection, batch)
+                finally:
+                    # flush() waits on these, so they run even if the write failed
+                    for _ in range(len(batch) + stop):
+                        self._queue.task_done()
+                if stop:
+                    break
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def flush(self):
+        """Block until every queued row is committed"""
+        self._queue.join()
+
+    def close(self):
+        """Commit pending rows and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        self._reader.close()
+
+    # === CACHED VIEW ===
+
+    def best_score(self, player, difficulty):
+        """
+        Best winning attempts for a player, from memory
+
+        Returns:
+            int: Fewest attempts, or None if the player never won
+        """
+        return self._best.get((player, difficulty))
+
+    # === QUERIES ===
+
+    def _query(self, sql, params=()):
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def top_scores(self, difficulty, limit=10):
+        """
+        Leaderboard for one difficulty
+
+        Returns:
+            list: (player, attempts, played_at) rows, best first
+        """
+        return self._query(
+            "SELECT player, attempts, played_at FROM scores "
+            "WHERE difficulty = ? AND won = 1 "
+            "ORDER BY attempts, played_at LIMIT ?",
+            (difficulty, limit),
+        )
+
+    def player_best(self, player):
+        """
+        Best score of a player on every difficulty played
+
+        Returns:
+            dict: {difficulty: fewest attempts}
+        """
+        rows = self._query(
+            "SELECT difficulty, MIN(attempts) FROM scores "
+            "WHERE player = ? AND won = 1 GROUP BY difficulty",
+            (player,),
+        )
+        return dict(rows)
+
+    def difficulty_stats(self):
+        """
+        Aggregate statistics per difficulty
+
+        Returns:
+            dict: {difficulty: {'games', 'wins', 'win_rate', 'average_attempts'}}
+        """
+        rows = self._query(
+            "SELECT difficulty, COUNT(*), SUM(won), "
+            "AVG(CASE WHEN won = 1 THEN attempts END) "
+            "FROM scores GROUP BY difficulty"
+        )
+        stats = {}
+        for difficulty, games, wins, average in rows:
+            stats[difficulty] = {
+                'games': games,
+                'wins': wins,
+                'win_rate': wins / games if games else 0.0,
+                'average_attempts': average or 0.0,
+            }
+        return stats
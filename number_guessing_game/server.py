@@ -0,0 +1,233 @@
+"""asyncio multiplayer server for the Number Guessing Game
+
+Every TCP connection gets its own compact game session (see session.py)
+applying the same rules as the GameEngine behind the Tk window. The
+protocol is line based (UTF-8, one command per line):
+
+    Client                  Server
+    ------                  ------
+                            WELCOME <min> <max> <max_attempts> <session_id>
+    NEW                     OK <min> <max> <max_attempts>
+    GUESS <n>  (or <n>)     HIGH <attempts> | LOW <attempts> | WIN <attempts> | LOSE <target>
+    HINT                    HINT <lo> <hi> <suggestion>
+    QUIT                    BYE
+                            ERR <message>        (invalid command or guess)
+                            BYE idle             (idle timeout)
+"""
+
+import argparse
+import asyncio
+
+from game_config import GameConfig
+from engine import CODE_CORRECT, CODE_TOO_HIGH
+from hint_engine import HintEngine
+from session import SessionTable
+from utils import validate_number_input
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Seconds a client may stay silent before the session is closed
+IDLE_TIMEOUT = 60.0
+
+# Longest accepted command line; bounds the read buffer of every session
+MAX_LINE = 64
+
+# Connections beyond this are refused with "ERR busy"
+MAX_SESSIONS = 50_000
+
+class GuessingServer:
+    """Accepts connections and runs one game session per client"""
+
+    def __init__(self, min_number=GameConfig.MIN_NUMBER, max_number=GameConfig.MAX_NUMBER,
+                 max_attempts=GameConfig.MAX_ATTEMPTS, idle_timeout=IDLE_TIMEOUT,
+                 max_sessions=MAX_SESSIONS, adversarial=False, seed=None):
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+
+        self.total_guesses = 0
+        self.server = None
+
+        # Sessions in LRU order; one reaper task evicts the idle ones instead
+        # of arming a timer on every read
+        self.sessions = SessionTable(min_number, max_number, max_attempts,
+                                     adversarial=adversarial, seed=seed)
+        self._writers = {}
+        self._reaper = None
+        self.hint_engine = HintEngine(min_number, max_number, max_attempts)
+
+    @property
+    def active_sessions(self):
+        return len(self.sessions)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Start listening
+
+        Returns:
+            int: Port actually bound (useful with port 0)
+        """
+        self.server = await asyncio.start_server(self.handle_client, host, port,
+                                                 limit=MAX_LINE, backlog=4096)
+        self._reaper = asyncio.ensure_future(self._reap_idle_sessions())
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop accepting connections and wait for the listener to close"""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def serve_forever(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Run until cancelled"""
+        await self.start(host, port)
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _reap_idle_sessions(self):
+        """Close connections that stayed silent longer than idle_timeout"""
+        interval = max(self.idle_timeout / 4, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            for session_id in self.sessions.evict_idle(self.idle_timeout):
+                writer = self._writers.pop(session_id, None)
+                if writer is not None:
+                    writer.write(b"BYE idle\n")
+                    writer.close()
+
+    # === SESSIONS ===
+
+    def new_session(self):
+        """
+        Create the game state for one connection
+
+        Returns:
+            tuple: (session_id, CompactSession)
+        """
+        session_id = self.sessions.create()
+        return session_id, self.sessions.get(session_id)
+
+    def handle_line(self, session, line):
+        """
+        Apply one protocol command to a session
+
+        Args:
+            session (CompactSession): The client's game
+            line (str): Command without the line ending
+
+        Returns:
+            str: Response line, or None to close the connection
+        """
+        command, _, argument = line.strip().partition(" ")
+        command = command.upper()
+
+        if command == "GUESS" or command.lstrip("-").isdigit():
+            text = argument if command == "GUESS" else command
+            if not session.game_active:
+                return "ERR no active game, send NEW"
+            is_valid, number, error_message = validate_number_input(
+                text, self.min_number, self.max_number)
+            if not is_valid:
+                return f"ERR {error_message}"
+
+            code = session.guess(number)
+            self.total_guesses += 1
+            if code == CODE_CORRECT:
+                return f"WIN {session.attempts}"
+            if session.lost:
+                return f"LOSE {session.target_number}"
+            return f"{'HIGH' if code == CODE_TOO_HIGH else 'LOW'} {session.attempts}"
+
+        if command == "NEW":
+            session.new_game()
+            return f"OK {self.min_number} {self.max_number} {self.max_attempts}"
+
+        if command == "HINT":
+            if not session.game_active:
+                return "ERR no active game, send NEW"
+            hint = self.hint_engine.hint_for(session)
+            return f"HINT {hint.lo} {hint.hi} {hint.suggestion}"
+
+        if command == "QUIT":
+            return None
+
+        return "ERR unknown command"
+
+    async def handle_client(self, reader, writer):
+        """Connection handler: read commands, answer each one"""
+        if self.active_sessions >= self.max_sessions:
+            writer.write(b"ERR busy\n")
+            await self._close(writer)
+            return
+
+        session_id, session = self.new_session()
+        self._writers[session_id] = writer
+        sessions = self.sessions
+        try:
+            writer.write(f"WELCOME {self.min_number} {self.max_number} "
+                         f"{self.max_attempts} {session_id}\n".encode())
+            while True:
+                try:
+                    raw = await reader.readline()
+                except ValueError:
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not raw or sessions.get(session_id) is None:
+                    break  # Client closed the connection or was reaped as idle
+
+                response = self.handle_line(session, raw.decode("utf-8", "replace"))
+                if response is None:
+                    writer.write(b"BYE\n")
+                    break
+                writer.write(response.encode() + b"\n")
+
+                # Backpressure: stop reading while a slow client's buffer is full
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            sessions.remove(session_id)
+            self._writers.pop(session_id, None)
+            await self._close(writer)
+
+    @staticmethod
+    async def _close(writer):
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Number Guessing Game server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    parser.add_argument("--adversarial", action="store_true",
+                        help="answer every guess so the largest range survives")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="replay the target numbers of an earlier run")
+    args = parser.parse_args()
+
+    server = GuessingServer(idle_timeout=args.idle_timeout, adversarial=args.adversarial,
+                            seed=args.seed)
+    print(f"Random seed {server.sessions.streams.seed}")
+    print(f"Serving on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Compact game sessions for servers holding millions of games
+
+CompactSession applies the GameEngine rules (engine.calculate_feedback
+and a utils.RangeTracker) with a fixed set of slots, small-int feedback
+codes and a packed array history instead of widget references and lists
+of tuples. SessionTable keeps the sessions by id with O(1) lookup and
+evicts idle games.
+"""
+
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+from engine import (CORRECT, CODE_BY_FEEDBACK, FEEDBACK_BY_CODE, adversarial_feedback,
+                    calculate_feedback)
+from rng import RandomStreams, TargetBuffer
+from utils import RangeTracker
+
+# Session states
+STATE_IDLE = 0
+STATE_ACTIVE = 1
+STATE_WON = 2
+STATE_LOST = 3
+
+class SessionConfig:
+    """Range and attempts shared by every session of a table"""
+
+    __slots__ = ('min_number', 'max_number', 'max_attempts', 'history_typecode',
+                 'adversarial', 'rng', 'targets')
+
+    def __init__(self, min_number, max_number, max_attempts, adversarial=False, rng=None):
+        self.min_number = min_number
+        self.max_number = max_number
+        self.max_attempts = max_attempts
+        # Adversarial sessions answer from [lo, hi] alone; the tie-break
+        # generator is shared, so the mode adds no per-session state
+        self.adversarial = adversarial
+        self.rng = rng if rng is not None else random.Random()
+        # Targets of every session come pre-generated from the same stream
+        self.targets = TargetBuffer(self.rng, min_number, max_number)
+        # 32-bit history entries whenever the range leaves room for the code
+        self.history_typecode = 'I' if max_number - min_number < 1 << 30 else 'Q'
+
+class CompactSession:
+    """
+    One game in a few hundred bytes, table entry included
+
+    History entries are packed as (guess - min_number) << 2 | code in an
+    unsigned int array, so each guess costs 4 bytes (8 for huge ranges).
+    """
+
+    __slots__ = ('config', 'target_number', 'tracker', 'attempts', 'state',
+                 'last_seen', 'history')
+
+    def __init__(self, config):
+        self.config = config
+        self.target_number = 0
+        self.tracker = RangeTracker(config.min_number, config.max_number)
+        self.attempts = 0
+        self.state = STATE_IDLE
+        self.last_seen = 0.0
+        self.history = None
+
+    def new_game(self, target=None):
+        """
+        Start a new round
+
+        Args:
+            target (int): Fixed target number, or None to draw a random one
+                (adversarial sessions fix it when the game ends)
+        """
+        config = self.config
+        if config.adversarial:
+            target = None
+        elif target is None:
+            target = config.targets.next()
+        self.target_number = target
+        self.tracker.reset()
+        self.attempts = 0
+        self.state = STATE_ACTIVE
+        if self.history is None:
+            self.history = array(config.history_typecode)
+        else:
+            del self.history[:]
+
+    def guess(self, number):
+        """
+        Play one validated guess
+
+        Args:
+            number (int): The number guessed
+
+        Returns:
+            int: Feedback code (CODE_CORRECT, CODE_TOO_HIGH or CODE_TOO_LOW),
+                 or None if no game is active
+        """
+        if self.state != STATE_ACTIVE:
+            return None
+
+        self.attempts += 1
+        tracker = self.tracker
+        if self.target_number is None:
+            # The tracker's interval is the whole adversary state
+            code, _, _ = adversarial_feedback(number, tracker.lo, tracker.hi, self.config.rng)
+            feedback = FEEDBACK_BY_CODE[code]
+        else:
+            feedback = calculate_feedback(number, self.target_number)
+            code = CODE_BY_FEEDBACK[feedback]
+        tracker.update(number, feedback)
+
+        if feedback == CORRECT:
+            self.state = STATE_WON
+        elif self.attempts >= self.config.max_attempts:
+            self.state = STATE_LOST
+
+        if self.target_number is None and self.state != STATE_ACTIVE:
+            # Commit to a target consistent with every answer given
+            self.target_number = (number if self.state == STATE_WON
+                                  else self.config.rng.randint(tracker.lo, tracker.hi))
+
+        self.history.append((number - self.config.min_number) << 2 | code)
+        return code
+
+    @property
+    def lo(self):
+        """Smallest target still consistent with every answer"""
+        return self.tracker.lo
+
+    @property
+    def hi(self):
+        """Largest target still consistent with every answer"""
+        return self.tracker.hi
+
+    @property
+    def game_active(self):
+        return self.state == STATE_ACTIVE
+
+    @property
+    def won(self):
+        return self.state == STATE_WON
+
+    @property
+    def lost(self):
+        return self.state == STATE_LOST
+
+    @property
+    def finished(self):
+        return self.state >= STATE_WON
+
+    @property
+    def guess_history(self):
+        """History as (guess, feedback) tuples, like GameEngine.guess_history"""
+        min_number = self.config.min_number
+        return [((entry >> 2) + min_number, FEEDBACK_BY_CODE[entry & 3])
+                for entry in (self.history or ())]
+
+class SessionTable:
+    """
+    Sessions by id with O(1) lookup and eviction
+
+    The table is kept in least-recently-used order, so idle sessions are
+    always at the front. A finished session stays until its connection
+    closes or goes idle, since the client may start a new round.
+    """
+
+    def __init__(self, min_number, max_number, max_attempts, clock=time.monotonic,
+                 adversarial=False, seed=None):
+        # One stream per table: the same seed replays every session's targets
+        self.streams = RandomStreams(seed)
+        self.config = SessionConfig(min_number, max_number, max_attempts, adversarial,
+                                    self.streams.stream("sessions"))
+        self.clock = clock
+        self._sessions = OrderedDict()
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+    def create(self):
+        """
+        Add a new (idle) session
+
+        Returns:
+            int: The new session id
+        """
+        session_id = self._next_id
+        self._next_id += 1
+        session = CompactSession(self.config)
+        session.last_seen = self.clock()
+        self._sessions[session_id] = session
+        return session_id
+
+    def get(self, session_id):
+        """
+        Look up a session and mark it as recently used
+
+        Returns:
+            CompactSession: The session, or None if unknown or evicted
+        """
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_seen = self.clock()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def remove(self, session_id):
+        """Drop a session (e.g. when its connection closes)"""
+        self._sessions.pop(session_id, None)
+
+    def evict_idle(self, max_idle):
+        """
+        Drop sessions unused for more than max_idle seconds
+
+        Only the stale front of the LRU order is visited.
+
+        Returns:
+            list: Evicted session ids
+        """
+        deadline = self.clock() - max_idle
+        evicted = []
+        sessions = self._sessions
+        while sessions:
+            session_id, session = next(iter(sessions.items()))
+            if session.last_seen >= deadline:
+                break
+            sessions.popitem(last=False)
+            evicted.append(session_id)
+        return evicted
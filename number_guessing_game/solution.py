@@ -1,36 +1,86 @@
-import tkinter as tk
-from tkinter import messagebox, scrolledtext
-import random
+import sys
+
 from game_config import GameConfig
-from utils import generate_random_number, format_history_entry, validate_number_input
+from utils import format_history_entry, validate_many, VALID
+from engine import GameEngine, calculate_feedback, CORRECT
+from hint_engine import HintEngine
+from score_store import ScoreStore
+from replay_log import ReplayLogWriter
+from view_model import ViewModel
+from history import GuessHistory
+from rng import RandomStreams
+from config_loader import ConfigWatcher
+
+# tkinter is imported when the first window is created, so importing this
+# module stays cheap for tests and headless tools
+
+def load_gui():
+    """
+    Import tkinter and its message boxes
+    
+    Runs for every new window (a cheap sys.modules lookup after the first
+    time), so a stand-in installed with tests/headless_tk.install() is picked up.
+    Each window keeps the modules it was built with.
+    
+    Returns:
+        tuple: (tkinter, tkinter.messagebox)
+    """
+    import tkinter
+    import tkinter.messagebox
+    return tkinter, tkinter.messagebox
 
 class NumberGuessingGame:
     """Main game class implementing the Number Guessing Game"""
     
-    def __init__(self, root):
+    def __init__(self, root, config_path=None):
         """
         Initialize the game with the main window
         
         Args:
             root: Tkinter root window
+            config_path (str): Settings file, GameConfig.CONFIG_PATH by default
         """
+        self.tk, self.messagebox = load_gui()
+        
+        # Settings from the config file (GameConfig defaults without one),
+        # compiled once and reloaded between rounds when the file changes
+        self.config_watcher = ConfigWatcher(config_path or GameConfig.CONFIG_PATH)
+        self.config = self.config_watcher.config
+        
         self.root = root
         self.root.title("🎯 Number Guessing Game")
-        self.root.geometry(f"{GameConfig.WINDOW_WIDTH}x{GameConfig.WINDOW_HEIGHT}")
-        self.root.configure(bg=GameConfig.BACKGROUND_COLOR)
+        self.root.geometry(self.config.geometry)
+        self.root.configure(bg=self.config.background_color)
         self.root.resizable(False, False)
         
         # Game configuration variables
-        self.min_number = GameConfig.MIN_NUMBER
-        self.max_number = GameConfig.MAX_NUMBER
-        self.max_attempts = GameConfig.MAX_ATTEMPTS
+        self.min_number = self.config.min_number
+        self.max_number = self.config.max_number
+        self.max_attempts = self.config.max_attempts
+        
+        # Game state lives in the headless engine; the window is a view over it
+        # Targets come from a seeded stream; the seed replays the session
+        self.random_streams = RandomStreams(self.config.random_seed)
         
-        # Game state variables
-        self.target_number = 0
-        self.attempts = 0
-        self.best_score = float('inf')
-        self.game_active = False
-        self.guess_history = []
+        # Guess history is a bounded ring buffer spilling to disk
+        self.engine = GameEngine(self.min_number, self.max_number, self.max_attempts,
+                                 rng=self.random_streams.stream("game"),
+                                 history=GuessHistory(self.config.history_capacity,
+                                                      self.config.history_spill_dir))
+        
+        # Persistent scores: writes go to a background thread, reads hit a cache
+        self.player_name = self.config.player_name
+        self.difficulty = self.config.difficulty
+        self.score_store = ScoreStore(self.config.scores_db_path)
+        
+        # Binary replay log of every guess, written off the Tk thread
+        self.replay_log = ReplayLogWriter(self.config.replay_log_path)
+        
+        # Hints and optimal guesses over the feasible range (solver tables, closed forms)
+        self.hint_engine = HintEngine(self.min_number, self.max_number, self.max_attempts)
+        
+        # Widget changes are batched and diffed, then applied once per idle
+        self.view = ViewModel(self.root)
         
         # UI component references
         self.guess_entry = None
@@ -38,7 +88,9 @@ class NumberGuessingGame:
         self.feedback_label = None
         self.attempts_label = None
         self.best_score_label = None
+        self.range_label = None
         self.history_listbox = None
+        self.history_view = None
         self.new_game_button = None
         self.hint_button = None
         
@@ -47,42 +99,66 @@ class NumberGuessingGame:
         self.setup_key_bindings()
         self.new_game()
     
+    # === ENGINE STATE ===
+    
+    @property
+    def target_number(self):
+        return self.engine.target_number
+    
+    @property
+    def attempts(self):
+        return self.engine.attempts
+    
+    @property
+    def game_active(self):
+        return self.engine.game_active
+    
+    @property
+    def guess_history(self):
+        return self.engine.guess_history
+    
+    @property
+    def best_score(self):
+        best = self.score_store.best_score(self.player_name, self.difficulty)
+        return float('inf') if best is None else best
+    
     # === CORE GAME METHODS ===
     
     def setup_gui(self):
         """Create and layout all GUI components"""
+        tk = self.tk
         
         # Title label with game name
         title_label = tk.Label(
             self.root,
             text="🎯 Number Guessing Game",
-            font=GameConfig.FONTS['title'],
-            bg=GameConfig.BACKGROUND_COLOR,
-            fg=GameConfig.COLORS['text']
+            font=self.config.fonts['title'],
+            bg=self.config.background_color,
+            fg=self.config.colors['text']
         )
         title_label.pack(pady=20)
         
         # Score display frame
-        score_frame = tk.Frame(self.root, bg=GameConfig.BACKGROUND_COLOR)
+        score_frame = tk.Frame(self.root, bg=self.config.background_color)
         score_frame.pack(pady=10)
         
         # Range display
-        range_label = tk.Label(
+        self.range_label = tk.Label(
             score_frame,
-            text=f"🎲 Guess a number between {self.min_number} and {self.max_number}",
-            font=GameConfig.FONTS['heading'],
-            bg=GameConfig.BACKGROUND_COLOR,
-            fg=GameConfig.COLORS['info']
+            text=self.config.range_text,
+            font=self.config.fonts['heading'],
+            bg=self.config.background_color,
+            fg=self.config.colors['info']
         )
-        range_label.pack()
+        self.range_label.pack()
         
         # Attempts display with color coding
         self.attempts_label = tk.Label(
             score_frame,
             text=f"Attempts: {self.attempts}/{self.max_attempts}",
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.BACKGROUND_COLOR,
-            fg=GameConfig.COLORS['success']
+            font=self.config.fonts['normal'],
+            bg=self.config.background_color,
+            fg=self.config.colors['success']
         )
         self.attempts_label.pack(pady=5)
         
@@ -90,27 +166,30 @@ class NumberGuessingGame:
         self.best_score_label = tk.Label(
             score_frame,
             text="Best Score: Not set",
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.BACKGROUND_COLOR,
-            fg=GameConfig.COLORS['warning']
+            font=self.config.fonts['normal'],
+            bg=self.config.background_color,
+            fg=self.config.colors['warning']
         )
         self.best_score_label.pack()
+        self.view.track(self.attempts_label, 'text', 'fg')
+        self.view.track(self.best_score_label, 'text')
+        self.view.track(self.range_label, 'text')
         
         # Input section with entry and submit button
-        input_frame = tk.Frame(self.root, bg=GameConfig.BACKGROUND_COLOR)
+        input_frame = tk.Frame(self.root, bg=self.config.background_color)
         input_frame.pack(pady=30)
         
         tk.Label(
             input_frame,
             text="Enter your guess:",
-            font=GameConfig.FONTS['heading'],
-            bg=GameConfig.BACKGROUND_COLOR,
-            fg=GameConfig.COLORS['text']
+            font=self.config.fonts['heading'],
+            bg=self.config.background_color,
+            fg=self.config.colors['text']
         ).pack()
         
         self.guess_entry = tk.Entry(
             input_frame,
-            font=GameConfig.FONTS['normal'],
+            font=self.config.fonts['normal'],
             width=15,
             justify="center",
             relief="solid",
@@ -122,8 +201,8 @@ class NumberGuessingGame:
             input_frame,
             text="🎯 Submit Guess",
             command=self.submit_guess,
-            font=GameConfig.FONTS['heading'],
-            bg=GameConfig.COLORS['info'],
+            font=self.config.fonts['heading'],
+            bg=self.config.colors['info'],
             fg="white",
             padx=20,
             pady=10,
@@ -133,35 +212,37 @@ class NumberGuessingGame:
         self.submit_button.pack(pady=5)
         
         # Feedback display area with appropriate colors
-        self.feedback_frame = tk.Frame(self.root, bg=GameConfig.BACKGROUND_COLOR)
+        self.feedback_frame = tk.Frame(self.root, bg=self.config.background_color)
         self.feedback_frame.pack(pady=20, fill="x", padx=50)
         
         self.feedback_label = tk.Label(
             self.feedback_frame,
             text="🤔 Make your first guess!",
-            font=GameConfig.FONTS['heading'],
-            bg=GameConfig.COLORS['warning'],
+            font=self.config.fonts['heading'],
+            bg=self.config.colors['warning'],
             fg="white",
             pady=15,
             relief="solid",
-            borderwidth=2
+            borderwidth=2,
+            wraplength=self.config.window_width - 60
         )
         self.feedback_label.pack(fill="x")
+        self.view.track(self.feedback_label, 'text', 'bg')
         
         # Guess history with scrollable listbox
-        history_frame = tk.Frame(self.root, bg=GameConfig.BACKGROUND_COLOR)
+        history_frame = tk.Frame(self.root, bg=self.config.background_color)
         history_frame.pack(pady=20, fill="both", expand=True, padx=50)
         
         tk.Label(
             history_frame,
             text="📋 Guess History:",
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.BACKGROUND_COLOR,
-            fg=GameConfig.COLORS['text']
+            font=self.config.fonts['normal'],
+            bg=self.config.background_color,
+            fg=self.config.colors['text']
         ).pack(anchor="w")
         
         # History listbox with scrollbar
-        history_container = tk.Frame(history_frame, bg=GameConfig.BACKGROUND_COLOR)
+        history_container = tk.Frame(history_frame, bg=self.config.background_color)
         history_container.pack(fill="both", expand=True, pady=5)
         
         scrollbar = tk.Scrollbar(history_container)
@@ -170,25 +251,30 @@ class NumberGuessingGame:
         self.history_listbox = tk.Listbox(
             history_container,
             font=("Courier", 10),
-            yscrollcommand=scrollbar.set,
             relief="solid",
             borderwidth=1,
             bg="#ffffff",
             height=6
         )
         self.history_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.config(command=self.history_listbox.yview)
+        
+        # Only the visible rows are materialized; the scrollbar spans the whole history
+        self.history_view = self.view.list_view(
+            self.history_listbox, scrollbar, rows=6,
+            count=lambda: len(self.guess_history),
+            row_text=self.history_row
+        )
         
         # Control buttons (New Game, Hint, Quit)
-        button_frame = tk.Frame(self.root, bg=GameConfig.BACKGROUND_COLOR)
+        button_frame = tk.Frame(self.root, bg=self.config.background_color)
         button_frame.pack(pady=20)
         
         self.new_game_button = tk.Button(
             button_frame,
             text="🎮 New Game",
             command=self.new_game,
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.COLORS['success'],
+            font=self.config.fonts['normal'],
+            bg=self.config.colors['success'],
             fg="white",
             padx=15,
             pady=8
@@ -199,8 +285,8 @@ class NumberGuessingGame:
             button_frame,
             text="💡 Hint",
             command=self.show_hint,
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.COLORS['warning'],
+            font=self.config.fonts['normal'],
+            bg=self.config.colors['warning'],
             fg="white",
             padx=15,
             pady=8
@@ -211,8 +297,8 @@ class NumberGuessingGame:
             button_frame,
             text="🔄 Reset",
             command=self.reset_game,
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.COLORS['info'],
+            font=self.config.fonts['normal'],
+            bg=self.config.colors['info'],
             fg="white",
             padx=15,
             pady=8
@@ -223,8 +309,8 @@ class NumberGuessingGame:
             button_frame,
             text="❌ Quit",
             command=self.on_window_close,
-            font=GameConfig.FONTS['normal'],
-            bg=GameConfig.COLORS['error'],
+            font=self.config.fonts['normal'],
+            bg=self.config.colors['error'],
             fg="white",
             padx=15,
             pady=8
@@ -232,14 +318,14 @@ class NumberGuessingGame:
         quit_button.pack(side="left", padx=10)
         
         # Instructions/help text
-        instructions_frame = tk.Frame(self.root, bg=GameConfig.BACKGROUND_COLOR)
+        instructions_frame = tk.Frame(self.root, bg=self.config.background_color)
         instructions_frame.pack(pady=10)
         
         instructions = tk.Label(
             instructions_frame,
             text="🎯 First to guess in fewest attempts wins! | Press Enter to submit | Use hints wisely!",
-            font=GameConfig.FONTS['small'],
-            bg=GameConfig.BACKGROUND_COLOR,
+            font=self.config.fonts['small'],
+            bg=self.config.background_color,
             fg="gray"
         )
         instructions.pack()
@@ -249,6 +335,7 @@ class NumberGuessingGame:
         self.guess_entry.bind('<Return>', self.on_enter_key)
         self.root.bind('<Control-n>', lambda e: self.new_game())
         self.root.bind('<Control-h>', lambda e: self.show_hint())
+        self.root.bind('<Control-a>', lambda e: self.auto_play_step())
         self.root.bind('<Control-r>', lambda e: self.reset_game())
         self.root.bind('<Control-q>', lambda e: self.on_window_close())
         
@@ -258,35 +345,56 @@ class NumberGuessingGame:
     def new_game(self):
         """Initialize a new game round"""
         
-        # Generate new random target number (1-100)
-        self.target_number = generate_random_number(self.min_number, self.max_number)
+        # Swap in the config file if it changed since the last round
+        config = self.config_watcher.poll()
+        if config is not None:
+            self.apply_config(config)
         
-        # Reset attempt counter to 0
-        self.attempts = 0
-        
-        # Clear input field and guess history
-        self.guess_entry.delete(0, tk.END)
-        self.history_listbox.delete(0, tk.END)
-        self.guess_history.clear()
+        # Generate new target, reset attempts and history, mark game active
+        self.engine.new_game()
+        self.replay_log.begin_game(self.min_number, self.max_number,
+                                   self.max_attempts, self.target_number)
         
-        # Reset feedback messages
-        self.show_feedback("🤔 Make your first guess!", GameConfig.COLORS['warning'])
+        # Enable input controls right away: key events already queued
+        # (e.g. Ctrl+A) must not find the entry still disabled
+        self.enable_input()
         
-        # Enable input controls
-        self.guess_entry.config(state="normal")
-        self.submit_button.config(state="normal")
-        self.hint_button.config(state="normal")
-        
-        # Set game state to active
-        self.game_active = True
+        # Clear input field and guess history
+        self.guess_entry.delete(0, self.tk.END)
+        self.history_view.refresh()
+        
+        # Reset feedback messages; a config file that failed to load is
+        # reported instead of the welcome (the settings in use are kept)
+        if self.config_watcher.error:
+            self.show_feedback(f"⚠️ Settings not loaded: {self.config_watcher.error}",
+                               self.config.colors['warning'])
+        else:
+            self.show_feedback(*self.config.welcome)
         
         # Focus cursor on input field
         self.guess_entry.focus_set()
         
         # Update display
         self.update_display()
+    
+    def apply_config(self, config):
+        """
+        Switch to a reloaded configuration (between rounds)
         
-        print(f"Debug: Target number is {self.target_number}")  # Remove in production
+        Range, attempts, player, messages and colors of the feedback take
+        effect for the next round; window size, fonts, paths and the seed
+        are read once at startup.
+        """
+        previous, self.config = self.config, config
+        self.player_name = config.player_name
+        if not config.same_game(previous):
+            self.min_number = config.min_number
+            self.max_number = config.max_number
+            self.max_attempts = config.max_attempts
+            self.difficulty = config.difficulty
+            self.engine.configure(self.min_number, self.max_number, self.max_attempts)
+            self.hint_engine = HintEngine(self.min_number, self.max_number, self.max_attempts)
+            self.view.set(self.range_label, text=config.range_text)
     
     def submit_guess(self):
         """Process and validate player's guess"""
@@ -299,150 +407,139 @@ class NumberGuessingGame:
         is_valid, guess, error_message = self.validate_input(input_text)
         
         if not is_valid:
-            self.show_feedback(f"❌ {error_message}", GameConfig.COLORS['error'])
-            self.guess_entry.delete(0, tk.END)
+            self.show_feedback(error_message, self.config.colors['error'])
+            self.guess_entry.delete(0, self.tk.END)
             return
         
-        # Increment attempt counter
-        self.attempts += 1
-        
-        # Compare guess with target number
-        feedback = self.calculate_feedback(guess, self.target_number)
+        # Let the engine count the attempt and compare with the target
+        feedback = self.engine.guess(guess)
+        self.replay_log.log_guess(guess, feedback)
+        self.view.stats.guesses += 1
         
         # Add guess to history display
         self.add_to_history(guess, feedback)
         
-        # Generate appropriate feedback message
-        if feedback == "Correct!":
-            self.show_feedback("🎉 Congratulations! You found it!", GameConfig.COLORS['success'])
+        # Feedback message and color, precomputed by the config
+        self.show_feedback(*self.config.feedback[feedback])
+        if feedback == CORRECT:
             self.check_game_end()
-        elif feedback == "Too High":
-            self.show_feedback("📉 Too High! Try a lower number.", GameConfig.COLORS['error'])
-        else:  # Too Low
-            self.show_feedback("📈 Too Low! Try a higher number.", GameConfig.COLORS['error'])
         
         # Clear input for next guess
-        self.guess_entry.delete(0, tk.END)
+        self.guess_entry.delete(0, self.tk.END)
         
         # Update UI elements accordingly
         self.update_display()
         
         # Check for win/loss conditions
-        if self.attempts >= self.max_attempts and feedback != "Correct!":
+        if self.engine.lost:
             self.check_game_end()
     
     def check_game_end(self):
         """Determine if game has ended and handle accordingly"""
         
-        if not self.game_active:
-            return
+        # Finished games go to the replay log
+        if self.engine.won or self.engine.lost:
+            self.replay_log.end_game(self.engine.target_number)
         
         # Win Condition: Player guessed correct number
-        if self.guess_history and self.guess_history[-1][1] == "Correct!":
+        if self.engine.won:
             # Update best score if applicable
             self.update_best_score(self.attempts)
             
-            # Display victory message
+            # Display victory message over the final board
+            self.view.flush()
             if self.attempts == self.best_score:
-                messagebox.showinfo(
+                self.messagebox.showinfo(
                     "🏆 New Record!",
                     f"New best score: {self.attempts} attempts!\n🎉 Excellent guessing!"
                 )
             else:
-                messagebox.showinfo(
+                self.messagebox.showinfo(
                     "🎉 You Won!",
                     f"Great job! You found {self.target_number} in {self.attempts} attempts!"
                 )
             
             # Disable input controls
-            self.guess_entry.config(state="disabled")
-            self.submit_button.config(state="disabled")
-            self.game_active = False
+            self.view.set(self.guess_entry, state="disabled")
+            self.view.set(self.submit_button, state="disabled")
             
         # Loss Condition: Maximum attempts reached without correct guess
-        elif self.attempts >= self.max_attempts:
+        elif self.engine.lost:
+            self.score_store.record(self.player_name, self.difficulty, self.attempts, won=False)
+            
             # Reveal the target number
             self.show_feedback(
-                f"💀 Game Over! The number was {self.target_number}",
-                GameConfig.COLORS['error']
+                self.config.game_over(self.target_number),
+                self.config.colors['error']
             )
             
-            # Display game over message
-            messagebox.showinfo(
+            # Display game over message over the final board
+            self.view.flush()
+            self.messagebox.showinfo(
                 "😔 Game Over",
                 f"Sorry! You've used all {self.max_attempts} attempts.\n"
                 f"The number was {self.target_number}.\n\nTry again!"
             )
             
             # Disable input controls
-            self.guess_entry.config(state="disabled")
-            self.submit_button.config(state="disabled")
-            self.game_active = False
+            self.view.set(self.guess_entry, state="disabled")
+            self.view.set(self.submit_button, state="disabled")
     
     # === UI UPDATE METHODS ===
     
     def update_display(self):
         """Refresh all dynamic UI elements"""
         
-        # Attempt counter with color coding
-        self.attempts_label.config(text=f"Attempts: {self.attempts}/{self.max_attempts}")
+        # Attempt counter with color coding (unchanged values are not re-sent)
+        self.view.set(self.attempts_label, text=f"Attempts: {self.attempts}/{self.max_attempts}")
         
         remaining = self.max_attempts - self.attempts
-        if remaining <= 2:
-            self.attempts_label.config(fg=GameConfig.COLORS['error'])  # Red
-        elif remaining <= 5:
-            self.attempts_label.config(fg=GameConfig.COLORS['warning'])  # Orange
-        else:
-            self.attempts_label.config(fg=GameConfig.COLORS['success'])  # Green
+        self.view.set(self.attempts_label, fg=self.config.attempt_color(remaining))
         
         # Best score display
         if self.best_score == float('inf'):
-            self.best_score_label.config(text="Best Score: Not set")
+            self.view.set(self.best_score_label, text="Best Score: Not set")
         else:
-            self.best_score_label.config(text=f"Best Score: {self.best_score} attempts")
+            self.view.set(self.best_score_label, text=f"Best Score: {self.best_score} attempts")
+    
+    def enable_input(self):
+        """Enable the entry and buttons now rather than at the next idle"""
+        self.view.set(self.guess_entry, state="normal")
+        self.view.set(self.submit_button, state="normal")
+        self.view.set(self.hint_button, state="normal")
+        self.view.flush()
     
     def show_feedback(self, message, color):
         """Display feedback message to player"""
-        self.feedback_label.config(text=message, bg=color)
+        self.view.set(self.feedback_label, text=message, bg=color)
     
     def add_to_history(self, guess, feedback):
         """Add guess and result to history display"""
         
-        # Format: "#3: 45 → Too High"
-        history_text = format_history_entry(self.attempts, guess, feedback)
-        
-        # Add to internal history
-        self.guess_history.append((guess, feedback))
-        
-        # Add to listbox
-        self.history_listbox.insert(tk.END, history_text)
-        
-        # Auto-scroll to bottom
-        self.history_listbox.see(tk.END)
-        
-        # Limit history to reasonable size (optional)
-        if self.history_listbox.size() > 20:
-            self.history_listbox.delete(0)
+        # The entry is already in the engine's history; redraw the visible
+        # rows (scrolled to the bottom) at the next idle
+        self.history_view.refresh()
+    
+    def history_row(self, row):
+        """Text of one history row, counting from the oldest entry kept"""
+        guess, feedback = self.guess_history[row]
+        return format_history_entry(self.guess_history.first_index + row + 1, guess, feedback)
     
     # === GAME LOGIC METHODS ===
     
     def validate_input(self, input_text):
         """Validate and convert user input"""
-        return validate_number_input(input_text, self.min_number, self.max_number)
+        status, number = next(validate_many((input_text,), self.min_number, self.max_number))
+        return status == VALID, number, self.config.invalid_messages[status]
     
     def calculate_feedback(self, guess, target):
         """Generate feedback based on guess comparison"""
-        if guess == target:
-            return "Correct!"
-        elif guess > target:
-            return "Too High"
-        else:
-            return "Too Low"
+        return calculate_feedback(guess, target)
     
     def update_best_score(self, attempts):
         """Update best score if current game is better"""
-        if attempts < self.best_score:
-            self.best_score = attempts
+        # Every win is persisted; the store's cached view keeps the best
+        if self.score_store.record(self.player_name, self.difficulty, attempts, won=True):
             self.update_display()
     
     # === HELPER FEATURES ===
@@ -451,52 +548,41 @@ class NumberGuessingGame:
         """Provide helpful hint to player"""
         
         if not self.game_active:
-            messagebox.showinfo("Game Not Active", "Start a new game first!")
+            self.messagebox.showinfo("Game Not Active", "Start a new game first!")
             return
         
-        if self.attempts == 0:
-            messagebox.showinfo("💡 Hint", "Start with 50 - it's right in the middle!")
-            return
+        self.replay_log.log_hint()
         
-        # Based on previous guesses: suggest strategy
-        if len(self.guess_history) > 0:
-            last_guess, last_feedback = self.guess_history[-1]
-            
-            if last_feedback == "Too High":
-                hint = f"🎯 Try a number lower than {last_guess}"
-            elif last_feedback == "Too Low":
-                hint = f"🎯 Try a number higher than {last_guess}"
-            else:
-                hint = "🤔 Think about the pattern in your guesses"
-        else:
-            hint = "🎲 Try the middle of the remaining range"
+        # Odds and suggestion for everything the previous guesses ruled out
+        hint = self.hint_engine.format_hint(self.hint_engine.hint_for(self.engine),
+                                             self.config.hints)
         
-        # Show remaining attempts
-        remaining = self.max_attempts - self.attempts
-        hint += f"\n💭 You have {remaining} attempts left"
+        self.messagebox.showinfo("💡 Hint", hint)
+    
+    def auto_play_step(self):
+        """Submit the optimal next guess for the player (auto-play)"""
         
-        messagebox.showinfo("💡 Hint", hint)
+        if not self.game_active:
+            return
+        
+        self.guess_entry.delete(0, self.tk.END)
+        self.guess_entry.insert(0, str(self.hint_engine.hint_for(self.engine).suggestion))
+        self.submit_guess()
     
     def reset_game(self):
         """Reset entire game to initial state"""
         
-        # Clear all scores and statistics
-        self.best_score = float('inf')
-        self.attempts = 0
-        self.target_number = 0
-        self.game_active = False
+        # Clear round statistics (persisted best scores are kept)
+        self.engine.stop()
         
         # Clear guess history
-        self.guess_history.clear()
-        self.history_listbox.delete(0, tk.END)
+        self.history_view.refresh()
         
         # Reset all UI elements to defaults
-        self.guess_entry.delete(0, tk.END)
-        self.guess_entry.config(state="normal")
-        self.submit_button.config(state="normal")
-        self.hint_button.config(state="normal")
+        self.enable_input()
+        self.guess_entry.delete(0, self.tk.END)
         
-        self.show_feedback("🎮 Click 'New Game' to start!", GameConfig.COLORS['info'])
+        self.show_feedback(*self.config.not_started)
         
         # Update displays
         self.update_display()
@@ -516,6 +602,8 @@ class NumberGuessingGame:
             self.new_game()
         elif button_type == "hint":
             self.show_hint()
+        elif button_type == "auto_play":
+            self.auto_play_step()
         elif button_type == "reset":
             self.reset_game()
         elif button_type == "quit":
@@ -523,33 +611,57 @@ class NumberGuessingGame:
     
     def on_window_close(self):
         """Handle application shutdown gracefully"""
-        if messagebox.askokcancel("Quit", "Do you want to quit the game?"):
+        if self.messagebox.askokcancel("Quit", "Do you want to quit the game?"):
+            self.close_stores()
+            self.view.cancel()
             self.root.quit()
+    
+    def close_stores(self):
+        """Commit any scores and replays still queued for disk"""
+        self.score_store.close()
+        self.replay_log.close()
+        self.engine.guess_history.close()
+
+def create_window():
+    """
+    Create the centered game window
+    
+    Returns:
+        tuple: (root, game)
+    """
+    # Create root window with proper configuration
+    tk, _ = load_gui()
+    root = tk.Tk()
+    
+    # Initialize game instance
+    game = NumberGuessingGame(root)
+    
+    # Center window on screen
+    root.update_idletasks()
+    width = root.winfo_width()
+    height = root.winfo_height()
+    x = (root.winfo_screenwidth() // 2) - (width // 2)
+    y = (root.winfo_screenheight() // 2) - (height // 2)
+    root.geometry(f'{width}x{height}+{x}+{y}')
+    return root, game
 
 def main():
     """Main function to initialize and run the game"""
     
     try:
-        # Create root window with proper configuration
-        root = tk.Tk()
-        
-        # Initialize game instance
-        game = NumberGuessingGame(root)
-        
-        # Center window on screen
-        root.update_idletasks()
-        width = root.winfo_width()
-        height = root.winfo_height()
-        x = (root.winfo_screenwidth() // 2) - (width // 2)
-        y = (root.winfo_screenheight() // 2) - (height // 2)
-        root.geometry(f'{width}x{height}+{x}+{y}')
+        root, game = create_window()
         
         # Start the main event loop
         root.mainloop()
         
+        game.close_stores()
+        
     except Exception as e:
         # Handle any startup errors gracefully
-        messagebox.showerror("Startup Error", f"Failed to start game: {str(e)}")
+        # Only if tkinter itself loaded
+        messagebox = sys.modules.get("tkinter.messagebox")
+        if messagebox is not None:
+            messagebox.showerror("Startup Error", f"Failed to start game: {str(e)}")
         print(f"Error: {e}")
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+"""Precomputed decision tables for the Number Guessing Game
+
+With uniform random targets the state of a game is just the size of the
+remaining interval, so the optimal policy, its worst case and its
+expected number of guesses are tables indexed by interval size. They are
+built once with dynamic programming, cached in a compact binary file
+keyed by the interval size and memory-mapped on later loads, so a hint
+is a couple of array lookups. HintEngine reads them for ranges up to
+MAX_TABLE_SIZE and falls back to its closed forms above that.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+
+from game_config import GameConfig
+
+# On-disk layout: fixed header, then total[], split[] and worst[] arrays
+# (one entry per interval size 0..size in native byte order, widest first
+# so every array starts aligned). The cache is local to one machine.
+MAGIC = b"NGDT"
+VERSION = 2
+HEADER = struct.Struct("=4sHxxQ")
+HEADER_SIZE = 64
+RECORD_BYTES = 8 + 4 + 1
+
+# Largest interval with tables (about 27 MB on disk, built in ~3 s once)
+MAX_TABLE_SIZE = 1 << 21
+# Smaller tables build faster than a file can be opened, so they stay in memory
+CACHE_MIN_SIZE = 1 << 16
+
+# === DYNAMIC PROGRAMMING ===
+
+def build_tables(size):
+    """
+    Build the policy tables for every interval size up to size
+
+    A guess in an interval of s candidates leaves l below and s - 1 - l
+    above it, so the total guesses over all targets obey
+    T[s] = s + min_l (T[l] + T[s - 1 - l]) and the worst case
+    W[s] = 1 + max(W[l], W[s - 1 - l]) of the chosen split. By Knuth's
+    monotonicity of optimal search tree roots, the best l for s is the
+    best l for s - 1 or one more, so each step compares two splits and the
+    DP runs in O(size). Ties (equal total) go to the smaller worst case,
+    then to the balanced split, so the tables agree with the closed forms
+    in hint_engine.
+
+    Args:
+        size (int): Largest interval size
+
+    Returns:
+        tuple: (total, split, worst) arrays indexed by interval size;
+               split[s] is the number of candidates left below the guess
+    """
+    total = array("Q", bytes(8 * (size + 1)))
+    split = array("I", bytes(4 * (size + 1)))
+    worst = array("B", bytes(size + 1))
+
+    left = 0
+    for s in range(1, size + 1):
+        right = s - 1 - left
+        cost = total[left] + total[right]
+        high = worst[left] if worst[left] > worst[right] else worst[right]
+        if right > 0:
+            shifted = total[left + 1] + total[right - 1]
+            shifted_high = max(worst[left + 1], worst[right - 1])
+            if (shifted, shifted_high, abs(right - left - 2)) < (cost, high, right - left):
+                left, right, cost, high = left + 1, right - 1, shifted, shifted_high
+        split[s] = left
+        total[s] = s + cost
+        worst[s] = 1 + high
+
+    return total, split, worst
+
+# === DECISION TABLE ===
+
+class DecisionTable:
+    """Read-only view over the tables for intervals of up to size candidates"""
+
+    def __init__(self, total, split, worst, mapping=None):
+        self.size = len(total) - 1
+        self.total = total
+        self.split = split
+        self.worst = worst
+        self._mapping = mapping
+
+    @property
+    def mapped(self):
+        """True if the tables are backed by the cache file"""
+        return self._mapping is not None
+
+    def best_guess(self, lo, hi):
+        """Optimal next guess for the remaining interval [lo, hi]"""
+        return lo + self.split[hi - lo + 1]
+
+    def worst_case(self, lo, hi):
+        """Guesses needed in the worst case with optimal play"""
+        return self.worst[hi - lo + 1]
+
+    def expected_attempts(self, lo, hi):
+        """Expected guesses with optimal play and a uniform target"""
+        size = hi - lo + 1
+        return self.total[size] / size if size > 0 else 0.0
+
+    def close(self):
+        """Release the memory map backing the tables"""
+        if self._mapping is not None:
+            self.total.release()
+            self.split.release()
+            self.worst.release()
+            self._mapping.close()
+            self._mapping = None
+
+# === CACHE FILES ===
+
+def cache_path(size, cache_dir=GameConfig.TABLE_CACHE_DIR):
+    """File of the cached tables for intervals of up to size candidates"""
+    return os.path.join(cache_dir, f"decision_{size}.ngdt")
+
+def save_tables(path, total, split, worst):
+    """Write the tables atomically (temp file + rename)"""
+    header = HEADER.pack(MAGIC, VERSION, len(total) - 1)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for table in (total, split, worst):
+            table.tofile(f)
+    os.replace(temp_path, path)
+
+def map_tables(path, size):
+    """
+    Memory-map a cached table file
+
+    Returns:
+        DecisionTable: Table backed by the mapping, or None if the file is
+        missing, damaged or built for another size
+    """
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapping) != HEADER_SIZE + (size + 1) * RECORD_BYTES:
+        mapping.close()
+        return None
+    magic, version, file_size = HEADER.unpack_from(mapping)
+    if (magic, version, file_size) != (MAGIC, VERSION, size):
+        mapping.close()
+        return None
+
+    view = memoryview(mapping)
+    offset = HEADER_SIZE
+    total = view[offset:offset + 8 * (size + 1)].cast("Q")
+    offset += 8 * (size + 1)
+    split = view[offset:offset + 4 * (size + 1)].cast("I")
+    offset += 4 * (size + 1)
+    worst = view[offset:offset + size + 1].cast("B")
+    view.release()
+    return DecisionTable(total, split, worst, mapping)
+
+def load_decision_table(size, cache_dir=GameConfig.TABLE_CACHE_DIR):
+    """
+    Tables for intervals of up to size candidates, built and cached if needed
+
+    Args:
+        size (int): Largest interval size (MAX_NUMBER - MIN_NUMBER + 1)
+        cache_dir (str): Cache directory, None to keep the tables in memory
+
+    Returns:
+        DecisionTable: Memory-mapped table (in memory for small sizes or
+        when the cache cannot be written)
+    """
+    if size > MAX_TABLE_SIZE:
+        raise ValueError(f"interval of {size} candidates is above MAX_TABLE_SIZE")
+    if cache_dir is None or size < CACHE_MIN_SIZE:
+        return DecisionTable(*build_tables(size))
+
+    path = cache_path(size, cache_dir)
+    table = map_tables(path, size)
+    if table is not None:
+        return table
+
+    tables = build_tables(size)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        save_tables(path, *tables)
+    except OSError:
+        return DecisionTable(*tables)  # Read-only or full disk: keep them in memory
+    return map_tables(path, size) or DecisionTable(*tables)
@@ -0,0 +1,338 @@
+"""Headless stand-in for tkinter and tkinter.messagebox
+
+The fake widgets keep their options, text and bindings in plain Python
+objects, count the calls that would reach Tcl (configure and the Listbox
+edits) and record every message box instead of showing it. No display,
+Tcl interpreter or Xvfb is involved, so the real NumberGuessingGame can be
+driven by scripts and tests and its UI state asserted on:
+
+    fake = headless_tk.install()          # before the window is created
+    root = fake.Tk()
+    game = NumberGuessingGame(root)
+    game.guess_entry.insert(0, "50")
+    game.guess_entry.event_generate("<Return>")
+    root.update()                          # run the idle callbacks (view flush)
+    game.feedback_label.cget("text"), fake.messagebox.calls
+    headless_tk.uninstall()
+
+Only what the game uses is implemented: Tk, Frame, Label, Button, Entry,
+Listbox and Scrollbar with options, pack, bind and the idle queue.
+"""
+
+import sys
+import types
+
+END = "end"
+
+class TclError(Exception):
+    """Raised like tkinter.TclError, e.g. for unknown options"""
+
+class Event:
+    """Event passed to bound callbacks"""
+
+    def __init__(self, widget, sequence, **fields):
+        self.widget = widget
+        self.sequence = sequence
+        self.delta = 0
+        self.__dict__.update(fields)
+
+# === WIDGETS ===
+
+class Widget:
+    """Options, geometry and bindings of one fake widget"""
+
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.root = master.root if master is not None else self
+        self.options = dict(options)
+        self.packed = None
+        self.bindings = {}
+        self.destroyed = False
+        self.calls = 0  # configure and content edits, as Tk would receive them
+        self.root.widgets.append(self)
+
+    def cget(self, option):
+        try:
+            return self.options[option]
+        except KeyError:
+            raise TclError(f'unknown option "-{option}"') from None
+
+    def configure(self, **options):
+        self.calls += 1
+        self.options.update(options)
+
+    config = configure
+
+    def __getitem__(self, option):
+        return self.cget(option)
+
+    def __setitem__(self, option, value):
+        self.configure(**{option: value})
+
+    def pack(self, **options):
+        self.packed = options
+
+    grid = place = pack
+
+    def bind(self, sequence, callback):
+        self.bindings[sequence] = callback
+
+    def event_generate(self, sequence, **fields):
+        """Run the callbacks bound to sequence here and on the root, like Tk"""
+        event = Event(self, sequence, **fields)
+        for widget in (self, self.root) if self is not self.root else (self,):
+            callback = widget.bindings.get(sequence)
+            if callback is not None and callback(event) == "break":
+                break
+
+    def focus_set(self):
+        self.root.focus = self
+
+    def destroy(self):
+        self.destroyed = True
+
+class Tk(Widget):
+    """Root window with an idle queue that runs on update()"""
+
+    def __init__(self, **options):
+        self.widgets = []
+        self.idle = {}
+        self.next_id = 0
+        self.focus = None
+        self.window_title = ""
+        self.window_geometry = ""
+        self.running = False
+        super().__init__(None, **options)
+
+    def title(self, text=None):
+        if text is None:
+            return self.window_title
+        self.window_title = text
+
+    def geometry(self, spec=None):
+        if spec is None:
+            return self.window_geometry
+        self.window_geometry = spec
+
+    def resizable(self, width=None, height=None):
+        pass
+
+    def after_idle(self, callback, *args):
+        self.next_id += 1
+        self.idle[f"after#{self.next_id}"] = (callback, args)
+        return f"after#{self.next_id}"
+
+    def after(self, delay, callback=None, *args):
+        # Time does not pass here: delayed calls run at the next update()
+        return self.after_idle(callback, *args)
+
+    def after_cancel(self, callback_id):
+        self.idle.pop(callback_id, None)
+
+    def update_idletasks(self):
+        """Run pending idle callbacks (including ones they schedule)"""
+        while self.idle:
+            callbacks, self.idle = list(self.idle.values()), {}
+            for callback, args in callbacks:
+                callback(*args)
+
+    update = update_idletasks
+
+    def mainloop(self):
+        self.running = True
+        self.update()
+
+    def quit(self):
+        self.running = False
+
+    def winfo_width(self):
+        return int(self.window_geometry.split("x")[0]) if "x" in self.window_geometry else 1
+
+    def winfo_height(self):
+        if "x" not in self.window_geometry:
+            return 1
+        return int(self.window_geometry.split("x")[1].split("+")[0])
+
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+    def find(self, cls, **options):
+        """Widgets of class cls whose options include options"""
+        return [widget for widget in self.widgets if isinstance(widget, cls)
+                and all(widget.options.get(key) == value for key, value in options.items())]
+
+class Frame(Widget):
+    pass
+
+class Label(Widget):
+    pass
+
+class Button(Widget):
+
+    def invoke(self):
+        """Click the button (nothing happens while it is disabled)"""
+        command = self.options.get("command")
+        if command is not None and self.options.get("state") != "disabled":
+            return command()
+
+def _index(index, length):
+    if index == END:
+        return length
+    return min(int(index), length)
+
+class Entry(Widget):
+    """Single-line text; like Tk, edits are ignored while disabled"""
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.text = ""
+
+    def get(self):
+        return self.text
+
+    def insert(self, index, text):
+        if self.options.get("state") != "disabled":
+            position = _index(index, len(self.text))
+            self.text = self.text[:position] + str(text) + self.text[position:]
+
+    def delete(self, first, last=None):
+        if self.options.get("state") != "disabled":
+            start = _index(first, len(self.text))
+            stop = start + 1 if last is None else _index(last, len(self.text))
+            self.text = self.text[:start] + self.text[stop:]
+
+    def type(self, text):
+        """Replace the text and press Enter, as a player would"""
+        self.delete(0, END)
+        self.insert(0, text)
+        self.event_generate("<Return>")
+
+class Listbox(Widget):
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.rows = []
+
+    def insert(self, index, *rows):
+        self.calls += 1
+        position = _index(index, len(self.rows))
+        self.rows[position:position] = rows
+
+    def delete(self, first, last=None):
+        self.calls += 1
+        start = _index(first, len(self.rows))
+        stop = start + 1 if last is None else _index(last, len(self.rows) - 1) + 1
+        del self.rows[start:stop]
+
+    def get(self, first, last=None):
+        if last is None:
+            return self.rows[_index(first, len(self.rows))]
+        return tuple(self.rows[_index(first, len(self.rows)):_index(last, len(self.rows)) + 1])
+
+    def size(self):
+        return len(self.rows)
+
+    def see(self, index):
+        self.calls += 1
+
+class Scrollbar(Widget):
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.position = (0.0, 1.0)
+
+    def set(self, first, last):
+        self.position = (float(first), float(last))
+
+    def get(self):
+        return self.position
+
+# === MESSAGE BOXES ===
+
+class MessageBoxes:
+    """Records message boxes; ask* dialogs return queued answers (default True)"""
+
+    def __init__(self):
+        self.calls = []
+        self.answers = []
+
+    def _show(self, kind, title, message):
+        self.calls.append((kind, title, message))
+
+    def _ask(self, kind, title, message):
+        self.calls.append((kind, title, message))
+        return self.answers.pop(0) if self.answers else True
+
+    def titles(self):
+        return [title for _, title, _ in self.calls]
+
+    def clear(self):
+        self.calls.clear()
+
+def _messagebox_module():
+    boxes = MessageBoxes()
+    module = types.ModuleType("tkinter.messagebox")
+    module.boxes = boxes
+    module.calls = boxes.calls
+    module.answers = boxes.answers
+    module.titles = boxes.titles
+    module.clear = boxes.clear
+    for kind in ("showinfo", "showwarning", "showerror"):
+        setattr(module, kind, lambda title=None, message=None, _kind=kind, **options:
+                boxes._show(_kind, title, message))
+    for kind in ("askokcancel", "askyesno", "askretrycancel", "askquestion"):
+        setattr(module, kind, lambda title=None, message=None, _kind=kind, **options:
+                boxes._ask(_kind, title, message))
+    return module
+
+# === INSTALL ===
+
+_saved = None
+
+def make_tkinter():
+    """
+    A fresh fake tkinter module with its own messagebox recorder
+
+    Returns:
+        module: Fake tkinter; the recorder is module.messagebox
+    """
+    module = types.ModuleType("tkinter")
+    for name, value in (("END", END), ("TclError", TclError), ("Tk", Tk), ("Frame", Frame),
+                        ("Label", Label), ("Button", Button), ("Entry", Entry),
+                        ("Listbox", Listbox), ("Scrollbar", Scrollbar)):
+        setattr(module, name, value)
+    module.messagebox = _messagebox_module()
+    return module
+
+def install():
+    """
+    Make "import tkinter" and "import tkinter.messagebox" give fakes
+
+    Call before the window is created (solution.load_gui imports tkinter
+    when a NumberGuessingGame is built).
+
+    Returns:
+        module: The installed fake tkinter
+    """
+    global _saved
+    if _saved is None:
+        _saved = {name: sys.modules.get(name) for name in ("tkinter", "tkinter.messagebox")}
+    module = make_tkinter()
+    sys.modules["tkinter"] = module
+    sys.modules["tkinter.messagebox"] = module.messagebox
+    return module
+
+def uninstall():
+    """Restore the modules replaced by install()"""
+    global _saved
+    if _saved is None:
+        return
+    for name, module in _saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+    _saved = None
@@ -0,0 +1,90 @@
+"""Unit tests for the benchmark suite"""
+
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import benchmark
+from benchmark import (BENCHMARKS, run_benchmarks, compare, save_baseline, load_baseline,
+                       format_comparison, parse_importtime, PACKAGE_DIR)
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for timing, baselines and regression checks"""
+    
+    def test_every_benchmark_runs(self):
+        """Each benchmark factory gives a callable that works"""
+        for name, factory in BENCHMARKS.items():
+            factory()()
+        
+        results = run_benchmarks(["validate_valid", "engine_full_game"], repeat=1, min_time=0.001)
+        self.assertEqual(set(results), {"validate_valid", "engine_full_game"})
+        self.assertTrue(all(seconds > 0 for seconds in results.values()))
+    
+    def test_widget_call_stats(self):
+        """The window reports the widget calls it really made"""
+        stats = benchmark.widget_call_stats(games=3)
+        self.assertGreater(stats.guesses, 0)
+        self.assertGreater(stats.issued, 0)
+        self.assertGreaterEqual(stats.requested, stats.issued)
+    
+    def test_regressions_are_flagged(self):
+        """Only benchmarks slower than the threshold are flagged"""
+        baseline = {"a": 1.0, "b": 1.0}
+        rows = compare({"a": 1.05, "b": 1.5, "c": 2.0}, baseline, threshold=0.1)
+        
+        flagged = {name: regressed for name, _, _, _, regressed in rows}
+        self.assertEqual(flagged, {"a": False, "b": True, "c": False})
+        report = format_comparison(rows, 0.1)
+        self.assertIn("+50.0%", report)
+        self.assertIn("new", report)
+    
+    def test_baseline_file(self):
+        """Test saving, loading and the command line exit status"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            self.assertEqual(load_baseline(path), {})
+            
+            save_baseline({"validate_valid": 1e-3}, path)
+            self.assertEqual(load_baseline(path), {"validate_valid": 1e-3})
+            
+            args = ["--baseline", path, "--filter", "validate_empty",
+                    "--repeat", "1", "--min-time", "0.001"]
+            # A far slower baseline cannot regress; saving keeps other entries
+            self.assertEqual(benchmark.main(args + ["--save"]), 0)
+            self.assertEqual(set(load_baseline(path)), {"validate_valid", "validate_empty"})
+            
+            save_baseline({"validate_empty": 1e-12}, path)
+            self.assertEqual(benchmark.main(args), 1)
+
+class TestStartup(unittest.TestCase):
+    """Test cases for the import-time benchmarks and lazy GUI imports"""
+    
+    def test_parse_importtime(self):
+        """Self and cumulative microseconds become seconds per module"""
+        text = ("import time: self [us] | cumulative | imported package\n"
+                "import time:       120 |        120 |   game_config\n"
+                "import time:      1500 |       2000 | engine\n"
+                "unrelated line\n")
+        self.assertEqual(parse_importtime(text), {"game_config": (120e-6, 120e-6),
+                                                  "engine": (1500e-6, 2000e-6)})
+    
+    def test_import_benchmark_runs(self):
+        """An import benchmark reports a positive time"""
+        results = run_benchmarks(["import_engine"], repeat=1)
+        self.assertGreater(results["import_engine"], 0)
+    
+    def test_headless_imports_skip_tkinter(self):
+        """Importing the game modules, the window module included, loads no GUI"""
+        code = ("import sys, utils, engine, config_loader, session, solution; "
+                "print(sorted(name for name in sys.modules if name.startswith('tkinter')))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_DIR,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,203 @@
+"""Unit tests for the external configuration loader"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_loader import (ConfigError, ConfigWatcher, compile_config, load_config)
+from game_config import GameConfig
+from engine import CORRECT, TOO_HIGH, TOO_LOW
+from utils import VALID, EMPTY, NOT_A_NUMBER, OUT_OF_RANGE
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+class TestConfigLoader(unittest.TestCase):
+    """Test cases for loading, validating and compiling settings"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_defaults_match_game_config(self):
+        """Test that no overrides gives GameConfig's values"""
+        config = compile_config()
+        self.assertEqual(config.min_number, GameConfig.MIN_NUMBER)
+        self.assertEqual(config.max_attempts, GameConfig.MAX_ATTEMPTS)
+        self.assertEqual(dict(config.colors), GameConfig.COLORS)
+        self.assertEqual(config.geometry, f"{GameConfig.WINDOW_WIDTH}x{GameConfig.WINDOW_HEIGHT}")
+        self.assertIsNone(config.source)
+
+    def test_load_json_merges_dictionaries(self):
+        """Test that a JSON file overrides single settings and dictionary keys"""
+        path = self.write("config.json", json.dumps({
+            "max_number": 1000, "max_attempts": 12,
+            "colors": {"error": "#c0392b"}, "fonts": {"title": ["Helvetica", 30]},
+        }))
+        config = load_config(path)
+
+        self.assertEqual((config.min_number, config.max_number, config.max_attempts), (1, 1000, 12))
+        self.assertEqual(config.colors['error'], "#c0392b")
+        self.assertEqual(config.colors['success'], GameConfig.COLORS['success'])
+        self.assertEqual(config.fonts['title'], ("Helvetica", 30))
+        self.assertEqual(config.difficulty, "1-1000/12")
+        self.assertEqual(config.source, path)
+
+    @unittest.skipIf(yaml is None, "PyYAML is not installed")
+    def test_load_yaml(self):
+        """Test YAML files, including an empty one"""
+        path = self.write("config.yaml", "min_number: -5\nmessages:\n  welcome: Go!\n")
+        config = load_config(path)
+        self.assertEqual(config.min_number, -5)
+        self.assertEqual(config.welcome, ("Go!", GameConfig.COLORS['warning']))
+
+        empty = load_config(self.write("empty.yml", ""))
+        self.assertEqual(empty.max_number, GameConfig.MAX_NUMBER)
+
+    def test_invalid_settings(self):
+        """Test that unknown keys, bad types and bad templates are rejected"""
+        invalid = [
+            {"max_numbr": 10},
+            {"colors": {"purple": "#800080"}},
+            {"max_attempts": "10"},
+            {"max_attempts": True},
+            {"max_attempts": 0},
+            {"min_number": 50, "max_number": 50},
+            {"fonts": {"title": ["Arial"]}},
+            {"messages": {"game_over": "The number was {1}"}},
+            {"messages": {"game_over": "The number was {0.real.x}"}},
+            {"messages": {"single": "{0[0]}"}},
+            {"random_seed": 1.5},
+            [1, 2],
+        ]
+        for overrides in invalid:
+            with self.subTest(overrides=overrides):
+                with self.assertRaises(ConfigError):
+                    compile_config(overrides)
+
+    def test_data_dir_moves_the_data_files(self):
+        """Test that files not set on their own follow data_dir"""
+        data_dir = os.path.join(self.temp_dir.name, "data")
+        config = compile_config({"data_dir": data_dir,
+                                 "replay_log_path": "/elsewhere/replays.ngrl"})
+        self.assertEqual(config.scores_db_path, os.path.join(data_dir, "scores.db"))
+        self.assertEqual(config.history_spill_dir, data_dir)
+        self.assertEqual(config.replay_log_path, "/elsewhere/replays.ngrl")
+
+        defaults = compile_config()
+        self.assertEqual(defaults.scores_db_path, GameConfig.SCORES_DB_PATH)
+
+    def test_unreadable_files(self):
+        """Test that missing files and syntax errors raise ConfigError"""
+        with self.assertRaises(ConfigError):
+            load_config(os.path.join(self.temp_dir.name, "missing.json"))
+        with self.assertRaises(ConfigError):
+            load_config(self.write("broken.json", "{max_number: 5"))
+
+    def test_config_is_immutable(self):
+        """Test that compiled configs and their dictionaries cannot change"""
+        config = compile_config()
+        with self.assertRaises(AttributeError):
+            config.max_number = 5
+        with self.assertRaises(AttributeError):
+            config.extra = 1
+        with self.assertRaises(TypeError):
+            config.colors['error'] = "#000"
+
+    def test_precomputed_values(self):
+        """Test the derived messages and colors"""
+        config = compile_config({"min_number": 10, "max_number": 20, "max_attempts": 8})
+        colors = config.colors
+
+        self.assertEqual(config.feedback[CORRECT], (GameConfig.MESSAGES['correct'], colors['success']))
+        self.assertEqual(config.feedback[TOO_HIGH][1], colors['error'])
+        self.assertEqual(config.feedback[TOO_LOW][0], GameConfig.MESSAGES['too_low'])
+        self.assertEqual(config.invalid_messages[OUT_OF_RANGE], "❌ Number must be between 10 and 20!")
+        self.assertEqual(config.invalid_messages[VALID], "")
+        self.assertIn(EMPTY, config.invalid_messages)
+        self.assertIn(NOT_A_NUMBER, config.invalid_messages)
+        self.assertEqual(config.game_over(15), "💀 Game Over! The number was 15")
+        self.assertEqual([config.attempt_color(left) for left in (0, 2, 3, 5, 6, 8)],
+                         [colors['error']] * 2 + [colors['warning']] * 2 + [colors['success']] * 2)
+
+class TestConfigWatcher(unittest.TestCase):
+    """Test cases for reloading the configuration file"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "config.json")
+        self.stamp = 1_000_000_000
+
+    def write(self, settings):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(settings if isinstance(settings, str) else json.dumps(settings))
+        # Distinct mtimes even on filesystems with coarse timestamps
+        self.stamp += 10
+        os.utime(self.path, (self.stamp, self.stamp))
+
+    def test_missing_file_gives_defaults(self):
+        """Test that the watcher starts from the defaults without a file"""
+        watcher = ConfigWatcher(self.path)
+        self.assertIsNone(watcher.config.source)
+        self.assertIsNone(watcher.poll(force=True))
+
+    def test_reload_on_change(self):
+        """Test that a changed file is compiled and swapped in once"""
+        self.write({"max_number": 50})
+        watcher = ConfigWatcher(self.path, interval=0)
+        first = watcher.config
+        self.assertEqual(first.max_number, 50)
+        self.assertIsNone(watcher.poll())
+
+        self.write({"max_number": 500})
+        config = watcher.poll()
+        self.assertEqual(config.max_number, 500)
+        self.assertIs(watcher.config, config)
+        self.assertFalse(config.same_game(first))
+        self.assertIsNone(watcher.poll())
+
+        os.remove(self.path)
+        self.assertEqual(watcher.poll().max_number, GameConfig.MAX_NUMBER)
+
+    def test_invalid_file_keeps_previous_config(self):
+        """Test that a broken edit is reported and the old config kept"""
+        self.write({"max_attempts": 7})
+        watcher = ConfigWatcher(self.path, interval=0)
+
+        self.write({"max_attempts": -1})
+        self.assertIsNone(watcher.poll())
+        self.assertIsInstance(watcher.error, ConfigError)
+        self.assertEqual(watcher.config.max_attempts, 7)
+
+        self.write({"max_attempts": 8, "messages": {"game_over": "{0.real.x}"}})
+        self.assertIsNone(watcher.poll())
+        self.assertIn("game_over", str(watcher.error))
+        self.assertEqual(watcher.config.max_attempts, 7)
+
+        self.write({"max_attempts": 9})
+        self.assertEqual(watcher.poll().max_attempts, 9)
+        self.assertIsNone(watcher.error)
+
+    def test_poll_interval(self):
+        """Test that polls within the interval do not stat the file"""
+        watcher = ConfigWatcher(self.path, interval=3600)
+        self.write({"max_number": 50})
+        self.assertIsNone(watcher.poll())
+        self.assertEqual(watcher.poll(force=True).max_number, 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,665 @@
+"""Unit tests for the headless game engine"""
+
+import unittest
+import random
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import GameEngine, calculate_feedback, simulate, CORRECT, TOO_HIGH, TOO_LOW
+from utils import calculate_optimal_guess
+from rng import RandomStreams
+
+class TestGameEngine(unittest.TestCase):
+    """Test cases for the GameEngine state machine"""
+
+    def test_calculate_feedback(self):
+        """Test feedback for high, low and correct guesses"""
+        self.assertEqual(calculate_feedback(50, 42), TOO_HIGH)
+        self.assertEqual(calculate_feedback(25, 42), TOO_LOW)
+        self.assertEqual(calculate_feedback(42, 42), CORRECT)
+
+    def test_winning_game(self):
+        """Test a full winning game without any window"""
+        engine = GameEngine(1, 100, 10)
+        engine.new_game(target=42)
+
+        for guess in [50, 25, 37, 43, 40, 41]:
+            self.assertNotEqual(engine.guess(guess), CORRECT)
+        self.assertEqual(engine.guess(42), CORRECT)
+
+        self.assertTrue(engine.won)
+        self.assertFalse(engine.lost)
+        self.assertFalse(engine.game_active)
+        self.assertEqual(engine.attempts, 7)
+        self.assertEqual(engine.guess_history[-1], (42, CORRECT))
+        self.assertEqual((engine.tracker.lo, engine.tracker.hi), (42, 42))
+
+    def test_losing_game(self):
+        """Test game over after max attempts"""
+        engine = GameEngine(1, 100, 3)
+        engine.new_game(target=99)
+
+        for guess in [1, 2, 3]:
+            engine.guess(guess)
+
+        self.assertTrue(engine.lost)
+        self.assertFalse(engine.game_active)
+        self.assertIsNone(engine.guess(99))
+        self.assertEqual(engine.attempts, 3)
+
+    def test_new_game_resets_state(self):
+        """Test that a new round clears attempts and history"""
+        engine = GameEngine(1, 100, 10)
+        engine.new_game(target=10)
+        engine.guess(5)
+        engine.new_game()
+
+        self.assertEqual(engine.attempts, 0)
+        self.assertEqual(engine.guess_history, [])
+        self.assertTrue(engine.game_active)
+        self.assertTrue(1 <= engine.target_number <= 100)
+
+class TestSimulation(unittest.TestCase):
+    """Test cases for the batch simulation API"""
+
+    def test_binary_search_always_wins(self):
+        """Binary search finds any number in 1-100 within 7 guesses"""
+        result = simulate(calculate_optimal_guess, 2000, seed=1)
+
+        self.assertEqual(result.games, 2000)
+        self.assertEqual(result.wins, 2000)
+        self.assertEqual(sum(result.attempts_histogram[8:]), 0)
+        self.assertLessEqual(result.average_attempts, 7)
+
+    def test_simulation_is_reproducible(self):
+        """Test that the same seed gives the same results"""
+        first = simulate(lambda h, lo, hi: lo, 500, seed=7)
+        second = simulate(lambda h, lo, hi: lo, 500, seed=7)
+
+        self.assertEqual(first.attempts_histogram, second.attempts_histogram)
+        self.assertEqual(first.wins, second.wins)
+        self.assertLess(first.win_rate, 1.0)
+
+    def test_simulation_matches_engine(self):
+        """simulate() and a hand-driven GameEngine agree on every game"""
+        from engine import adversarial_feedback, CODE_CORRECT, FEEDBACK_BY_CODE
+
+        strategies = (calculate_optimal_guess, lambda h, lo, hi: lo + len(h),
+                      lambda h, lo, hi: (lo + hi) // 3 + 7 * len(h))
+        for strategy in strategies:
+            for seed in range(10):
+                for adversarial in (False, True):
+                    with self.subTest(strategy=strategy, seed=seed, adversarial=adversarial):
+                        result = simulate(strategy, 20, seed=seed, max_attempts=6,
+                                          adversarial=adversarial)
+
+                        # Reference: the feedback rules applied by hand
+                        rng = RandomStreams(seed).stream("simulate")
+                        histogram = [0] * 7
+                        for _ in range(20):
+                            lo, hi = 1, 100
+                            target = None if adversarial else rng.randint(1, 100)
+                            history = []
+                            for attempt in range(1, 7):
+                                guess = strategy(history, 1, 100)
+                                if adversarial:
+                                    code, lo, hi = adversarial_feedback(guess, lo, hi, rng)
+                                    feedback = FEEDBACK_BY_CODE[code]
+                                else:
+                                    feedback = calculate_feedback(guess, target)
+                                history.append((guess, feedback))
+                                if feedback == CORRECT:
+                                    histogram[attempt] += 1
+                                    break
+                                if feedback == TOO_HIGH:
+                                    hi = min(hi, guess - 1)
+                                else:
+                                    lo = max(lo, guess + 1)
+                            else:
+                                if adversarial:
+                                    rng.randint(lo, hi)  # the engine commits to a target
+
+                        self.assertEqual(result.attempts_histogram, histogram)
+                        self.assertEqual(result.wins, sum(histogram))
+
+class TestRandomStreams(unittest.TestCase):
+    """Test cases for the seeded RNG service"""
+
+    def test_streams_are_reproducible_and_independent(self):
+        """Same seed and key replay a stream; other keys differ"""
+        from rng import RandomStreams
+
+        first = RandomStreams(42)
+        second = RandomStreams(42)
+        # Creating streams in a different order does not change them
+        other = second.stream("worker", 2)
+        self.assertEqual([first.stream("worker", 1).random() for _ in range(3)],
+                         [second.stream("worker", 1).random() for _ in range(3)])
+        self.assertNotEqual(first.stream("worker", 2).random(),
+                            first.stream("worker", 1).random())
+        self.assertEqual(other.random(), first.stream("worker", 2).random())
+
+        self.assertEqual(first.spawn("w", 0).seed, second.spawn("w", 0).seed)
+        self.assertNotEqual(first.spawn("w", 0).seed, first.spawn("w", 1).seed)
+        self.assertIsInstance(RandomStreams().seed, int)
+
+    def test_numpy_generator(self):
+        """The numpy accessor gives reproducible PCG64 generators"""
+        from rng import RandomStreams
+
+        a = RandomStreams(3).numpy("mc").integers(0, 1000, size=5)
+        b = RandomStreams(3).numpy("mc").integers(0, 1000, size=5)
+        self.assertEqual(a.tolist(), b.tolist())
+
+    def test_target_buffer(self):
+        """Buffered targets do not depend on the buffer size"""
+        from rng import TargetBuffer
+
+        small = TargetBuffer(random.Random(9), 1, 100, size=7).take(50)
+        large = TargetBuffer(random.Random(9), 1, 100, size=1000).take(50)
+        self.assertEqual(small, large)
+        self.assertTrue(all(1 <= target <= 100 for target in small))
+        self.assertEqual(small[:5], [random.Random(9).randint(1, 100)] + small[1:5])
+
+    def test_replay_from_seed(self):
+        """Engines and session tables replay their targets from the seed"""
+        from rng import RandomStreams
+        from session import SessionTable
+
+        def engine_targets(seed):
+            engine = GameEngine(1, 10**6, 10, rng=RandomStreams(seed).stream("game"))
+            targets = []
+            for _ in range(5):
+                engine.new_game()
+                targets.append(engine.target_number)
+            return targets
+
+        def session_targets(seed):
+            table = SessionTable(1, 10**6, 10, seed=seed)
+            targets = []
+            for _ in range(5):
+                session = table.get(table.create())
+                session.new_game()
+                targets.append(session.target_number)
+            return targets
+
+        self.assertEqual(engine_targets(5), engine_targets(5))
+        self.assertNotEqual(engine_targets(5), engine_targets(6))
+        self.assertEqual(session_targets(5), session_targets(5))
+        self.assertNotEqual(session_targets(5), session_targets(6))
+
+class TestGuessHistory(unittest.TestCase):
+    """Test cases for the bounded ring-buffer history"""
+
+    def test_ring_buffer_drops_old_entries(self):
+        """Without a spill directory only the last capacity entries stay"""
+        from history import GuessHistory
+
+        history = GuessHistory(capacity=3)
+        for guess in range(10):
+            history.append((guess, TOO_LOW))
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.total, 10)
+        self.assertEqual(history.first_index, 7)
+        self.assertEqual(list(history), [(7, TOO_LOW), (8, TOO_LOW), (9, TOO_LOW)])
+        self.assertEqual(history[0], (7, TOO_LOW))
+        self.assertEqual(history[-1], (9, TOO_LOW))
+        self.assertEqual(history[1:], [(8, TOO_LOW), (9, TOO_LOW)])
+        with self.assertRaises(IndexError):
+            history[3]
+
+    def test_spill_file_keeps_everything(self):
+        """Entries pushed out of memory are read back from the spill file"""
+        from history import GuessHistory
+
+        with tempfile.TemporaryDirectory() as directory:
+            engine = GameEngine(1, 10**6, 100_000, history=GuessHistory(64, directory))
+            engine.new_game(target=10**6)
+            for guess in range(1, 5001):
+                engine.guess(guess)
+
+            history = engine.guess_history
+            self.assertEqual(len(history), 5000)
+            self.assertEqual(len(list(history)), 5000)
+            self.assertEqual(history.first_index, 0)
+            self.assertEqual(history[0], (1, TOO_LOW))
+            self.assertEqual(history[4935], (4936, TOO_LOW))
+            self.assertEqual(history[4999], (5000, TOO_LOW))
+            self.assertEqual(os.fstat(history._spill.fileno()).st_size, (5000 - 64) * 9)
+
+            engine.new_game(target=3)
+            engine.guess(3)
+            self.assertEqual(list(history), [(3, CORRECT)])
+            self.assertEqual(os.fstat(history._spill.fileno()).st_size, 0)
+
+            history.close()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_histories_do_not_share_a_spill_file(self):
+        """Two histories spilling to the same directory keep their own entries"""
+        from history import GuessHistory
+
+        with tempfile.TemporaryDirectory() as directory:
+            first = GuessHistory(4, directory)
+            second = GuessHistory(4, directory)
+            for guess in range(20):
+                first.append((guess, TOO_LOW))
+                second.append((1000 + guess, TOO_HIGH))
+            second.clear()
+
+            self.assertEqual(list(first), [(guess, TOO_LOW) for guess in range(20)])
+            self.assertEqual(len(second), 0)
+            first.close()
+            second.close()
+
+class TestAdversarialMode(unittest.TestCase):
+    """Test cases for the adversarial lazy-target mode"""
+
+    def test_answers_match_revealed_target(self):
+        """Every answer agrees with calculate_feedback for the final target"""
+        from engine import verify_history
+
+        rng = random.Random(5)
+        for game in range(300):
+            engine = GameEngine(1, 100, 6, adversarial=True, rng=random.Random(game))
+            engine.new_game()
+            self.assertIsNone(engine.target_number)
+            while engine.game_active:
+                engine.guess(rng.randint(-5, 105))
+
+            self.assertTrue(1 <= engine.target_number <= 100)
+            self.assertTrue(verify_history(engine.guess_history, engine.target_number))
+            self.assertFalse(verify_history(engine.guess_history + [(0, CORRECT)],
+                                            engine.target_number))
+
+    def test_forces_worst_case(self):
+        """No strategy wins 1-100 in fewer than 7 guesses"""
+        for strategy in (calculate_optimal_guess, lambda h, lo, hi: lo + len(h),
+                         lambda h, lo, hi: hi - len(h)):
+            result = simulate(strategy, 50, seed=2, max_attempts=100, adversarial=True)
+            self.assertEqual(result.wins, 50)
+            self.assertEqual(sum(result.attempts_histogram[:7]), 0)
+
+        optimal = simulate(calculate_optimal_guess, 50, seed=2, max_attempts=7, adversarial=True)
+        self.assertEqual(optimal.attempts_histogram[7], 50)
+        self.assertEqual(simulate(calculate_optimal_guess, 50, seed=2, max_attempts=6,
+                                  adversarial=True).wins, 0)
+
+    def test_compact_session(self):
+        """Adversarial sessions add no state and report a consistent target"""
+        from session import SessionConfig, CompactSession
+        from engine import verify_history
+
+        session = CompactSession(SessionConfig(1, 100, 3, adversarial=True,
+                                               rng=random.Random(1)))
+        session.new_game(target=50)
+        self.assertIsNone(session.target_number)
+        for guess in (50, 25, 75):
+            session.guess(guess)
+
+        self.assertTrue(session.lost)
+        self.assertTrue(session.lo <= session.target_number <= session.hi)
+        self.assertTrue(verify_history(session.guess_history, session.target_number))
+
+class TestMonteCarlo(unittest.TestCase):
+    """Test cases for the vectorized NumPy simulator"""
+
+    def test_matches_per_game_loop(self):
+        """Every target plays out exactly like the engine does"""
+        import numpy as np
+        from monte_carlo import simulate_targets, midpoint_strategy
+
+        targets = np.arange(1, 101)
+        result = simulate_targets(midpoint_strategy, targets, None, 1, 100, 5)
+
+        expected = [0] * 6
+        for target in range(1, 101):
+            engine = GameEngine(1, 100, 5)
+            engine.new_game(target=target)
+            while engine.game_active:
+                engine.guess(calculate_optimal_guess(engine.guess_history, 1, 100))
+            if engine.won:
+                expected[engine.attempts] += 1
+
+        self.assertEqual(result.attempts_histogram, expected)
+        self.assertEqual(result.wins, sum(expected))
+        self.assertEqual(result.games, 100)
+
+    def test_huge_range(self):
+        """Bounds near the int32 limit play out like the engine"""
+        import numpy as np
+        from monte_carlo import simulate_targets, run_monte_carlo, midpoint_strategy
+
+        class HugeConfig:
+            MIN_NUMBER = 1
+            MAX_NUMBER = 2_000_000_000
+            MAX_ATTEMPTS = 40
+
+        targets = [1, 2, 1_000_000_000, 1_999_999_999, 2_000_000_000]
+        result = simulate_targets(midpoint_strategy, np.array(targets), None,
+                                  1, HugeConfig.MAX_NUMBER, HugeConfig.MAX_ATTEMPTS)
+        expected = [0] * 41
+        for target in targets:
+            engine = GameEngine(1, HugeConfig.MAX_NUMBER, HugeConfig.MAX_ATTEMPTS)
+            engine.new_game(target=target)
+            while engine.game_active:
+                engine.guess(calculate_optimal_guess(engine.guess_history,
+                                                     1, HugeConfig.MAX_NUMBER))
+            expected[engine.attempts] += 1
+        self.assertEqual(result.attempts_histogram, expected)
+
+        vectorized = run_monte_carlo(midpoint_strategy, 20000, seed=3, config=HugeConfig)
+        per_game = simulate(calculate_optimal_guess, 200, seed=3, min_number=1,
+                            max_number=HugeConfig.MAX_NUMBER, max_attempts=40)
+        self.assertEqual(vectorized.win_rate, per_game.win_rate)
+        self.assertEqual(vectorized.win_rate, 1.0)
+
+    def test_config_and_batches(self):
+        """Test win rates for a custom configuration split into batches"""
+        from monte_carlo import run_monte_carlo, lowest_strategy
+
+        class SmallConfig:
+            MIN_NUMBER = 1
+            MAX_NUMBER = 10
+            MAX_ATTEMPTS = 3
+
+        result = run_monte_carlo(lowest_strategy, 20000, seed=5,
+                                 config=SmallConfig, batch_size=3000)
+
+        self.assertEqual(result.games, 20000)
+        self.assertAlmostEqual(result.win_rate, 0.3, delta=0.02)
+        self.assertEqual(len(result.attempts_histogram), 4)
+
+class TestHintEngine(unittest.TestCase):
+    """Test cases for the closed-form hint engine"""
+
+    def test_closed_forms_match_balanced_split(self):
+        """total_depth equals the balanced-split recurrence"""
+        from hint_engine import total_depth
+
+        total = [0] * 3001
+        for size in range(1, 3001):
+            left = (size - 1) // 2
+            total[size] = size + total[left] + total[size - 1 - left]
+            self.assertEqual(total_depth(size), total[size])
+
+    def test_balanced_split_is_optimal(self):
+        """No split beats the suggested guess on total or worst-case guesses"""
+        from hint_engine import total_depth, best_guess
+
+        # Exhaustive DP over every possible guess in an interval of each size
+        total = [0] * 121
+        worst = [0] * 121
+        for size in range(1, 121):
+            total[size] = size + min(total[left] + total[size - 1 - left]
+                                     for left in range(size))
+            worst[size] = 1 + min(max(worst[left], worst[size - 1 - left])
+                                  for left in range(size))
+            left = best_guess(1, size) - 1
+            self.assertEqual(total_depth(size), total[size])
+            self.assertEqual(total[left] + total[size - 1 - left] + size, total[size])
+            self.assertEqual(1 + max(worst[left], worst[size - 1 - left]), worst[size])
+
+    def test_auto_play_through_hints(self):
+        """Following the suggestions wins every target within the worst case"""
+        from hint_engine import HintEngine
+
+        hints = HintEngine(1, 100, 10)
+        engine = GameEngine(1, 100, 10)
+        for target in range(1, 101):
+            engine.new_game(target=target)
+            while engine.game_active:
+                engine.guess(hints.hint_for(engine).suggestion)
+            self.assertTrue(engine.won)
+            self.assertLessEqual(engine.attempts, 7)
+
+    def test_hint_uses_whole_history(self):
+        """Test a hint after several guesses"""
+        from hint_engine import HintEngine
+
+        engine = GameEngine(1, 100, 10)
+        engine.new_game(target=42)
+        for guess in (90, 10, 60):
+            engine.guess(guess)
+
+        hint = HintEngine(1, 100, 10).hint_for(engine)
+        self.assertEqual((hint.lo, hint.hi, hint.candidates), (11, 59, 49))
+        self.assertEqual(hint.suggestion, 35)
+        self.assertEqual(hint.attempts_left, 7)
+        self.assertEqual(hint.win_probability, 1.0)
+
+        text = HintEngine.format_hint(hint)
+        self.assertIn("between 11 and 59", text)
+        self.assertIn("Try 35", text)
+
+    def test_huge_range(self):
+        """Hints for a 10^9 range need no tables and stay fast"""
+        import time
+        from hint_engine import HintEngine
+
+        hint_engine = HintEngine(1, 10**9, 20)
+        start = time.perf_counter()
+        for _ in range(1000):
+            hint = hint_engine.hint(1, 10**9, 0)
+        self.assertLess((time.perf_counter() - start) / 1000, 1e-3)
+
+        self.assertEqual(hint.suggestion, 500_000_000)
+        self.assertAlmostEqual(hint.win_probability, (2**20 - 1) / 10**9)
+        self.assertAlmostEqual(hint.expected_attempts, 28.9, places=1)
+
+class TestDecisionTable(unittest.TestCase):
+    """Test cases for the solver's precomputed tables"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = temp_dir.name
+
+    def test_tables_match_exhaustive_dp(self):
+        """The linear-time DP finds the optimal totals, worst cases and splits"""
+        from solver import build_tables
+
+        total, split, worst = build_tables(300)
+        best_total = [0] * 301
+        best_worst = [0] * 301
+        for size in range(1, 301):
+            best_total[size] = size + min(best_total[left] + best_total[size - 1 - left]
+                                          for left in range(size))
+            best_worst[size] = 1 + min(max(best_worst[left], best_worst[size - 1 - left])
+                                       for left in range(size))
+            left = split[size]
+            self.assertEqual(total[size], best_total[size])
+            self.assertEqual(worst[size], best_worst[size])
+            self.assertEqual(best_total[left] + best_total[size - 1 - left] + size,
+                             best_total[size])
+
+    def test_cache_round_trip(self):
+        """A large table is written once and memory-mapped afterwards"""
+        import solver
+
+        size = solver.CACHE_MIN_SIZE
+        table = solver.load_decision_table(size, self.cache_dir)
+        self.addCleanup(table.close)
+        self.assertTrue(table.mapped)
+        self.assertEqual(os.listdir(self.cache_dir), [f"decision_{size}.ngdt"])
+
+        with mock.patch.object(solver, "build_tables") as build:
+            cached = solver.load_decision_table(size, self.cache_dir)
+        self.addCleanup(cached.close)
+        build.assert_not_called()
+        self.assertTrue(cached.mapped)
+        for lo, hi in ((1, size), (7, 1000), (5, 5), (100, 99)):
+            self.assertEqual(cached.best_guess(lo, hi), table.best_guess(lo, hi))
+            self.assertEqual(cached.worst_case(lo, hi), table.worst_case(lo, hi))
+        self.assertEqual(cached.worst_case(1, size), size.bit_length())
+
+    def test_damaged_cache_is_rebuilt(self):
+        """A truncated or foreign cache file is replaced, not trusted"""
+        import solver
+
+        size = solver.CACHE_MIN_SIZE
+        path = solver.cache_path(size, self.cache_dir)
+        for damage in (b"NGDT", b"XXXX" + bytes(solver.HEADER_SIZE + 13 * size + 9)):
+            with open(path, "wb") as f:
+                f.write(damage)
+            table = solver.load_decision_table(size, self.cache_dir)
+            self.assertTrue(table.mapped)
+            self.assertEqual(table.best_guess(1, size), size // 2)
+            table.close()
+
+    def test_small_tables_stay_in_memory(self):
+        """Small ranges build their tables without touching the disk"""
+        import solver
+
+        table = solver.load_decision_table(100, self.cache_dir)
+        self.assertFalse(table.mapped)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        with self.assertRaises(ValueError):
+            solver.load_decision_table(solver.MAX_TABLE_SIZE + 1, None)
+
+    def test_hint_engine_reads_the_table(self):
+        """Hints from the table agree with the closed forms"""
+        import hint_engine
+
+        hints = hint_engine.HintEngine(1, 1000, 10, cache_dir=None)
+        self.assertIsNone(hints._table)
+        hint = hints.hint(1, 1000, 0)
+        self.assertEqual(hints.table.size, 1000)
+        self.assertEqual(hint.suggestion, hint_engine.best_guess(1, 1000))
+        for lo, hi in ((1, 1000), (11, 59), (500, 503), (2, 2)):
+            size = hi - lo + 1
+            hint = hints.hint(lo, hi, 3)
+            self.assertEqual(hint.suggestion, hint_engine.best_guess(lo, hi))
+            self.assertAlmostEqual(hint.expected_attempts, hint_engine.expected_attempts(size))
+        self.assertIsNone(hint_engine.HintEngine(1, 10**9, 20).table)
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the strategy tournament runner"""
+
+    CONFIGS = [(1, 100, 10), (1, 1000, 10)]
+
+    def test_results_independent_of_workers(self):
+        """The same seed gives the same histograms in-process and on a pool"""
+        from tournament import run_tournament
+
+        inline = run_tournament(None, self.CONFIGS, 600, seed=11, workers=1, chunk_size=250)
+        pooled = run_tournament(None, self.CONFIGS, 600, seed=11, workers=2, chunk_size=250)
+
+        for name, per_config in inline.items():
+            for config, result in per_config.items():
+                self.assertEqual(result.games, 600)
+                self.assertEqual(result.attempts_histogram,
+                                 pooled[name][config].attempts_histogram)
+
+    def test_ranking(self):
+        """Binary search ranks first and never loses"""
+        from tournament import run_tournament, rank_strategies, format_ranking
+
+        results = run_tournament(None, self.CONFIGS, 500, seed=3, workers=1)
+        ranking = rank_strategies(results)
+
+        self.assertEqual(ranking[0][0], 'binary')
+        self.assertEqual(ranking[0][1], 1.0)
+        self.assertIn('binary', format_ranking(results).splitlines()[2])
+
+    def test_strategies_stay_in_range(self):
+        """Every strategy only guesses candidates that are still possible"""
+        from tournament import STRATEGIES
+
+        for name, factory in STRATEGIES.items():
+            strategy = factory(random.Random(0))
+            for target in (1, 37, 100):
+                engine = GameEngine(1, 100, 100)
+                engine.new_game(target=target)
+                while engine.game_active:
+                    lo, hi = engine.tracker.lo, engine.tracker.hi
+                    guess = strategy(engine.guess_history, 1, 100)
+                    self.assertTrue(lo <= guess <= hi, name)
+                    engine.guess(guess)
+                self.assertTrue(engine.won, name)
+
+    def test_interval_strategy_is_abstract(self):
+        """A strategy has to say how it picks a guess"""
+        from tournament import IntervalStrategy
+
+        with self.assertRaises(TypeError):
+            IntervalStrategy(random.Random(0))
+
+class TestCompactSession(unittest.TestCase):
+    """Test cases for compact sessions and the session table"""
+
+    def test_matches_engine(self):
+        """A compact session answers exactly like GameEngine"""
+        from session import SessionConfig, CompactSession
+        from engine import FEEDBACK_BY_CODE
+
+        session = CompactSession(SessionConfig(1, 100, 5))
+        engine = GameEngine(1, 100, 5)
+        session.new_game(target=63)
+        engine.new_game(target=63)
+
+        for guess in [50, 75, 62, 70, 64]:
+            code = session.guess(guess)
+            self.assertEqual(FEEDBACK_BY_CODE[code], engine.guess(guess))
+            self.assertEqual((session.lo, session.hi), (engine.tracker.lo, engine.tracker.hi))
+
+        self.assertTrue(session.lost)
+        self.assertIsNone(session.guess(63))
+        self.assertEqual(session.guess_history, engine.guess_history)
+
+    def test_adversarial_matches_engine(self):
+        """An adversarial session gives the engine's answers from the same seed"""
+        from session import SessionConfig, CompactSession
+        from engine import FEEDBACK_BY_CODE
+
+        session = CompactSession(SessionConfig(1, 100, 6, adversarial=True,
+                                               rng=random.Random(3)))
+        engine = GameEngine(1, 100, 6, adversarial=True, rng=random.Random(3))
+        session.new_game()
+        engine.new_game()
+        for guess in [50, 20, 80, 35, 60, 42]:
+            self.assertEqual(FEEDBACK_BY_CODE[session.guess(guess)], engine.guess(guess))
+            self.assertEqual((session.lo, session.hi), (engine.tracker.lo, engine.tracker.hi))
+        self.assertEqual((session.lost, session.target_number), (engine.lost, engine.target_number))
+
+    def test_slots_only(self):
+        """Test that sessions carry no per-instance dict"""
+        from session import SessionConfig, CompactSession
+
+        session = CompactSession(SessionConfig(1, 100, 10))
+        self.assertFalse(hasattr(session, '__dict__'))
+        with self.assertRaises(AttributeError):
+            session.widget = None
+
+    def test_table_eviction(self):
+        """Test lookup and eviction of idle sessions"""
+        from session import SessionTable
+
+        now = [0.0]
+        table = SessionTable(1, 100, 10, clock=lambda: now[0])
+        finished, idle, busy = table.create(), table.create(), table.create()
+        for session_id in (finished, idle, busy):
+            table.get(session_id).new_game(target=50)
+
+        # Finished games stay available for a new round
+        table.get(finished).guess(50)
+        self.assertIn(finished, table)
+
+        now[0] = 30.0
+        table.get(busy)
+        table.get(finished)
+        now[0] = 50.0
+        self.assertEqual(table.evict_idle(40), [idle])
+        self.assertIn(busy, table)
+        table.remove(finished)
+        self.assertIsNone(table.get(finished))
+        self.assertEqual(len(table), 1)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
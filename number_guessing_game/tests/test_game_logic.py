@@ -8,6 +8,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils import generate_random_number, validate_number_input, format_history_entry
+from utils import calculate_optimal_guess, RangeTracker
+from utils import (validate_many, validate_array, validation_message, VALID, EMPTY,
+                   NOT_A_NUMBER, OUT_OF_RANGE)
 from game_config import GameConfig
 
 class TestGameLogic(unittest.TestCase):
@@ -20,6 +23,12 @@ class TestGameLogic(unittest.TestCase):
             self.assertGreaterEqual(number, 1)
             self.assertLessEqual(number, 100)
             self.assertIsInstance(number, int)
+        
+        # A seeded generator gives a reproducible sequence
+        import random
+        first = [generate_random_number(1, 100, random.Random(4)) for _ in range(3)]
+        second = [generate_random_number(1, 100, random.Random(4)) for _ in range(3)]
+        self.assertEqual(first, second)
     
     def test_validate_valid_input(self):
         """Test valid number inputs (1-100)"""
@@ -67,6 +76,89 @@ class TestGameLogic(unittest.TestCase):
             result = format_history_entry(attempt, guess, feedback)
             self.assertEqual(result, expected)
 
+class TestBulkValidation(unittest.TestCase):
+    """Test cases for status-code validation of many inputs"""
+    
+    INPUTS = ["5", "  -3 ", "+7", "--5", "", "  ", "abc", "1_000", "9" * 5000,
+              "0" * 100 + "42", "١٢", "12.5", "-10", "1000", "1001", "-" + "9" * 30,
+              "0" * 70 + "1__2", "_" * 70 + "5", "0" * 70 + "5_", "-_" + "0" * 70 + "5",
+              "0_" * 40 + "1_2"]
+    
+    def test_validate_many(self):
+        """Statuses and numbers agree with validate_number_input"""
+        results = list(validate_many(self.INPUTS, -10, 1000))
+        
+        self.assertEqual([status for status, _ in results],
+                         [VALID, VALID, VALID, NOT_A_NUMBER, EMPTY, EMPTY, NOT_A_NUMBER, VALID,
+                          OUT_OF_RANGE, VALID, VALID, NOT_A_NUMBER, VALID, VALID, OUT_OF_RANGE,
+                          OUT_OF_RANGE, NOT_A_NUMBER, NOT_A_NUMBER, NOT_A_NUMBER, NOT_A_NUMBER,
+                          VALID])
+        self.assertEqual(results[-1], (VALID, 12))
+        for text, (status, number) in zip(self.INPUTS, results):
+            is_valid, single_number, message = validate_number_input(text, -10, 1000)
+            self.assertEqual(is_valid, status == VALID)
+            self.assertEqual(message, validation_message(status, -10, 1000))
+            if is_valid:
+                self.assertEqual(number, single_number)
+    
+    def test_validate_array(self):
+        """The NumPy variant gives the same statuses and numbers"""
+        status, numbers = validate_array(self.INPUTS, -10, 1000)
+        expected = list(validate_many(self.INPUTS, -10, 1000))
+        
+        self.assertEqual(status.tolist(), [code for code, _ in expected])
+        valid = [number for code, number in expected if code == VALID]
+        self.assertEqual(numbers[status == VALID].tolist(), valid)
+    
+    def test_huge_inputs_stay_fast(self):
+        """A million-digit input is rejected without converting it"""
+        import time
+        
+        start = time.perf_counter()
+        is_valid, _, message = validate_number_input("7" * 1_000_000, 1, 100)
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertFalse(is_valid)
+        self.assertEqual(message, "Number must be between 1 and 100!")
+
+class TestRangeTracker(unittest.TestCase):
+    """Test cases for incremental interval tracking"""
+    
+    def test_narrowing(self):
+        """Test that each answer narrows the feasible range"""
+        tracker = RangeTracker(1, 100)
+        self.assertEqual(tracker.remaining, 100)
+        
+        self.assertTrue(tracker.update(50, "Too High"))
+        self.assertEqual((tracker.lo, tracker.hi), (1, 49))
+        self.assertTrue(tracker.update(25, "Too Low"))
+        self.assertEqual((tracker.lo, tracker.hi), (26, 49))
+        self.assertEqual(tracker.remaining, 24)
+        self.assertEqual(tracker.midpoint(), 37)
+    
+    def test_matches_calculate_optimal_guess(self):
+        """Test that the tracker agrees with the full history rescan"""
+        history = [(50, "Too High"), (25, "Too Low"), (37, "Too High"), (31, "Too Low")]
+        tracker = RangeTracker(1, 100)
+        for guess, feedback in history:
+            tracker.update(guess, feedback)
+        
+        self.assertEqual(calculate_optimal_guess(history, 1, 100),
+                         calculate_optimal_guess(history, 1, 100, tracker=tracker))
+    
+    def test_contradictory_feedback(self):
+        """Test that impossible answers are detected and ignored"""
+        tracker = RangeTracker(1, 100)
+        tracker.update(50, "Too Low")
+        
+        self.assertFalse(tracker.update(40, "Too High"))
+        self.assertFalse(tracker.update(10, "Correct!"))
+        self.assertTrue(tracker.contradicted)
+        self.assertEqual((tracker.lo, tracker.hi), (51, 100))
+        
+        tracker.reset()
+        self.assertFalse(tracker.contradicted)
+        self.assertEqual(tracker.remaining, 100)
+
 class TestGameConfig(unittest.TestCase):
     """Test cases for game configuration"""
     
@@ -87,19 +179,23 @@ class TestGameIntegration(unittest.TestCase):
         target = 42
         guesses = [50, 25, 37, 43, 40, 41, 42]
         
+        tracker = RangeTracker(1, 100)
         attempts = 0
         for guess in guesses:
             attempts += 1
             if guess == target:
                 feedback = "Correct!"
-                break
             elif guess > target:
                 feedback = "Too High"
             else:
                 feedback = "Too Low"
+            self.assertTrue(tracker.update(guess, feedback))
+            if feedback == "Correct!":
+                break
         
         self.assertEqual(feedback, "Correct!")
         self.assertEqual(attempts, 7)
+        self.assertEqual(tracker.remaining, 1)
     
     def test_max_attempts_scenario(self):
         """Test game over after max attempts"""
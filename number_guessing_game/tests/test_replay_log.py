@@ -0,0 +1,269 @@
+"""Unit tests for the binary replay log"""
+
+import unittest
+import sys
+import os
+import csv
+import json
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import replay_log
+from replay_log import (ReplayLogWriter, ReplayLogError, read_games, encode_game,
+                        decode_game, to_csv, to_jsonl)
+from engine import GameEngine, CODE_CORRECT, CODE_TOO_HIGH, CODE_TOO_LOW, CODE_BY_FEEDBACK
+from analytics import GameStats, Histogram, analyze, analyze_files, HINT_CAP
+
+class TestReplayLog(unittest.TestCase):
+    """Test cases for the replay log format, writer and reader"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "games.ngrl")
+    
+    def test_encode_round_trip(self):
+        """Test that negative ranges, big numbers and odd lengths survive"""
+        guesses = [0, -500, 10**9, 7, 3]
+        codes = [CODE_TOO_LOW, CODE_TOO_LOW, CODE_TOO_HIGH, CODE_TOO_HIGH, CODE_CORRECT]
+        record = encode_game(-1000, 10**12, 40, 3, guesses, codes, hints=2)
+        
+        length = record[0]
+        self.assertEqual(length, len(record) - 1)
+        game = decode_game(record, 1)
+        self.assertEqual((game.min_number, game.max_number, game.max_attempts), (-1000, 10**12, 40))
+        self.assertEqual((game.target, game.hints), (3, 2))
+        self.assertEqual(list(game.guesses), guesses)
+        self.assertEqual(list(game.codes), codes)
+        self.assertTrue(game.won)
+        self.assertEqual(game.attempts, 5)
+    
+    def test_typical_game_is_compact(self):
+        """A seven-guess 1-100 game fits in 16 bytes"""
+        record = encode_game(1, 100, 10, 74, [50, 75, 62, 68, 71, 73, 74],
+                             [2, 1, 2, 2, 2, 2, 0])
+        self.assertLessEqual(len(record), 16)
+    
+    def test_writer_per_guess_api(self):
+        """Test logging an interactive game guess by guess"""
+        writer = ReplayLogWriter(self.path)
+        engine = GameEngine(1, 100, 10)
+        engine.new_game(target=30)
+        writer.begin_game(1, 100, 10, engine.target_number)
+        writer.log_hint()
+        for guess in [50, 25, 30]:
+            writer.log_guess(guess, engine.guess(guess))
+        writer.end_game()
+        writer.close()
+        
+        games = list(read_games(self.path))
+        self.assertEqual(len(games), 1)
+        self.assertEqual(games[0].guesses, (50, 25, 30))
+        self.assertEqual(games[0].codes, (CODE_TOO_HIGH, CODE_TOO_LOW, CODE_CORRECT))
+        self.assertEqual(games[0].hints, 1)
+    
+    def test_adversarial_target_given_at_end(self):
+        """A target fixed only when the game ends is taken by end_game"""
+        writer = ReplayLogWriter(self.path)
+        engine = GameEngine(1, 100, 3, adversarial=True)
+        engine.new_game()
+        writer.begin_game(1, 100, 3, engine.target_number)
+        for guess in [50, 25, 12]:
+            writer.log_guess(guess, engine.guess(guess))
+        writer.end_game(engine.target_number)
+        writer.close()
+        
+        games = list(read_games(self.path))
+        self.assertEqual(games[0].target, engine.target_number)
+        self.assertFalse(games[0].won)
+    
+    def test_write_errors_do_not_stop_the_writer(self):
+        """A game that cannot be encoded is logged and dropped; flush still returns"""
+        writer = ReplayLogWriter(self.path)
+        with self.assertLogs("replay_log", level="ERROR"):
+            writer.begin_game(1, 100, 10)
+            writer.log_guess(50, CODE_CORRECT)
+            writer.end_game()  # No target ever given
+            writer.flush()
+        self.assertEqual(writer.dropped, 1)
+        
+        writer.log_game(1, 100, 10, 42, [50, 42], [CODE_TOO_HIGH, CODE_CORRECT])
+        writer.close()
+        self.assertEqual([game.target for game in read_games(self.path)], [42])
+    
+    def test_closed_writer_refuses_games(self):
+        """Games logged after close() raise instead of waiting on a stopped thread"""
+        writer = ReplayLogWriter(self.path)
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.log_game(1, 100, 10, 42, [42], [CODE_CORRECT])
+        writer.begin_game(1, 100, 10, 42)
+        writer.log_guess(42, CODE_CORRECT)
+        with self.assertRaises(ValueError):
+            writer.end_game()
+        writer.flush()
+        self.assertEqual(list(read_games(self.path)), [])
+    
+    def test_streaming_across_chunks(self):
+        """Test reading many games with a tiny read chunk and appending"""
+        for _ in range(2):
+            writer = ReplayLogWriter(self.path)
+            for target in range(1, 301):
+                writer.log_game(1, 1000, 10, target, [500, target],
+                                [CODE_TOO_HIGH if target < 500 else CODE_TOO_LOW, CODE_CORRECT])
+            writer.close()
+        
+        original_chunk = replay_log.READ_CHUNK
+        replay_log.READ_CHUNK = 7
+        self.addCleanup(setattr, replay_log, "READ_CHUNK", original_chunk)
+        
+        targets = [game.target for game in read_games(self.path)]
+        self.assertEqual(targets, list(range(1, 301)) * 2)
+    
+    def test_bad_files(self):
+        """Test that foreign and truncated files are rejected"""
+        with open(self.path, "wb") as f:
+            f.write(b"hello world")
+        with self.assertRaises(ReplayLogError):
+            list(read_games(self.path))
+        
+        with open(self.path, "wb") as f:
+            f.write(replay_log.FILE_HEADER + encode_game(1, 100, 10, 5, [5], [0])[:-2])
+        with self.assertRaises(ReplayLogError):
+            list(read_games(self.path))
+    
+    def test_writer_repairs_a_truncated_log(self):
+        """A record cut off by a crash is dropped before new games are appended"""
+        records = [encode_game(1, 100, 10, target, [50, target], [CODE_TOO_HIGH, CODE_CORRECT])
+                   for target in (5, 6)]
+        for cut in (1, 3, len(records[1]) - 1):
+            with self.subTest(cut=cut):
+                with open(self.path, "wb") as f:
+                    f.write(replay_log.FILE_HEADER + records[0] + records[1][:cut])
+                writer = ReplayLogWriter(self.path)
+                writer.log_game(1, 100, 10, 7, [50, 7], [CODE_TOO_HIGH, CODE_CORRECT])
+                writer.close()
+                self.assertEqual([game.target for game in read_games(self.path)], [5, 7])
+        
+        # A header cut short is rewritten; a foreign file is left alone
+        with open(self.path, "wb") as f:
+            f.write(replay_log.FILE_HEADER[:2])
+        self.assertEqual(replay_log.repair_log(self.path), 2)
+        ReplayLogWriter(self.path).close()
+        self.assertEqual(list(read_games(self.path)), [])
+        
+        with open(self.path, "wb") as f:
+            f.write(b"hello world")
+        with self.assertRaises(ReplayLogError):
+            ReplayLogWriter(self.path)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"hello world")
+    
+    def test_converters(self):
+        """Test CSV and JSONL export"""
+        writer = ReplayLogWriter(self.path)
+        writer.log_game(1, 100, 10, 42, [50, 42], [CODE_TOO_HIGH, CODE_CORRECT], hints=1)
+        writer.log_game(1, 100, 2, 99, [50, 75], [CODE_TOO_LOW, CODE_TOO_LOW])
+        writer.close()
+        
+        csv_path = os.path.join(self.temp_dir.name, "games.csv")
+        self.assertEqual(to_csv(self.path, csv_path), 2)
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]["guesses"], "50 42")
+        self.assertEqual(rows[0]["feedback"], "HC")
+        self.assertEqual(rows[1]["won"], "0")
+        
+        jsonl_path = os.path.join(self.temp_dir.name, "games.jsonl")
+        self.assertEqual(to_jsonl(self.path, jsonl_path), 2)
+        with open(jsonl_path, encoding="utf-8") as f:
+            first = json.loads(f.readline())
+        self.assertEqual(first["feedback"], ["Too High", "Correct!"])
+        self.assertEqual(first["hints"], 1)
+
+class TestAnalytics(unittest.TestCase):
+    """Test cases for the streaming aggregates"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.paths = []
+        for index in range(2):
+            path = os.path.join(self.temp_dir.name, f"part{index}.ngrl")
+            writer = ReplayLogWriter(path)
+            for target in range(1, 101):
+                engine = GameEngine(1, 100, 5 + index)
+                engine.new_game(target=target)
+                guesses = []
+                while engine.game_active:
+                    guess = engine.tracker.midpoint()
+                    engine.guess(guess)
+                    guesses.append(guess)
+                writer.log_game(1, 100, 5 + index, target, guesses,
+                                [CODE_BY_FEEDBACK[feedback] for _, feedback in engine.guess_history], hints=target % 8)
+            writer.close()
+            self.paths.append(path)
+    
+    def test_histogram_quantiles(self):
+        """Test quantiles on a small histogram"""
+        histogram = Histogram({1: 1, 2: 2, 7: 1})
+        self.assertEqual(histogram.quantile(0.5), 2)
+        self.assertEqual(histogram.quantile(1.0), 7)
+        self.assertEqual(histogram.quantile(0.0), 1)
+        self.assertAlmostEqual(histogram.mean, 3.0)
+        self.assertIsNone(Histogram().quantile(0.5))
+    
+    def test_aggregates(self):
+        """Test the aggregates of one log"""
+        stats = analyze(read_games(self.paths[0]))
+        
+        self.assertEqual(stats.games, 100)
+        # Binary search finds at most 31 numbers of 1-100 in five guesses
+        self.assertEqual(stats.wins, 31)
+        self.assertEqual(stats.ranges[(1, 100, 5)], [100, 69])
+        self.assertEqual(stats.attempts_to_win.total, 31)
+        self.assertLessEqual(max(stats.attempts_to_win.counts), 5)
+        self.assertEqual(stats.first_guess.counts, {49: 100})
+        self.assertEqual(sum(games for games, _ in stats.hints.values()), 100)
+        self.assertEqual(max(stats.hints), HINT_CAP)
+    
+    def test_merge_matches_single_pass(self):
+        """Test that parallel, merged and saved results agree"""
+        single = GameStats()
+        for path in self.paths:
+            analyze(read_games(path), single)
+        
+        parallel = analyze_files(self.paths, workers=2)
+        restored = GameStats.from_dict(json.loads(json.dumps(parallel.to_dict())))
+        
+        self.assertEqual(parallel.to_dict(), single.to_dict())
+        self.assertEqual(restored.to_dict(), single.to_dict())
+        self.assertEqual(single.games, 200)
+        self.assertEqual(len(single.ranges), 2)
+
+    def test_one_file_is_split_on_record_boundaries(self):
+        """Test that chunks of one large log add up to a serial pass"""
+        path = os.path.join(self.temp_dir.name, "big.ngrl")
+        writer = ReplayLogWriter(path)
+        for index in range(5):
+            for game in read_games(self.paths[index % 2]):
+                writer.log_game(game.min_number, game.max_number, game.max_attempts, game.target,
+                                game.guesses, game.codes, game.hints)
+        writer.close()
+        
+        chunks = replay_log.split_log(path, 7)
+        self.assertEqual(len(chunks), 7)
+        self.assertEqual([start for start, _ in chunks[1:]], [end for _, end in chunks[:-1]])
+        self.assertEqual(chunks[-1][1], os.path.getsize(path))
+        pieces = [game for start, end in chunks for game in read_games(path, start, end)]
+        self.assertEqual(pieces, list(read_games(path)))
+        
+        serial = analyze_files([path], workers=1)
+        parallel = analyze_files([path], workers=2, chunk_size=os.path.getsize(path) // 5)
+        self.assertEqual(parallel.to_dict(), serial.to_dict())
+        self.assertEqual(serial.games, 500)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
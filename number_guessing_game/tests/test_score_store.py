@@ -0,0 +1,111 @@
+"""Unit tests for the persistent score store"""
+
+import unittest
+import unittest.mock
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from score_store import ScoreStore, difficulty_key
+
+class TestScoreStore(unittest.TestCase):
+    """Test cases for the SQLite-backed score store"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "scores.db")
+        self.difficulty = difficulty_key(1, 100, 10)
+    
+    def open_store(self):
+        store = ScoreStore(self.path, flush_interval=0.01)
+        self.addCleanup(store.close)
+        return store
+    
+    def test_cached_best_score(self):
+        """Test that the cached view updates before anything is written"""
+        store = self.open_store()
+        self.assertIsNone(store.best_score("ana", self.difficulty))
+        
+        self.assertTrue(store.record("ana", self.difficulty, 7, won=True))
+        self.assertFalse(store.record("ana", self.difficulty, 9, won=True))
+        self.assertFalse(store.record("ana", self.difficulty, 3, won=False))
+        self.assertTrue(store.record("ana", self.difficulty, 5, won=True))
+        
+        self.assertEqual(store.best_score("ana", self.difficulty), 5)
+    
+    def test_scores_survive_restart(self):
+        """Test that best scores are loaded again after reopening"""
+        store = ScoreStore(self.path)
+        store.record("ana", self.difficulty, 6, won=True)
+        store.record("bo", "1-1000/10", 9, won=True)
+        store.close()
+        
+        reopened = self.open_store()
+        self.assertEqual(reopened.best_score("ana", self.difficulty), 6)
+        self.assertEqual(reopened.best_score("bo", "1-1000/10"), 9)
+    
+    def test_queries(self):
+        """Test top-N, per-player best and per-difficulty stats"""
+        store = self.open_store()
+        for player, attempts, won in [("ana", 6, True), ("bo", 4, True), ("cy", 8, True),
+                                      ("bo", 10, False), ("ana", 5, True)]:
+            store.record(player, self.difficulty, attempts, won)
+        store.record("ana", "1-1000/10", 9, True)
+        store.flush()
+        
+        top = store.top_scores(self.difficulty, limit=2)
+        self.assertEqual([(player, attempts) for player, attempts, _ in top],
+                         [("bo", 4), ("ana", 5)])
+        self.assertEqual(store.player_best("ana"), {self.difficulty: 5, "1-1000/10": 9})
+        
+        stats = store.difficulty_stats()[self.difficulty]
+        self.assertEqual(stats['games'], 5)
+        self.assertEqual(stats['wins'], 4)
+        self.assertAlmostEqual(stats['average_attempts'], 5.75)
+    
+    def test_batched_writes(self):
+        """Test that many queued rows are all committed"""
+        store = ScoreStore(self.path, batch_size=64)
+        for attempts in range(1000):
+            store.record("kiosk", self.difficulty, attempts % 10 + 1, won=True)
+        store.close()
+        
+        reopened = self.open_store()
+        self.assertEqual(reopened.difficulty_stats()[self.difficulty]['games'], 1000)
+        self.assertEqual(reopened.best_score("kiosk", self.difficulty), 1)
+
+    def test_write_errors_do_not_stop_the_writer(self):
+        """A failed batch is logged and dropped; later rows are still written"""
+        store = self.open_store()
+        store._reader.execute("ALTER TABLE scores RENAME TO scores_moved")
+        store._reader.commit()
+
+        with self.assertLogs("score_store", level="ERROR") as logs:
+            store.record("ana", self.difficulty, 4, won=True)
+            store.flush()
+        self.assertEqual(store.dropped, 1)
+        self.assertIn("Dropped 1 score rows", logs.output[0])
+
+        store._reader.execute("ALTER TABLE scores_moved RENAME TO scores")
+        store._reader.commit()
+        store.record("ben", self.difficulty, 6, won=True)
+        store.flush()
+        self.assertEqual(store.top_scores(self.difficulty), [("ben", 6, unittest.mock.ANY)])
+
+    def test_record_after_close(self):
+        """A closed store refuses new rows instead of queueing them forever"""
+        store = ScoreStore(self.path)
+        store.record("ana", self.difficulty, 6, won=True)
+        store.close()
+        with self.assertRaises(ValueError):
+            store.record("ana", self.difficulty, 4, won=True)
+        store.flush()  # Returns: nothing was queued
+        store.close()
+        self.assertEqual(store.best_score("ana", self.difficulty), 6)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+"""Unit tests for the asyncio multiplayer server and its client"""
+
+import unittest
+import asyncio
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import GuessingServer
+from client import GuessingClient, run_local_load
+
+class TestProtocol(unittest.TestCase):
+    """Test cases for the line protocol without sockets"""
+
+    def setUp(self):
+        self.server = GuessingServer(1, 100, 3)
+        _, self.session = self.server.new_session()
+
+    def test_game_commands(self):
+        """Test a full losing game and the hint command"""
+        self.assertEqual(self.server.handle_line(self.session, "GUESS 5"),
+                         "ERR no active game, send NEW")
+        self.assertEqual(self.server.handle_line(self.session, "new"), "OK 1 100 3")
+        self.session.target_number = 42
+
+        self.assertEqual(self.server.handle_line(self.session, "GUESS 50"), "HIGH 1")
+        self.assertEqual(self.server.handle_line(self.session, "10"), "LOW 2")
+        self.assertEqual(self.server.handle_line(self.session, "HINT"), "HINT 11 49 30")
+        self.assertEqual(self.server.handle_line(self.session, "GUESS 30"), "LOSE 42")
+        self.assertEqual(self.server.total_guesses, 3)
+
+    def test_hint_comes_from_hint_engine(self):
+        """Test that HINT reports the shared hint engine's interval and suggestion"""
+        self.server.handle_line(self.session, "NEW")
+        self.session.target_number = 7
+        self.server.handle_line(self.session, "GUESS 90")
+
+        hint_for = self.server.hint_engine.hint_for
+        with mock.patch.object(self.server.hint_engine, "hint_for", wraps=hint_for) as spy:
+            response = self.server.handle_line(self.session, "HINT")
+        spy.assert_called_once_with(self.session)
+        hint = hint_for(self.session)
+        self.assertEqual(response, f"HINT {hint.lo} {hint.hi} {hint.suggestion}")
+        self.assertEqual(response, "HINT 1 89 45")
+
+    def test_invalid_input(self):
+        """Test errors for bad guesses and unknown commands"""
+        self.server.handle_line(self.session, "NEW")
+
+        self.assertTrue(self.server.handle_line(self.session, "GUESS abc").startswith("ERR"))
+        self.assertTrue(self.server.handle_line(self.session, "GUESS 101").startswith("ERR"))
+        self.assertEqual(self.server.handle_line(self.session, "DANCE"), "ERR unknown command")
+        self.assertIsNone(self.server.handle_line(self.session, "QUIT"))
+        self.assertEqual(self.session.attempts, 0)
+
+class TestServerConnections(unittest.TestCase):
+    """Test cases that talk to a real server over TCP"""
+
+    def test_client_round_trip(self):
+        """Test a winning game through GuessingClient"""
+        async def scenario():
+            server = GuessingServer(1, 100, 10)
+            port = await server.start("127.0.0.1", 0)
+            try:
+                client = await GuessingClient.connect("127.0.0.1", port)
+                self.assertEqual(await client.new_game(), ["OK", "1", "100", "10"])
+                while True:
+                    _, lo, hi, suggestion = await client.hint()
+                    response = await client.guess(suggestion)
+                    if response[0] != "HIGH" and response[0] != "LOW":
+                        break
+                await client.close()
+                return response
+            finally:
+                await server.stop()
+
+        response = asyncio.run(scenario())
+        self.assertEqual(response[0], "WIN")
+        self.assertLessEqual(int(response[1]), 7)
+
+    def test_idle_timeout(self):
+        """Test that a silent client is disconnected"""
+        async def scenario():
+            server = GuessingServer(idle_timeout=0.05)
+            port = await server.start("127.0.0.1", 0)
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                await reader.readline()
+                line = await asyncio.wait_for(reader.readline(), 2)
+                writer.close()
+                return line
+            finally:
+                await server.stop()
+
+        line = asyncio.run(scenario())
+        self.assertEqual(line, b"BYE idle\n")
+
+    def test_session_limit(self):
+        """Test that connections beyond max_sessions are refused"""
+        async def scenario():
+            server = GuessingServer(max_sessions=1)
+            port = await server.start("127.0.0.1", 0)
+            try:
+                first = await GuessingClient.connect("127.0.0.1", port)
+                with self.assertRaises(ConnectionError):
+                    await GuessingClient.connect("127.0.0.1", port)
+                await first.close()
+            finally:
+                await server.stop()
+
+        asyncio.run(scenario())
+
+    def test_load_generator(self):
+        """Test the load generator's report on a small run"""
+        stats = asyncio.run(run_local_load(players=50, games=2))
+
+        self.assertEqual(stats['players'], 50)
+        self.assertGreaterEqual(stats['guesses'], 100)
+        self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertGreater(stats['guesses_per_second'], 0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,194 @@
+"""GUI-level tests of NumberGuessingGame on the headless Tk stand-in"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# and the tests directory for the headless Tk stand-in
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless_tk
+from solution import NumberGuessingGame
+
+class TestNumberGuessingGame(unittest.TestCase):
+    """Test cases for full game flows through the window code"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config_path = os.path.join(temp_dir.name, "config.json")
+        self.settings = {
+            "scores_db_path": os.path.join(temp_dir.name, "scores.db"),
+            "replay_log_path": os.path.join(temp_dir.name, "replays.ngrl"),
+            "history_spill_dir": temp_dir.name,
+        }
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            json.dump(self.settings, f)
+
+        self.tk = headless_tk.install()
+        self.addCleanup(headless_tk.uninstall)
+        self.messagebox = self.tk.messagebox
+
+        self.root = self.tk.Tk()
+        self.game = NumberGuessingGame(self.root, self.config_path)
+        self.addCleanup(self.game.close_stores)
+        self.root.update()
+
+    def text(self, widget):
+        return widget.cget("text")
+
+    def guess(self, number):
+        self.game.guess_entry.type(str(number))
+        self.root.update()
+
+    def wrong_guess(self):
+        target = self.game.target_number
+        return target + 1 if target < self.game.max_number else target - 1
+
+    def test_initial_window(self):
+        """The window starts with a fresh game"""
+        self.assertEqual(self.root.title(), "🎯 Number Guessing Game")
+        self.assertEqual(self.text(self.game.feedback_label), "🤔 Make your first guess!")
+        self.assertEqual(self.text(self.game.attempts_label), "Attempts: 0/10")
+        self.assertEqual(self.text(self.game.best_score_label), "Best Score: Not set")
+        self.assertIs(self.root.focus, self.game.guess_entry)
+        self.assertTrue(self.game.game_active)
+
+    def test_invalid_input(self):
+        """Invalid input shows an error and costs no attempt"""
+        self.guess("abc")
+        self.assertEqual(self.text(self.game.feedback_label), "❌ Please enter a valid number!")
+        self.assertEqual(self.game.feedback_label.cget("bg"), self.game.config.colors['error'])
+
+        self.guess(500)
+        self.assertEqual(self.text(self.game.feedback_label), "❌ Number must be between 1 and 100!")
+        self.assertEqual(self.game.attempts, 0)
+        self.assertEqual(self.game.guess_entry.get(), "")
+
+    def test_win(self):
+        """A correct guess shows a record, disables input and fills the history"""
+        wrong = self.wrong_guess()
+        self.guess(wrong)
+        self.assertIn(self.text(self.game.feedback_label),
+                      ("📉 Too High! Try a lower number.", "📈 Too Low! Try a higher number."))
+
+        self.guess(self.game.target_number)
+        self.assertEqual(self.messagebox.titles(), ["🏆 New Record!"])
+        self.assertEqual(self.text(self.game.feedback_label), "🎉 Congratulations! You found it!")
+        self.assertEqual(self.text(self.game.best_score_label), "Best Score: 2 attempts")
+        self.assertEqual(self.game.guess_entry.cget("state"), "disabled")
+        self.assertEqual(self.game.submit_button.cget("state"), "disabled")
+        self.assertEqual(len(self.game.history_listbox.rows), 2)
+        self.assertTrue(self.game.history_listbox.rows[1].startswith(f"#2: {self.game.target_number}"))
+
+        # A slower win is not a record
+        self.game.new_game()
+        for _ in range(3):
+            self.guess(self.wrong_guess())
+        self.guess(self.game.target_number)
+        self.assertEqual(self.messagebox.titles()[-1], "🎉 You Won!")
+        self.assertEqual(self.text(self.game.best_score_label), "Best Score: 2 attempts")
+
+    def test_loss(self):
+        """Running out of attempts reveals the target"""
+        for _ in range(10):
+            self.guess(self.wrong_guess())
+
+        target = self.game.target_number
+        self.assertEqual(self.messagebox.titles(), ["😔 Game Over"])
+        self.assertIn(f"The number was {target}", self.messagebox.calls[0][2])
+        self.assertEqual(self.text(self.game.feedback_label), f"💀 Game Over! The number was {target}")
+        self.assertEqual(self.game.attempts_label.cget("fg"), self.game.config.colors['error'])
+        self.assertEqual(self.game.guess_entry.cget("state"), "disabled")
+
+        # Typing into the disabled entry does nothing
+        self.guess(target)
+        self.assertEqual(self.game.attempts, 10)
+
+    def test_hint(self):
+        """Hints need an active game"""
+        self.game.show_hint()
+        self.assertEqual(self.messagebox.calls[-1][1], "💡 Hint")
+        self.assertIn("100 candidates left", self.messagebox.calls[-1][2])
+
+        self.game.reset_game()
+        self.root.update()
+        self.assertEqual(self.text(self.game.feedback_label), "🎮 Click 'New Game' to start!")
+        self.game.show_hint()
+        self.assertEqual(self.messagebox.calls[-1][1], "Game Not Active")
+
+    def test_keyboard_and_buttons(self):
+        """Key bindings and buttons reach the game"""
+        self.root.event_generate("<Control-a>")
+        self.assertEqual(self.game.attempts, 1)
+        self.root.event_generate("<Control-n>")
+        self.assertEqual(self.game.attempts, 0)
+
+        hint_button = self.root.find(self.tk.Button, text="💡 Hint")[0]
+        hint_button.invoke()
+        self.assertEqual(self.messagebox.titles(), ["💡 Hint"])
+
+    def test_window_keeps_its_toolkit(self):
+        """A window keeps using the tkinter it was built with"""
+        headless_tk.uninstall()
+        self.game.show_hint()
+        self.assertIs(self.game.messagebox, self.messagebox)
+        self.assertEqual(self.messagebox.titles(), ["💡 Hint"])
+
+    def test_quit_asks_first(self):
+        """Quit only closes the stores after the player confirms"""
+        self.root.mainloop()
+        self.messagebox.answers.append(False)
+        self.root.event_generate("<Control-q>")
+        self.assertTrue(self.root.running)
+
+        self.root.event_generate("<Control-q>")
+        self.assertFalse(self.root.running)
+        self.assertEqual(self.messagebox.titles(), ["Quit", "Quit"])
+
+    def test_scripted_games(self):
+        """Hundreds of auto-played games in a row all end in a win"""
+        for _ in range(300):
+            self.game.new_game()
+            while self.game.game_active:
+                self.game.auto_play_step()
+            self.assertTrue(self.game.engine.won)
+            self.assertLessEqual(self.game.attempts, 7)
+        self.root.update()
+        self.assertEqual(len(self.messagebox.calls), 300)
+
+    def test_config_reload_between_rounds(self):
+        """An edited config file applies at the next new game"""
+        self.game.config_watcher.interval = 0
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            json.dump(dict(self.settings, max_number=1000, max_attempts=12), f)
+        os.utime(self.config_path, (2_000_000_000, 2_000_000_000))
+
+        self.guess(self.wrong_guess())
+        self.assertEqual(self.game.max_number, 100)
+
+        self.game.new_game()
+        self.root.update()
+        self.assertEqual(self.text(self.game.range_label), "🎲 Guess a number between 1 and 1000")
+        self.assertEqual(self.text(self.game.attempts_label), "Attempts: 0/12")
+        self.assertLessEqual(self.game.target_number, 1000)
+
+    def test_broken_config_is_reported(self):
+        """A config edit that fails to load is shown and the old settings kept"""
+        self.game.config_watcher.interval = 0
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            json.dump(dict(self.settings, max_attempts=0), f)
+        os.utime(self.config_path, (2_000_000_000, 2_000_000_000))
+
+        self.game.new_game()
+        self.root.update()
+        self.assertIn("Settings not loaded", self.text(self.game.feedback_label))
+        self.assertIn("max_attempts", self.text(self.game.feedback_label))
+        self.assertEqual(self.text(self.game.attempts_label), "Attempts: 0/10")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Unit tests for the terminal front-end (without a terminal)"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tui import TerminalGame, ScreenBuffer, plain, HEADER_ROWS
+from config_loader import compile_config
+from engine import TOO_HIGH, TOO_LOW
+
+class TestTerminalGame(unittest.TestCase):
+    """Test cases for playing through TerminalGame and its layout"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config = compile_config({
+            "scores_db_path": os.path.join(temp_dir.name, "scores.db"),
+            "replay_log_path": os.path.join(temp_dir.name, "replays.ngrl"),
+            "history_spill_dir": temp_dir.name,
+        })
+        self.game = TerminalGame(self.config, seed=7)
+        self.addCleanup(self.game.close)
+        self.game.new_game()
+
+    def type(self, text):
+        for char in text:
+            self.game.handle_key(char)
+        self.game.handle_key("ENTER")
+
+    def test_guess_and_feedback(self):
+        """Typed guesses are validated, played and shown"""
+        target = self.game.engine.target_number
+        guess = 1 if target != 1 else 2
+
+        self.type("x" + str(guess))  # letters that are not commands are ignored
+        feedback = TOO_HIGH if guess > target else TOO_LOW
+        self.assertEqual(self.game.feedback, self.config.feedback[feedback])
+        self.assertEqual(self.game.engine.attempts, 1)
+
+        self.type("1000")
+        self.assertEqual(self.game.feedback[0], self.config.invalid_messages[3])
+        self.assertEqual(self.game.engine.attempts, 1)
+
+        rows, cursor = self.game.render(24, 80)
+        self.assertEqual(len(rows), 24)
+        self.assertIn(f"#1: {guess}", rows[HEADER_ROWS][0])
+        self.assertEqual(rows[2], ("Attempts: 1/10", "success"))
+        self.assertEqual(cursor, (7, len("Your guess: ")))
+
+    def test_auto_play_wins_and_records_best_score(self):
+        """Auto-play finds the target and the best score is displayed"""
+        for _ in range(10):
+            self.game.handle_key("a")
+
+        self.assertTrue(self.game.engine.won)
+        self.assertEqual(self.game.best_score, self.game.engine.attempts)
+        self.assertIn("best score", self.game.notice)
+        rows, _ = self.game.render(24, 80)
+        self.assertEqual(rows[3][0], f"Best Score: {self.game.engine.attempts} attempts")
+
+    def test_hint_and_reset(self):
+        """Hints fill the hint rows; reset clears them and stops the round"""
+        self.game.handle_key("h")
+        self.assertEqual(len(self.game.hint_lines), 3)
+        self.assertIn("candidates", self.game.hint_lines[0])
+
+        self.game.handle_key("r")
+        self.assertFalse(self.game.engine.game_active)
+        self.assertEqual(self.game.hint_lines, [])
+        self.game.handle_key("h")
+        self.assertIn("new game", self.game.notice)
+
+    def test_history_scrolls(self):
+        """The history list shows the newest rows and scrolls back"""
+        engine = self.game.engine
+        engine.max_attempts = 50
+        for _ in range(30):
+            self.type("100" if engine.target_number != 100 else "99")
+
+        rows, _ = self.game.render(20, 80)
+        self.assertIn("#30:", rows[-2][0])
+        self.game.handle_key("PGUP")
+        rows, _ = self.game.render(20, 80)
+        self.assertIn("#25:", rows[-2][0])
+        self.assertIn("scrolled 5 up", rows[HEADER_ROWS - 1][0])
+
+    def test_ascii_mode(self):
+        """ASCII mode drops emoji and keeps arrows readable"""
+        self.assertEqual(plain("#1: 50 → 📉 Too High"), "#1: 50 -> Too High")
+        self.game.ascii_only = True
+        rows, _ = self.game.render(24, 80)
+        self.assertTrue(all(text.isascii() for text, _ in rows))
+
+class TestScreenBuffer(unittest.TestCase):
+    """Test cases for the changed-rows diff"""
+
+    def test_only_changed_rows(self):
+        buffer = ScreenBuffer()
+        first = [("a", None), ("b", "info"), ("c", None)]
+        self.assertEqual(len(buffer.diff(first)), 3)
+        self.assertEqual(buffer.diff(first), [])
+
+        changes = buffer.diff([("a", None), ("b", "error")])
+        self.assertEqual(changes, [(1, "b", "error"), (2, "", None)])
+
+        buffer.invalidate()
+        self.assertEqual(len(buffer.diff(first)), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Unit tests for the batched widget update layer"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# and the tests directory for the headless Tk stand-in
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless_tk
+from view_model import ViewModel
+
+class TestViewModel(unittest.TestCase):
+    """Test cases for diffing and batching"""
+    
+    def setUp(self):
+        # Idle callbacks wait in root.idle until root.update()
+        self.root = headless_tk.Tk()
+        self.view = ViewModel(self.root)
+    
+    def test_unchanged_values_are_not_sent(self):
+        """Test that only differing options reach the widget"""
+        label = headless_tk.Label(self.root, text="Attempts: 0/10", fg="green")
+        self.view.track(label, 'text', 'fg')
+        
+        self.view.set(label, text="Attempts: 1/10")
+        self.view.set(label, fg="green")
+        self.assertEqual(label.calls, 0)  # Nothing happens before idle
+        self.assertEqual(len(self.root.idle), 1)
+        
+        self.root.update()
+        self.assertEqual(label.calls, 1)
+        self.assertEqual(label.options, {'text': "Attempts: 1/10", 'fg': "green"})
+        
+        self.view.set(label, text="Attempts: 1/10", fg="green")
+        self.root.update()
+        self.assertEqual(label.calls, 1)
+        self.assertEqual(self.view.stats.requested, 3)
+        self.assertEqual(self.view.stats.issued, 1)
+    
+    def test_rapid_updates_collapse(self):
+        """Several updates between idles cost one configure"""
+        label = headless_tk.Label(self.root, text="")
+        for attempt in range(1, 6):
+            self.view.set(label, text=f"Attempts: {attempt}/10")
+        self.root.update()
+        
+        self.assertEqual(label.calls, 1)
+        self.assertEqual(label.cget('text'), "Attempts: 5/10")
+    
+    def test_virtual_list_renders_visible_rows(self):
+        """Only the visible window of a long source reaches the Listbox"""
+        source = []
+        listbox = headless_tk.Listbox(self.root)
+        scrollbar = headless_tk.Scrollbar(self.root)
+        history = self.view.list_view(listbox, scrollbar, rows=3,
+                                      count=lambda: len(source),
+                                      row_text=lambda index: f"#{source[index]}")
+        self.assertEqual(scrollbar.cget('command'), history.on_scroll)
+        
+        source.extend(range(100_000))
+        history.refresh()
+        self.root.update()
+        self.assertEqual(listbox.rows, ["#99997", "#99998", "#99999"])
+        self.assertEqual(scrollbar.position, (99_997 / 100_000, 1.0))
+        self.assertEqual(listbox.calls, 1)
+        
+        # Dragging the scrollbar to the middle shows rows from there
+        history.on_scroll("moveto", "0.5")
+        self.root.update()
+        self.assertEqual(listbox.rows, ["#50000", "#50001", "#50002"])
+        self.assertFalse(history.follow)
+        
+        # New rows do not move a scrolled-up view ...
+        source.append(100_000)
+        history.refresh()
+        self.root.update()
+        self.assertEqual(listbox.rows[0], "#50000")
+        
+        # ... until it is scrolled back to the bottom
+        history.on_scroll("scroll", "1", "pages")
+        history.scroll_to(10**9)
+        self.root.update()
+        self.assertEqual(listbox.rows, ["#99998", "#99999", "#100000"])
+        self.assertTrue(history.follow)
+        
+        source.clear()
+        history.refresh()
+        self.root.update()
+        self.assertEqual(listbox.rows, [])
+        self.assertEqual(scrollbar.position, (0.0, 1.0))
+    
+    def test_unchanged_window_is_not_redrawn(self):
+        """Refreshing without changes issues no calls"""
+        source = ["a", "b"]
+        listbox = headless_tk.Listbox(self.root)
+        history = self.view.list_view(listbox, headless_tk.Scrollbar(self.root), rows=5,
+                                      count=lambda: len(source), row_text=source.__getitem__)
+        history.refresh()
+        self.root.update()
+        calls = listbox.calls
+        history.refresh()
+        self.root.update()
+        self.assertEqual(listbox.calls, calls)
+        # Only calls that really happened are counted
+        self.assertEqual(self.view.stats.requested, self.view.stats.issued)
+        self.assertEqual(self.view.stats.issued, calls + 1)
+    
+    def test_flush_and_cancel(self):
+        """Test explicit flushes and dropping pending changes"""
+        label = headless_tk.Label(self.root, text="a")
+        self.view.set(label, text="b")
+        self.view.flush()
+        self.assertEqual(label.cget('text'), "b")
+        self.assertEqual(self.root.idle, {})
+        
+        self.view.set(label, text="c")
+        self.view.cancel()
+        self.root.update()
+        self.assertEqual(label.cget('text'), "b")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,224 @@
+"""Multi-process tournament between guessing strategies
+
+Every strategy follows the utils.calculate_optimal_guess interface
+(strategy(guesses_history, min_val, max_val) -> guess). The tournament
+splits each (strategy, configuration) pairing into fixed-size chunks of
+games, plays the chunks on a process pool and merges the histograms.
+
+Each chunk gets its own RNG streams derived from the tournament seed and
+the chunk's identity, so results are identical for any number of workers.
+"""
+
+import abc
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game_config import GameConfig
+from engine import simulate, SimulationResult
+from utils import RangeTracker
+from rng import RandomStreams
+
+# (MIN_NUMBER, MAX_NUMBER, MAX_ATTEMPTS) ranges played by default
+DEFAULT_CONFIGS = [
+    (GameConfig.MIN_NUMBER, GameConfig.MAX_NUMBER, GameConfig.MAX_ATTEMPTS),
+    (1, 1000, 10),
+    (1, 10000, 14),
+]
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# === STRATEGIES ===
+
+class IntervalStrategy(abc.ABC):
+    """
+    Base class for strategies that pick a guess inside the feasible range
+
+    The history list only grows during a game, so the strategy keeps a
+    RangeTracker and feeds it the new entries instead of rescanning.
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.tracker = None
+        self.seen = 0
+
+    def __call__(self, guesses_history, min_val, max_val):
+        tracker = self.tracker
+        if (tracker is None or len(guesses_history) < self.seen or
+                (tracker.min_val, tracker.max_val) != (min_val, max_val)):
+            tracker = self.tracker = RangeTracker(min_val, max_val)
+            self.seen = 0
+        elif not guesses_history:
+            tracker.reset()
+            self.seen = 0
+
+        for guess, feedback in guesses_history[self.seen:]:
+            tracker.update(guess, feedback)
+        self.seen = len(guesses_history)
+
+        return self.choose(tracker.lo, tracker.hi)
+
+    @abc.abstractmethod
+    def choose(self, lo, hi):
+        """Pick a guess in [lo, hi]"""
+
+class BinarySearch(IntervalStrategy):
+    """Middle of the remaining range (same as calculate_optimal_guess)"""
+
+    def choose(self, lo, hi):
+        return (lo + hi) // 2
+
+class GoldenSection(IntervalStrategy):
+    """Split the range at the golden ratio instead of the middle"""
+
+    RATIO = 0.3819660112501051  # 1 - 1/phi
+
+    def choose(self, lo, hi):
+        return lo + int((hi - lo) * self.RATIO)
+
+class RandomGuess(IntervalStrategy):
+    """Uniformly random number inside the remaining range"""
+
+    def choose(self, lo, hi):
+        return self.rng.randint(lo, hi)
+
+class HumanLike(IntervalStrategy):
+    """
+    Roughly halves the range like a person would: aims near the middle
+    with some noise and prefers round numbers when they are close
+    """
+
+    def choose(self, lo, hi):
+        width = hi - lo
+        guess = (lo + hi) // 2 + int(self.rng.gauss(0, width / 8))
+        rounded = round(guess, -1)
+        if abs(rounded - guess) <= 2:
+            guess = rounded
+        return min(max(guess, lo), hi)
+
+STRATEGIES = {
+    'binary': BinarySearch,
+    'golden': GoldenSection,
+    'random': RandomGuess,
+    'human': HumanLike,
+}
+
+# === TOURNAMENT ===
+
+def _chunk_rng(seed, name, config, chunk, stream):
+    """Independent, reproducible RNG for one chunk and purpose"""
+    return RandomStreams(seed).stream(name, config, chunk, stream)
+
+def _play_chunk(task):
+    """Worker entry point: play one chunk of games"""
+    seed, name, config, chunk, n_games = task
+    min_number, max_number, max_attempts = config
+
+    strategy = STRATEGIES[name](_chunk_rng(seed, name, config, chunk, "strategy"))
+    target_seed = _chunk_rng(seed, name, config, chunk, "targets").getrandbits(64)
+    result = simulate(strategy, n_games, target_seed, min_number, max_number, max_attempts)
+    return name, config, result
+
+def make_tasks(strategy_names, configs, games_per_config, seed, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Split the tournament into (seed, strategy, config, chunk, n_games) tasks"""
+    tasks = []
+    for name in strategy_names:
+        for config in configs:
+            config = tuple(config)
+            for chunk, start in enumerate(range(0, games_per_config, chunk_size)):
+                n_games = min(chunk_size, games_per_config - start)
+                tasks.append((seed, name, config, chunk, n_games))
+    return tasks
+
+def run_tournament(strategy_names=None, configs=DEFAULT_CONFIGS, games_per_config=100_000,
+                   seed=0, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Play every strategy on every configuration
+
+    Args:
+        strategy_names (list): Keys of STRATEGIES, None for all
+        configs (list): (min_number, max_number, max_attempts) tuples
+        games_per_config (int): Games per strategy and configuration
+        seed (int): Tournament seed; same seed gives the same results
+        workers (int): Worker processes, None for one per core, 1 to stay in-process
+        chunk_size (int): Games per task sent to a worker
+
+    Returns:
+        dict: {strategy_name: {config: SimulationResult}}
+    """
+    if strategy_names is None:
+        strategy_names = list(STRATEGIES)
+
+    results = {name: {} for name in strategy_names}
+    for name in strategy_names:
+        for config in configs:
+            results[name][tuple(config)] = SimulationResult(config[2])
+
+    tasks = make_tasks(strategy_names, configs, games_per_config, seed, chunk_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        outcomes = map(_play_chunk, tasks)
+        for name, config, result in outcomes:
+            results[name][config].merge(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for name, config, result in executor.map(_play_chunk, tasks):
+                results[name][config].merge(result)
+
+    return results
+
+def rank_strategies(results):
+    """
+    Order strategies by mean win rate, then by mean attempts to win
+
+    Returns:
+        list: (name, mean_win_rate, mean_attempts) tuples, best first
+    """
+    ranking = []
+    for name, per_config in results.items():
+        count = len(per_config) or 1
+        win_rate = sum(r.win_rate for r in per_config.values()) / count
+        attempts = sum(r.average_attempts for r in per_config.values()) / count
+        ranking.append((name, win_rate, attempts))
+    ranking.sort(key=lambda row: (-row[1], row[2], row[0]))
+    return ranking
+
+def format_ranking(results):
+    """Format the ranked tournament report"""
+    configs = next(iter(results.values())).keys() if results else []
+    header = f"{'#':>2}  {'Strategy':<10} {'Win rate':>9} {'Attempts':>9}"
+    for min_number, max_number, max_attempts in configs:
+        header += f"  {f'{min_number}-{max_number}/{max_attempts}':>14}"
+    lines = [header, "-" * len(header)]
+
+    for place, (name, win_rate, attempts) in enumerate(rank_strategies(results), 1):
+        line = f"{place:>2}  {name:<10} {win_rate:>9.2%} {attempts:>9.3f}"
+        for result in results[name].values():
+            line += f"  {result.win_rate:>7.2%} {result.average_attempts:>6.2f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Guessing strategy tournament")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=None)
+    parser.add_argument("--games", type=int, default=100_000, help="games per strategy and range")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_tournament(args.strategies, DEFAULT_CONFIGS, args.games,
+                             args.seed, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    print(format_ranking(results))
+    print(f"\n{len(results) * len(DEFAULT_CONFIGS) * args.games} games in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""Terminal front-end for the Number Guessing Game
+
+A curses version of the Tk window for machines without a display, e.g.
+over SSH. It plays through the same GameEngine, hint engine, score store
+and replay log, and reads the same configuration file:
+
+    python tui.py                 # play in the terminal
+    python tui.py --ascii         # plain ASCII for terminals without emoji
+    python tui.py --seed 42       # replay the target numbers of a session
+
+Keys: digits and Enter to guess, h hint, a auto-play, n new game,
+r reset, PgUp/PgDn (or k/j) scroll the history, q quit.
+
+TerminalGame holds the game and renders it as a list of text rows.
+ScreenBuffer keeps the rows last drawn and hands out only the rows that
+changed, so a guess rewrites a handful of lines. curses then sends only
+the cells that differ. Nothing is redrawn without a key press (no clock,
+no animation), which keeps traffic minimal on slow links. tkinter is
+never imported, and curses only in main().
+"""
+
+import os
+import sys
+
+from game_config import GameConfig
+from utils import format_history_entry, validate_many, VALID
+from engine import GameEngine, CORRECT
+from hint_engine import HintEngine
+from score_store import ScoreStore
+from replay_log import ReplayLogWriter
+from history import GuessHistory
+from rng import RandomStreams
+from config_loader import ConfigWatcher
+
+# Longest guess that can be typed (validation rejects longer ones anyway)
+MAX_INPUT = 24
+
+# Rows above and below the history list
+HEADER_ROWS = 12
+FOOTER_ROWS = 1
+
+KEY_HELP = "Enter guess | h hint | a auto | n new | r reset | PgUp/PgDn history | q quit"
+
+def plain(text):
+    """ASCII version of a message (arrows kept, emoji dropped)"""
+    text = text.replace("→", "->").encode("ascii", "ignore").decode()
+    return " ".join(text.split())
+
+# === GAME ===
+
+class TerminalGame:
+    """Game state and screen layout of the terminal front-end (no curses)"""
+
+    def __init__(self, config, watcher=None, seed=None, ascii_only=False):
+        """
+        Args:
+            config (CompiledConfig): Settings to play with
+            watcher (ConfigWatcher): Reloads the settings between rounds, or None
+            seed (int): Root seed of the target numbers, None for config.random_seed
+            ascii_only (bool): Strip emoji and other non-ASCII text
+        """
+        self.config = config
+        self.watcher = watcher
+        self.ascii_only = ascii_only
+        self.random_streams = RandomStreams(config.random_seed if seed is None else seed)
+        self.engine = GameEngine(config.min_number, config.max_number, config.max_attempts,
+                                 rng=self.random_streams.stream("game"),
+                                 history=GuessHistory(config.history_capacity,
+                                                      config.history_spill_dir))
+        self.hint_engine = HintEngine(config.min_number, config.max_number, config.max_attempts)
+        self.score_store = ScoreStore(config.scores_db_path)
+        self.replay_log = ReplayLogWriter(config.replay_log_path)
+
+        self.input_text = ""
+        self.feedback = config.not_started
+        self.notice = ""
+        self.hint_lines = []
+        self.scroll = 0  # History rows scrolled up from the newest
+        self.running = True
+
+    @property
+    def best_score(self):
+        return self.score_store.best_score(self.config.player_name, self.config.difficulty)
+
+    # === ACTIONS ===
+
+    def new_game(self):
+        """Start a round, first switching to a changed config file"""
+        if self.watcher is not None:
+            config = self.watcher.poll()
+            if config is not None:
+                self.apply_config(config)
+
+        self.engine.new_game()
+        self.replay_log.begin_game(self.engine.min_number, self.engine.max_number,
+                                   self.engine.max_attempts, self.engine.target_number)
+        self.input_text = ""
+        self.feedback = self.config.welcome
+        self.notice = ""
+        self.hint_lines = []
+        self.scroll = 0
+
+    def apply_config(self, config):
+        """Switch to a reloaded configuration (between rounds)"""
+        previous, self.config = self.config, config
+        if not config.same_game(previous):
+            self.engine.configure(config.min_number, config.max_number, config.max_attempts)
+            self.hint_engine = HintEngine(config.min_number, config.max_number,
+                                          config.max_attempts)
+
+    def submit(self):
+        """Play the typed guess"""
+        engine = self.engine
+        text, self.input_text = self.input_text, ""
+        if not engine.game_active:
+            self.notice = "Start a new game first! (n)"
+            return
+
+        status, guess = next(validate_many((text,), engine.min_number, engine.max_number))
+        if status != VALID:
+            self.feedback = (self.config.invalid_messages[status], self.config.colors['error'])
+            return
+
+        feedback = engine.guess(guess)
+        self.replay_log.log_guess(guess, feedback)
+        self.feedback = self.config.feedback[feedback]
+        self.hint_lines = []
+        self.scroll = 0
+
+        if feedback == CORRECT:
+            self.replay_log.end_game(engine.target_number)
+            player, difficulty = self.config.player_name, self.config.difficulty
+            if self.score_store.record(player, difficulty, engine.attempts, won=True):
+                self.notice = f"New best score: {engine.attempts} attempts!"
+            else:
+                self.notice = (f"Great job! You found {engine.target_number} "
+                               f"in {engine.attempts} attempts!")
+        elif engine.lost:
+            self.replay_log.end_game(engine.target_number)
+            self.score_store.record(self.config.player_name, self.config.difficulty,
+                                    engine.attempts, won=False)
+            self.feedback = (self.config.game_over(engine.target_number),
+                             self.config.colors['error'])
+            self.notice = f"You've used all {engine.max_attempts} attempts. Press n to play again."
+
+    def hint(self):
+        """Show the hint for the current range"""
+        if not self.engine.game_active:
+            self.notice = "Start a new game first! (n)"
+            return
+        self.replay_log.log_hint()
+        hint = self.hint_engine.hint_for(self.engine)
+        self.hint_lines = self.hint_engine.format_hint(hint, self.config.hints).split("\n")
+
+    def auto_play(self):
+        """Play the suggested guess"""
+        if self.engine.game_active:
+            self.input_text = str(self.hint_engine.hint_for(self.engine).suggestion)
+            self.submit()
+
+    def reset(self):
+        """Stop the round without a result"""
+        self.engine.stop()
+        self.input_text = ""
+        self.feedback = self.config.not_started
+        self.notice = ""
+        self.hint_lines = []
+        self.scroll = 0
+
+    def type_char(self, char):
+        """Add a typed character to the guess"""
+        if len(self.input_text) < MAX_INPUT and (char.isdigit() or char in "+-_ "):
+            self.input_text += char
+
+    def backspace(self):
+        self.input_text = self.input_text[:-1]
+
+    def scroll_history(self, rows):
+        """Scroll the history up (rows > 0) or down towards the newest guess"""
+        history = self.engine.guess_history
+        self.scroll = min(max(0, self.scroll + rows), max(0, len(history) - 1))
+
+    def handle_key(self, key):
+        """
+        Apply one key press
+
+        Args:
+            key (str): Character typed, or one of "ENTER", "BACKSPACE",
+                "PGUP", "PGDN"
+        """
+        actions = {
+            "ENTER": self.submit, "BACKSPACE": self.backspace,
+            "PGUP": lambda: self.scroll_history(5), "PGDN": lambda: self.scroll_history(-5),
+            "k": lambda: self.scroll_history(1), "j": lambda: self.scroll_history(-1),
+            "h": self.hint, "a": self.auto_play, "n": self.new_game, "r": self.reset,
+            "q": self.quit,
+        }
+        action = actions.get(key)
+        if action is not None:
+            action()
+        elif len(key) == 1:
+            self.type_char(key)
+
+    def quit(self):
+        self.running = False
+
+    def close(self):
+        """Commit queued scores and replays"""
+        self.score_store.close()
+        self.replay_log.close()
+        self.engine.guess_history.close()
+
+    # === LAYOUT ===
+
+    def _color_style(self, color):
+        """Style name of a config color ("success", "error", ...)"""
+        for name, value in self.config.colors.items():
+            if value == color:
+                return name
+        return None
+
+    def render(self, height, width):
+        """
+        Screen contents
+
+        Args:
+            height (int): Terminal rows
+            width (int): Terminal columns
+
+        Returns:
+            tuple: (rows, cursor) where rows is a list of height
+                (text, style) pairs, style a config color name or None,
+                and cursor the (row, column) of the input cursor
+        """
+        config, engine = self.config, self.engine
+        text = plain if self.ascii_only else str
+        best = self.best_score
+        remaining = engine.max_attempts - engine.attempts
+        attempts_style = self._color_style(config.attempt_color(remaining))
+
+        prompt = "Your guess: "
+        hints = (self.hint_lines + ["", "", ""])[:3]
+        rows = [
+            (text("🎯 Number Guessing Game"), 'info'),
+            (text(config.range_text), 'info'),
+            (f"Attempts: {engine.attempts}/{engine.max_attempts}", attempts_style),
+            ("Best Score: Not set" if best is None else f"Best Score: {best} attempts",
+             'warning'),
+            ("", None),
+            (text(self.feedback[0]), self._color_style(self.feedback[1])),
+            (text(self.notice), 'info'),
+            (prompt + self.input_text, None),
+        ] + [(text(line), 'info') for line in hints]
+
+        history = engine.guess_history
+        list_rows = max(0, height - HEADER_ROWS - FOOTER_ROWS)
+        stop = len(history) - self.scroll
+        start = max(0, stop - list_rows)
+        rows.append(("History:" + (f" (scrolled {self.scroll} up)" if self.scroll else ""), None))
+        for index in range(start, stop):
+            guess, feedback = history[index]
+            number = history.first_index + index + 1
+            rows.append((text(format_history_entry(number, guess, feedback)), None))
+
+        rows = rows[:height - FOOTER_ROWS]
+        rows += [("", None)] * (height - FOOTER_ROWS - len(rows))
+        rows.append((KEY_HELP, None))
+        rows = [(line[:max(0, width - 1)], style) for line, style in rows[:height]]
+        return rows, (7, min(len(prompt) + len(self.input_text), max(0, width - 1)))
+
+# === SCREEN ===
+
+class ScreenBuffer:
+    """Rows last drawn; diff() yields only the rows that changed"""
+
+    def __init__(self):
+        self.rows = []
+
+    def diff(self, rows):
+        """
+        Args:
+            rows (list): (text, style) per screen row
+
+        Returns:
+            list: (row index, text, style) to draw, including rows to blank
+        """
+        changes = [(y, text, style) for y, (text, style) in enumerate(rows)
+                   if y >= len(self.rows) or self.rows[y] != (text, style)]
+        changes += [(y, "", None) for y in range(len(rows), len(self.rows))]
+        self.rows = list(rows)
+        return changes
+
+    def invalidate(self):
+        """Forget the screen contents (after a resize)"""
+        self.rows = []
+
+# Config color names -> curses colors
+CURSES_COLORS = {'success': 'COLOR_GREEN', 'error': 'COLOR_RED',
+                 'warning': 'COLOR_YELLOW', 'info': 'COLOR_CYAN'}
+
+KEY_NAMES = {'KEY_ENTER': "ENTER", '\n': "ENTER", '\r': "ENTER",
+             'KEY_BACKSPACE': "BACKSPACE", '\x7f': "BACKSPACE", '\b': "BACKSPACE",
+             'KEY_PPAGE': "PGUP", 'KEY_NPAGE': "PGDN",
+             'KEY_UP': "k", 'KEY_DOWN': "j"}
+
+def run(stdscr, game):
+    """
+    Input loop: draw, wait for a key, apply it
+
+    Args:
+        stdscr: curses window from curses.wrapper
+        game (TerminalGame): The game to play
+    """
+    import curses
+
+    styles = {}
+    if curses.has_colors():
+        curses.use_default_colors()
+        for pair, (name, color) in enumerate(CURSES_COLORS.items(), 1):
+            curses.init_pair(pair, getattr(curses, color), -1)
+            styles[name] = curses.color_pair(pair) | curses.A_BOLD
+
+    buffer = ScreenBuffer()
+    game.new_game()
+    while game.running:
+        height, width = stdscr.getmaxyx()
+        rows, (cursor_y, cursor_x) = game.render(height, width)
+        for y, text, style in buffer.diff(rows):
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+            if text:
+                stdscr.addstr(y, 0, text, styles.get(style, curses.A_NORMAL))
+        stdscr.move(cursor_y, cursor_x)
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+        try:
+            key = stdscr.get_wch()
+        except KeyboardInterrupt:
+            break
+        except curses.error:
+            continue
+        if key == curses.KEY_RESIZE:
+            stdscr.erase()
+            buffer.invalidate()
+            continue
+        key = curses.keyname(key).decode() if isinstance(key, int) else key
+        game.handle_key(KEY_NAMES.get(key, key))
+
+def main(argv=None):
+    """Command line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Number Guessing Game in the terminal")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="replay the target numbers of an earlier session")
+    parser.add_argument("--ascii", action="store_true",
+                        help="plain ASCII output for terminals without emoji")
+    parser.add_argument("--config", default=GameConfig.CONFIG_PATH,
+                        help="YAML/JSON settings file (reloaded between rounds)")
+    args = parser.parse_args(argv)
+
+    import curses
+
+    watcher = ConfigWatcher(args.config)
+    if watcher.error:
+        print(f"Using default settings: {watcher.error}", file=sys.stderr)
+    game = TerminalGame(watcher.config, watcher, seed=args.seed, ascii_only=args.ascii)
+
+    # Escape sequences arrive quickly even over SSH; don't stall on them
+    os.environ.setdefault("ESCDELAY", "25")
+    try:
+        curses.wrapper(run, game)
+    finally:
+        game.close()
+    print(f"Random seed {game.random_streams.seed}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,22 @@
 
 import random
 
-def generate_random_number(min_val, max_val):
+def generate_random_number(min_val, max_val, rng=None):
     """
     Generate random number within specified range
     
     Args:
         min_val (int): Minimum value (inclusive)
         max_val (int): Maximum value (inclusive)
+        rng (random.Random): Generator to draw from (see rng.RandomStreams),
+            None for the shared module-level generator
         
     Returns:
         int: Random number within range
     """
-    return random.randint(min_val, max_val)
+    if rng is None:
+        return random.randint(min_val, max_val)
+    return rng.randint(min_val, max_val)
 
 def format_history_entry(attempt_num, guess, feedback):
     """
@@ -36,6 +40,170 @@ def format_history_entry(attempt_num, guess, feedback):
     emoji = emoji_map.get(feedback, "❓")
     return f"#{attempt_num}: {guess} → {emoji} {feedback}"
 
+def difficulty_key(min_number, max_number, max_attempts):
+    """Difficulty label for a configuration, e.g. "1-100/10" """
+    return f"{min_number}-{max_number}/{max_attempts}"
+
+# Validation status codes (messages are only formatted when displayed)
+VALID = 0
+EMPTY = 1
+NOT_A_NUMBER = 2
+OUT_OF_RANGE = 3
+
+# Inputs longer than this skip the quick int() call (whitespace included)
+_QUICK_PARSE_LENGTH = 64
+
+def validation_message(status, min_val, max_val):
+    """
+    Error message for a validation status
+    
+    Args:
+        status (int): VALID, EMPTY, NOT_A_NUMBER or OUT_OF_RANGE
+        min_val (int): Minimum allowed value
+        max_val (int): Maximum allowed value
+        
+    Returns:
+        str: Message for the player ("" for VALID)
+    """
+    if status == VALID:
+        return ""
+    if status == EMPTY:
+        return "Please enter a number!"
+    if status == NOT_A_NUMBER:
+        return "Please enter a valid number!"
+    return f"Number must be between {min_val} and {max_val}!"
+
+def _parse_long(text, min_val, max_val):
+    """
+    Status of an input too long for a quick int() call
+    
+    int() is quadratic in the number of digits (and refuses more than
+    4300), so the magnitude is judged from the count of significant
+    digits; only numbers short enough to be in range are converted.
+    """
+    text = text.strip()
+    if not text:
+        return EMPTY, 0
+    body = text[1:] if text[0] in "+-" else text
+    # Like int(), single underscores are allowed between digits only
+    if "__" in body or body.startswith("_") or body.endswith("_"):
+        return NOT_A_NUMBER, 0
+    digits = body.replace("_", "")
+    if not digits.isdecimal():
+        return NOT_A_NUMBER, 0
+    significant = digits.lstrip("0")
+    if len(significant) > max(len(str(abs(min_val))), len(str(abs(max_val)))):
+        return OUT_OF_RANGE, 0
+    try:
+        number = int(significant or "0")
+    except ValueError:
+        return NOT_A_NUMBER, 0
+    return VALID, -number if text[0] == "-" else number
+
+def validate_many(texts, min_val, max_val):
+    """
+    Validate a stream of inputs
+    
+    Args:
+        texts (iterable): Input strings
+        min_val (int): Minimum allowed value
+        max_val (int): Maximum allowed value
+        
+    Yields:
+        tuple: (status, number) with a status code (VALID, EMPTY,
+               NOT_A_NUMBER or OUT_OF_RANGE); number is 0 when the input
+               is not a number or too large to convert
+    """
+    # Same rules as validate_number_input, inlined for throughput
+    for text in texts:
+        if len(text) > _QUICK_PARSE_LENGTH:
+            status, number = _parse_long(text, min_val, max_val)
+            if status != VALID:
+                yield status, number
+                continue
+        else:
+            try:
+                number = int(text)
+            except ValueError:
+                yield (NOT_A_NUMBER if text.strip() else EMPTY), 0
+                continue
+        if min_val <= number <= max_val:
+            yield VALID, number
+        else:
+            yield OUT_OF_RANGE, number
+
+def validate_array(texts, min_val, max_val):
+    """
+    NumPy-backed validate_many for large batches
+    
+    Args:
+        texts (sequence): Input strings (a list or a numpy str array)
+        min_val (int): Minimum allowed value (must fit in int64)
+        max_val (int): Maximum allowed value (must fit in int64)
+        
+    Returns:
+        tuple: (status, numbers) arrays of uint8 status codes and int64
+               numbers, with the same meaning as validate_many
+    """
+    import numpy as np
+    
+    # Over-long inputs would widen the fixed-size string array for every
+    # element, so they are set aside for validate_many
+    originals = texts
+    long_inputs = []
+    if not isinstance(texts, np.ndarray):
+        originals = list(texts)
+        if originals and max(map(len, originals)) > _QUICK_PARSE_LENGTH:
+            long_inputs = [index for index, text in enumerate(originals)
+                           if len(text) > _QUICK_PARSE_LENGTH]
+        texts = originals
+        if long_inputs:
+            texts = originals[:]
+            for index in long_inputs:
+                texts[index] = "_"
+    
+    text = np.char.strip(np.asarray(texts, dtype=str))
+    lengths = np.char.str_len(text)
+    body = np.char.lstrip(text, "+-")
+    body_lengths = np.char.str_len(body)
+    digits = np.char.lstrip(body, "0")
+    significant = np.char.str_len(digits)
+    bound_digits = max(len(str(abs(min_val))), len(str(abs(max_val))))
+    
+    # One optional sign, then decimal digits only
+    numeric = (lengths - body_lengths <= 1) & (body_lengths > 0) & np.char.isdecimal(body)
+    huge = numeric & (significant > bound_digits)
+    # Underscore separators and 19-digit numbers go through validate_many
+    slow = (np.char.find(text, "_") >= 0) | (numeric & ~huge & (significant > 18))
+    convert = numeric & ~huge & ~slow
+    
+    # Horner's rule over the code points of the (at most 18) digits
+    width = max(int(significant[convert].max(initial=0)), 1)
+    columns = digits[convert].astype(f"<U{width}")
+    codes = columns.view(np.uint32).reshape(len(columns), width)
+    ascii_digits = ~(codes > ord("9")).any(axis=1)
+    values = np.zeros(len(columns), dtype=np.int64)
+    for column in codes.T:
+        values = np.where(column != 0, values * 10 + (column.astype(np.int64) - ord("0")), values)
+    values[np.char.startswith(text[convert], "-")] *= -1
+    
+    status = np.full(text.shape, NOT_A_NUMBER, dtype=np.uint8)
+    status[lengths == 0] = EMPTY
+    status[huge] = OUT_OF_RANGE
+    numbers = np.zeros(text.shape, dtype=np.int64)
+    numbers[convert] = values
+    status[convert] = np.where((values >= min_val) & (values <= max_val), VALID, OUT_OF_RANGE)
+    
+    # Digits of other scripts are converted by int() like validate_many does
+    slow[np.flatnonzero(convert)[~ascii_digits]] = True
+    slow[long_inputs] = True
+    indexes = np.flatnonzero(slow)
+    slow_texts = [str(originals[index]) for index in indexes]
+    for index, (code, number) in zip(indexes, validate_many(slow_texts, min_val, max_val)):
+        status[index] = code
+        numbers[index] = number if -2**63 <= number < 2**63 else 0
+    return status, numbers
+
 def validate_number_input(text, min_val, max_val):
     """
     Validate numeric input within range
@@ -48,23 +216,89 @@ def validate_number_input(text, min_val, max_val):
     Returns:
         tuple: (is_valid: bool, number: int, error_message: str)
     """
-    # Handle empty input
-    if not text.strip():
-        return False, 0, "Please enter a number!"
+    if len(text) > _QUICK_PARSE_LENGTH:
+        status, number = _parse_long(text, min_val, max_val)
+    elif not text or text.isspace():
+        status, number = EMPTY, 0
+    else:
+        try:
+            number = int(text)
+            status = VALID
+        except ValueError:
+            status, number = NOT_A_NUMBER, 0
     
-    # Try to convert to integer
-    try:
-        number = int(text.strip())
-    except ValueError:
-        return False, 0, "Please enter a valid number!"
+    if status == VALID and not min_val <= number <= max_val:
+        status = OUT_OF_RANGE
+    return status == VALID, number, validation_message(status, min_val, max_val)
+
+class RangeTracker:
+    """
+    Feasible [lo, hi] interval for the target, updated one guess at a time
+
+    Each update is O(1), so a hint never has to rescan the guess history.
+    Feedback that contradicts earlier answers is rejected and flagged.
+    """
+    
+    # Server sessions hold one tracker each, so it carries no instance dict
+    __slots__ = ('min_val', 'max_val', 'lo', 'hi', 'contradicted')
+    
+    def __init__(self, min_val, max_val):
+        """
+        Args:
+            min_val (int): Smallest possible target (inclusive)
+            max_val (int): Largest possible target (inclusive)
+        """
+        self.min_val = min_val
+        self.max_val = max_val
+        self.reset()
     
-    # Check range
-    if number < min_val or number > max_val:
-        return False, number, f"Number must be between {min_val} and {max_val}!"
+    def reset(self):
+        """Forget all guesses and reopen the full range"""
+        self.lo = self.min_val
+        self.hi = self.max_val
+        self.contradicted = False
     
-    return True, number, ""
+    def update(self, guess, feedback):
+        """
+        Narrow the interval with one guess result
+        
+        Args:
+            guess (int): The number guessed
+            feedback (str): "Too High", "Too Low" or "Correct!"
+            
+        Returns:
+            bool: False if the feedback contradicts earlier answers
+                  (the interval is left unchanged in that case)
+        """
+        if feedback == "Too High":
+            if guess <= self.lo:
+                self.contradicted = True
+                return False
+            if guess <= self.hi:
+                self.hi = guess - 1
+        elif feedback == "Too Low":
+            if guess >= self.hi:
+                self.contradicted = True
+                return False
+            if guess >= self.lo:
+                self.lo = guess + 1
+        elif feedback == "Correct!":
+            if not self.lo <= guess <= self.hi:
+                self.contradicted = True
+                return False
+            self.lo = self.hi = guess
+        return True
+    
+    @property
+    def remaining(self):
+        """Number of candidates still consistent with every answer"""
+        return self.hi - self.lo + 1
+    
+    def midpoint(self):
+        """Middle of the remaining range"""
+        return (self.lo + self.hi) // 2
 
-def calculate_optimal_guess(guesses_history, min_val, max_val):
+def calculate_optimal_guess(guesses_history, min_val, max_val, tracker=None):
     """
     Calculate optimal next guess based on history (bonus feature)
     
@@ -72,10 +306,15 @@ def calculate_optimal_guess(guesses_history, min_val, max_val):
         guesses_history (list): List of (guess, feedback) tuples
         min_val (int): Current minimum possible value
         max_val (int): Current maximum possible value
+        tracker (RangeTracker): Tracker already fed with guesses_history;
+            when given the answer is O(1) instead of a history rescan
         
     Returns:
         int: Suggested optimal guess
     """
+    if tracker is not None:
+        return tracker.midpoint()
+    
     if not guesses_history:
         return (min_val + max_val) // 2
     
@@ -0,0 +1,207 @@
+"""Batched, diffed widget updates for the Tk window
+
+Every Tk configure, insert or delete is a round trip into the Tcl
+interpreter. The game used to issue several of them per guess, most of
+them re-sending values the widgets already showed. ViewModel records the
+desired state instead, and once per event-loop idle applies only what
+differs from the last applied state, with one configure call per widget.
+VirtualListView renders only the visible rows of a long history.
+
+UpdateStats counts the option updates requested by the game and the calls
+actually sent to Tcl, so the savings per guess can be checked. List redraws
+count the delete/insert/scrollbar calls they really make on both sides.
+"""
+
+_UNSET = object()
+
+class UpdateStats:
+    """Counters of widget calls requested vs. issued"""
+
+    __slots__ = ('requested', 'issued', 'flushes', 'guesses')
+
+    def __init__(self):
+        self.requested = 0
+        self.issued = 0
+        self.flushes = 0
+        self.guesses = 0
+
+    @property
+    def saved(self):
+        return self.requested - self.issued
+
+    @property
+    def saved_per_guess(self):
+        return self.saved / self.guesses if self.guesses else 0.0
+
+    def __str__(self):
+        return (f"{self.requested} widget calls requested, {self.issued} issued "
+                f"in {self.flushes} flushes ({self.saved_per_guess:.1f} saved per guess)")
+
+class ViewModel:
+    """Desired widget options, flushed to Tk once per idle"""
+
+    def __init__(self, root):
+        """
+        Args:
+            root: Tk root (anything with after_idle and after_cancel)
+        """
+        self.root = root
+        self.stats = UpdateStats()
+        self._applied = {}   # widget -> {option: value} as last sent to Tk
+        self._pending = {}   # widget -> {option: value} wanted at next flush
+        self._lists = []     # ListViews with pending changes
+        self._scheduled = None
+
+    def track(self, widget, *options):
+        """Remember the current value of options set when the widget was created"""
+        applied = self._applied.setdefault(widget, {})
+        for option in options:
+            applied[option] = widget.cget(option)
+
+    def set(self, widget, **options):
+        """
+        Request new option values (applied at the next idle)
+
+        Args:
+            widget: Tk widget
+            **options: Options as for widget.config
+        """
+        self.stats.requested += 1
+        self._pending.setdefault(widget, {}).update(options)
+        self._schedule()
+
+    def list_view(self, listbox, scrollbar, rows, count, row_text):
+        """Create a VirtualListView flushed by this view model"""
+        return VirtualListView(self, listbox, scrollbar, rows, count, row_text)
+
+    def invalidate(self, list_view):
+        """Queue a list view for redrawing at the next flush"""
+        if list_view not in self._lists:
+            self._lists.append(list_view)
+        self._schedule()
+
+    def _schedule(self):
+        if self._scheduled is None:
+            self._scheduled = self.root.after_idle(self.flush)
+
+    def flush(self):
+        """Apply all pending changes now"""
+        if self._scheduled is not None:
+            self.root.after_cancel(self._scheduled)
+            self._scheduled = None
+
+        pending, self._pending = self._pending, {}
+        for widget, options in pending.items():
+            applied = self._applied.setdefault(widget, {})
+            changed = {option: value for option, value in options.items()
+                       if applied.get(option, _UNSET) != value}
+            if changed:
+                widget.configure(**changed)
+                applied.update(changed)
+                self.stats.issued += 1
+
+        lists, self._lists = self._lists, []
+        for list_view in lists:
+            calls = list_view.apply()
+            self.stats.requested += calls
+            self.stats.issued += calls
+        self.stats.flushes += 1
+
+    def cancel(self):
+        """Drop pending changes (e.g. when the window closes)"""
+        if self._scheduled is not None:
+            self.root.after_cancel(self._scheduled)
+            self._scheduled = None
+        self._pending.clear()
+        self._lists.clear()
+
+class VirtualListView:
+    """
+    Listbox showing a window of a long sequence
+
+    The Listbox holds only the visible rows; the scrollbar is driven by
+    the row count of the source, and scrolling re-renders the window. A
+    history of 100k entries costs the same few Tk calls per redraw as a
+    history of ten. While scrolled to the bottom the view follows new
+    rows.
+    """
+
+    def __init__(self, view, listbox, scrollbar, rows, count, row_text):
+        """
+        Args:
+            view (ViewModel): Batches the redraws
+            listbox: Tk Listbox (height of rows lines)
+            scrollbar: Tk Scrollbar controlling the window
+            rows (int): Visible rows
+            count (callable): Returns the number of rows in the source
+            row_text (callable): Returns the text of row index
+        """
+        self.view = view
+        self.listbox = listbox
+        self.scrollbar = scrollbar
+        self.rows = rows
+        self.count = count
+        self.row_text = row_text
+        self.top = 0
+        self.follow = True
+        self._shown = None
+
+        scrollbar.configure(command=self.on_scroll)
+        listbox.bind("<MouseWheel>", self.on_wheel)
+        listbox.bind("<Button-4>", lambda event: self.scroll_by(-1))
+        listbox.bind("<Button-5>", lambda event: self.scroll_by(1))
+
+    def refresh(self):
+        """Redraw at the next idle (call after the source changed)"""
+        self.view.invalidate(self)
+
+    def scroll_to(self, top):
+        """Show rows from index top"""
+        last_top = max(0, self.count() - self.rows)
+        self.top = min(max(0, top), last_top)
+        self.follow = self.top >= last_top
+        self.view.invalidate(self)
+
+    def scroll_by(self, rows):
+        self.scroll_to(self.top + rows)
+
+    def on_scroll(self, action, amount, unit=None):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.count()))
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def on_wheel(self, event):
+        self.scroll_by(-1 if event.delta > 0 else 1)
+        return "break"
+
+    def apply(self):
+        """
+        Render the visible window if it changed
+
+        Returns:
+            int: Number of Tk calls issued
+        """
+        count = self.count()
+        if self.follow or self.top > max(0, count - self.rows):
+            self.top = max(0, count - self.rows)
+        stop = min(count, self.top + self.rows)
+        shown = [self.row_text(index) for index in range(self.top, stop)]
+        if shown == self._shown:
+            return 0
+
+        calls = 0
+        if self._shown:
+            self.listbox.delete(0, "end")
+            calls += 1
+        if shown:
+            self.listbox.insert("end", *shown)
+            calls += 1
+        if count:
+            self.scrollbar.set(self.top / count, stop / count)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self._shown = shown
+        return calls + 1